@@ -0,0 +1,47 @@
+# Benchmarks of calendarium hot paths, using pytest-benchmark.
+#
+# Sizes are taken from CALENDARIUM_BENCH_SIZES (comma separated, default 1000), e.g.:
+#
+#   CALENDARIUM_BENCH_SIZES=1000,100000,10000000 pytest benchmarks
+#
+# Store a baseline, then compare against it and fail on a slowdown:
+#
+#   pytest benchmarks --benchmark-autosave
+#   pytest benchmarks --benchmark-compare --benchmark-compare-fail=mean:15%
+
+import datetime
+import os
+import random
+
+import pytest
+
+from calendarium.month import Month
+
+try:
+    import pytest_benchmark  # noqa: F401
+except ImportError:
+    collect_ignore_glob = ['test_*.py']
+
+
+def bench_sizes() -> list[int]:
+    sizes = os.environ.get('CALENDARIUM_BENCH_SIZES', '1000')
+    return [int(float(size)) for size in sizes.split(',')]
+
+
+def pytest_generate_tests(metafunc):
+    if 'size' in metafunc.fixturenames:
+        metafunc.parametrize('size', bench_sizes(), ids=lambda size: f'{size:.0e}')
+
+
+@pytest.fixture
+def months(size: int) -> list[Month]:
+    # deterministic, shuffled months from 1900-01 to 2099-12
+    rng = random.Random(size)
+    return [Month.from_ord(rng.randrange(-840, 1560)) for _ in range(size)]
+
+
+@pytest.fixture
+def dates(size: int) -> list[datetime.date]:
+    rng = random.Random(size)
+    first, last = datetime.date(1900, 1, 1).toordinal(), datetime.date(2099, 12, 31).toordinal()
+    return [datetime.date.fromordinal(rng.randint(first, last)) for _ in range(size)]
@@ -0,0 +1,74 @@
+from calendarium.month import Month
+from calendarium.month import MonthDelta
+
+
+def test_init(benchmark, months):
+    pairs = [(month.year, month.month) for month in months]
+    benchmark(lambda: [Month(year, month) for year, month in pairs])
+
+
+def test_of(benchmark, months):
+    pairs = [(month.year, month.month) for month in months]
+    benchmark(lambda: [Month.of(year, month) for year, month in pairs])
+
+
+def test_from_ord(benchmark, months):
+    ords = [month.ord() for month in months]
+    benchmark(lambda: [Month.from_ord(ord_) for ord_ in ords])
+
+
+def test_for_date(benchmark, dates):
+    benchmark(lambda: [Month.for_date(date) for date in dates])
+
+
+def test_ord(benchmark, months):
+    benchmark(lambda: [month.ord() for month in months])
+
+
+def test_hash_dict(benchmark, months):
+    benchmark(lambda: dict.fromkeys(months))
+
+
+def test_hash_set(benchmark, months):
+    benchmark(lambda: set(months))
+
+
+def test_sort(benchmark, months):
+    benchmark(sorted, months)
+
+
+def test_add_monthdelta(benchmark, months):
+    delta = MonthDelta(13)
+    benchmark(lambda: [month + delta for month in months])
+
+
+def test_sub_month(benchmark, months):
+    base = Month(2000, 1)
+    benchmark(lambda: [month - base for month in months])
+
+
+def test_len(benchmark, months):
+    benchmark(lambda: [len(month) for month in months])
+
+
+def test_parse(benchmark, months):
+    strings = [str(month) for month in months]
+    benchmark(lambda: [Month.parse(string) for string in strings])
+
+
+def test_parse_custom_format(benchmark, months):
+    strings = [format(month, '%b %Y') for month in months]
+    benchmark(lambda: [Month.parse(string, '%b %Y') for string in strings])
+
+
+def test_parse_many(benchmark, months):
+    strings = [str(month) for month in months]
+    benchmark(Month.parse_many, strings, as_ords=True)
+
+
+def test_str(benchmark, months):
+    benchmark(lambda: [str(month) for month in months])
+
+
+def test_format_many(benchmark, months):
+    benchmark(Month.format_many, months, '%b %Y')
@@ -0,0 +1,37 @@
+import datetime
+
+from calendarium.date_range import DateRange
+from calendarium.date_range import expand_ranges
+from calendarium.month import Month
+from calendarium.month_range import MonthRange
+
+
+def test_date_range_iter(benchmark, size):
+    start = datetime.date(2000, 1, 1)
+    date_range = DateRange(start, start + datetime.timedelta(days=size))
+    benchmark(lambda: sum(1 for _ in date_range))
+
+
+def test_date_range_contains(benchmark, dates):
+    date_range = DateRange(datetime.date(1950, 1, 1), datetime.date(2050, 1, 1))
+    benchmark(lambda: sum(date in date_range for date in dates))
+
+
+def test_month_iter(benchmark, months):
+    benchmark(lambda: sum(1 for month in months for _ in month))
+
+
+def test_month_range_iter(benchmark, size):
+    start = Month(1, 1)
+    month_range = MonthRange(start, start.from_ord(start.ord() + min(size, 119_988)))
+    benchmark(lambda: sum(1 for _ in month_range))
+
+
+def test_date_range_to_numpy(benchmark, size):
+    start = datetime.date(2000, 1, 1)
+    date_range = DateRange(start, start + datetime.timedelta(days=size))
+    benchmark(date_range.to_numpy)
+
+
+def test_expand_months(benchmark, months):
+    benchmark(expand_ranges, months)
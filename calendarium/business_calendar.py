@@ -0,0 +1,148 @@
+from array import array
+from bisect import bisect_left
+from bisect import bisect_right
+import datetime
+from typing import Iterable, Sequence, Union
+
+from calendarium.month import Month
+
+WEEKDAY_NAMES = ('Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun')
+
+
+def _parse_weekmask(weekmask: Union[str, Sequence[bool]]) -> tuple[bool, ...]:
+    # '1111100', 'Mon Tue Wed Thu Fri' or seven booleans (Monday first)
+    if isinstance(weekmask, str):
+        if len(weekmask) == 7 and set(weekmask) <= {'0', '1'}:
+            return tuple(char == '1' for char in weekmask)
+
+        names = weekmask.split()
+        unknown = [name for name in names if name not in WEEKDAY_NAMES]
+        if unknown:
+            raise ValueError(f"invalid weekmask {weekmask!r}")
+        return tuple(name in names for name in WEEKDAY_NAMES)
+
+    mask = tuple(bool(day) for day in weekmask)
+    if len(mask) != 7:
+        raise ValueError("weekmask must have 7 days")
+    return mask
+
+
+class BusinessCalendar:
+    # Business days are counted arithmetically: whole weeks times the number of working weekdays,
+    # plus a prefix table for the partial week, minus holidays found by bisection. All counts work
+    # on `date.toordinal()` values; ordinal 1 (0001-01-01) is a Monday.
+
+    def __init__(
+        self,
+        weekmask: Union[str, Sequence[bool]] = '1111100',
+        holidays: Iterable[datetime.date] = ()
+    ):
+        self.weekmask = _parse_weekmask(weekmask)
+        self.days_per_week = sum(self.weekmask)
+        if not self.days_per_week:
+            raise ValueError("weekmask must contain at least one business day")
+
+        # working weekdays before given weekday
+        self._week_prefix = [sum(self.weekmask[:weekday]) for weekday in range(8)]
+        # weekday of n-th working day within a week
+        self._nth_weekday = [weekday for weekday in range(7) if self.weekmask[weekday]]
+
+        # only holidays on working weekdays matter
+        self._holidays = array('i', sorted({
+            date.toordinal()
+            for date in holidays
+            if self.weekmask[date.weekday()]
+        }))
+        # holiday i falls before the n-th business day exactly when its key is <= n
+        # (keys = working weekdays before holiday i, minus i; nondecreasing)
+        self._holiday_keys = array('i', [
+            self._weekdays_before(ord_) - index for index, ord_ in enumerate(self._holidays)
+        ])
+
+        # Month.ord() -> bitmap of business days (bit 0 = 1st day of month)
+        self._month_bitmaps = {}
+
+    @property
+    def holidays(self) -> list[datetime.date]:
+        return [datetime.date.fromordinal(ord_) for ord_ in self._holidays]
+
+    def __repr__(self) -> str:
+        weekmask = ''.join('1' if day else '0' for day in self.weekmask)
+        return f'{type(self).__name__}({weekmask!r}, holidays={self.holidays!r})'
+
+    def _weekdays_before(self, ord_: int) -> int:
+        # working weekdays in [ordinal 1, ord_)
+        weeks, weekday = divmod(ord_ - 1, 7)
+        return weeks * self.days_per_week + self._week_prefix[weekday]
+
+    def _business_days_before(self, ord_: int) -> int:
+        return self._weekdays_before(ord_) - bisect_left(self._holidays, ord_)
+
+    def _nth_weekday_ord(self, n: int) -> int:
+        # ordinal of n-th (0-based) working weekday since ordinal 1
+        weeks, nth = divmod(n, self.days_per_week)
+        return 1 + weeks * 7 + self._nth_weekday[nth]
+
+    def _nth_business_day_ord(self, n: int) -> int:
+        # ordinal of n-th (0-based) business day since ordinal 1:
+        # n-th working weekday after skipping the holidays before it
+        return self._nth_weekday_ord(n + bisect_right(self._holiday_keys, n))
+
+    def _is_business_ord(self, ord_: int) -> bool:
+        if not self.weekmask[(ord_ - 1) % 7]:
+            return False
+
+        index = bisect_left(self._holidays, ord_)
+        return index == len(self._holidays) or self._holidays[index] != ord_
+
+    def is_business_day(self, date: datetime.date) -> bool:
+        return self._is_business_ord(date.toordinal())
+
+    def business_days_between(self, start: datetime.date, end: datetime.date) -> int:
+        # business days in [start, end); swapping the arguments negates the result
+        return self._business_days_before(end.toordinal()) - self._business_days_before(start.toordinal())
+
+    def business_days(self, month: Month) -> int:
+        start_ord = month.start_date.toordinal()
+        return self._business_days_before(start_ord + month.days()) - self._business_days_before(start_ord)
+
+    def month_bitmap(self, month: Month) -> int:
+        # bit (day - 1) is set for each business day of the month
+        bitmap = self._month_bitmaps.get(month.ord())
+        if bitmap is None:
+            start_ord = month.start_date.toordinal()
+            bitmap = 0
+            for day in range(month.days()):
+                if self._is_business_ord(start_ord + day):
+                    bitmap |= 1 << day
+            self._month_bitmaps[month.ord()] = bitmap
+
+        return bitmap
+
+    def add_business_days(self, date: datetime.date, days: int) -> datetime.date:
+        # dates that are not business days are first rolled forward (days >= 0) or backward (days < 0)
+        ord_ = date.toordinal()
+        count = self._business_days_before(ord_)
+        if days < 0 and not self._is_business_ord(ord_):
+            # `count` is the index of the following business day, roll back to the preceding one
+            days -= 1
+
+        return datetime.date.fromordinal(self._nth_business_day_ord(count + days))
+
+    def is_business_day_many(self, dates: Iterable[datetime.date]) -> list[bool]:
+        return [self._is_business_ord(date.toordinal()) for date in dates]
+
+    def business_days_between_many(
+        self,
+        starts: Iterable[datetime.date],
+        ends: Iterable[datetime.date]
+    ) -> list[int]:
+        before = self._business_days_before
+        return [before(end.toordinal()) - before(start.toordinal()) for start, end in zip(starts, ends)]
+
+    def add_business_days_many(
+        self,
+        dates: Iterable[datetime.date],
+        days: Iterable[int]
+    ) -> list[datetime.date]:
+        return [self.add_business_days(date, n) for date, n in zip(dates, days)]
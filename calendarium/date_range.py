@@ -1,15 +1,248 @@
 import datetime
-from typing import Iterator
+import math
+from typing import Iterable, Iterator, Optional, Union
+
+# `date.toordinal()` of 1970-01-01, the epoch of numpy's datetime64
+DATETIME64_EPOCH_ORD = datetime.date(1970, 1, 1).toordinal()
+
+
+def tighten_range(ords: range) -> range:
+    # same items, with stop as close as possible
+    if ords:
+        return range(ords[0], ords[-1] + (1 if ords.step > 0 else -1), ords.step)
+
+    return range(ords.start, ords.start, ords.step)
+
+
+def ascending_range(ords: range) -> range:
+    return ords if ords.step > 0 else ords[::-1]
+
+
+def intersect_ranges(a: range, b: range) -> range:
+    # common items of two ranges, in ascending order
+    a, b = ascending_range(a), ascending_range(b)
+    if not a or not b:
+        return range(a.start, a.start)
+
+    low, high = max(a[0], b[0]), min(a[-1], b[-1]) + 1
+
+    # first common item: x = a[0] (mod a.step) and x = b[0] (mod b.step)
+    gcd = math.gcd(a.step, b.step)
+    if (b[0] - a[0]) % gcd:
+        return range(low, low)
+
+    lcm = a.step // gcd * b.step
+    inverse = pow(a.step // gcd, -1, b.step // gcd)
+    common = a[0] + a.step * ((b[0] - a[0]) // gcd * inverse % (b.step // gcd))
+    first = low + (common - low) % lcm
+
+    return tighten_range(range(first, max(first, high), lcm))
+
+
+def unite_ranges(a: range, b: range) -> Optional[range]:
+    # all items of two ranges in ascending order, or None if that's not a range
+    a, b = ascending_range(a), ascending_range(b)
+    if not b:
+        return tighten_range(a)
+    if not a:
+        return tighten_range(b)
+
+    # the union is a range only if it is the range from its first to its last item
+    # with as many items as the union has, and both ranges are contained in it
+    first, last = min(a[0], b[0]), max(a[-1], b[-1])
+    count = len(a) + len(b) - len(intersect_ranges(a, b))
+    if count == 1:
+        return range(first, first + 1)
+
+    step, remainder = divmod(last - first, count - 1)
+    if remainder:
+        return None
+
+    union = range(first, last + 1, step)
+    for part in (a, b):
+        if part[0] not in union or (len(part) > 1 and part.step % step):
+            return None
+
+    return union
 
 
 class DateRange:
-    # TODO: implement properly
-    def __init__(self, rangelike):
-        self.start_date = rangelike.start_date
-        self.end_date = rangelike.end_date
+    # sequence of dates like `range`, computed arithmetically over `date.toordinal()`
+
+    __slots__ = ('_ords',)
+
+    def __init__(
+        self,
+        start,
+        stop: Union[datetime.date, datetime.timedelta, None] = None,
+        step: Union[int, datetime.timedelta] = 1
+    ):
+        # stop may also be given as span from start, e.g. `DateRange(a, b - a)`
+        if stop is None:
+            if isinstance(start, DateRange):
+                self._ords = start._ords
+                return
+
+            # rangelike, e.g. Month; its length also covers the last day of 9999-12,
+            # which its (clamped) end_date excludes
+            start_ord = start.start_date.toordinal()
+            stop_ord = start_ord + len(start)
+        elif isinstance(stop, datetime.timedelta):
+            if stop % datetime.timedelta(days=1):
+                raise ValueError("stop must be a whole number of days")
+            start_ord = start.toordinal()
+            stop_ord = start_ord + stop.days
+        else:
+            start_ord, stop_ord = start.toordinal(), stop.toordinal()
+
+        # exclusive stop may be just outside the calendar, e.g. after 9999-12-31 or before 0001-01-01
+        if not 0 <= stop_ord <= datetime.date.max.toordinal() + 1:
+            raise ValueError("stop is out of range")
+
+        if isinstance(step, datetime.timedelta):
+            if step % datetime.timedelta(days=1):
+                raise ValueError("step must be a whole number of days")
+            step = step.days
+
+        if not step:
+            raise ValueError("step must not be zero")
+
+        self._ords = range(start_ord, stop_ord, int(step))
+
+    @classmethod
+    def _from_ords(cls, ords: range) -> 'DateRange':
+        date_range = cls.__new__(cls)
+        # normalize the stop so that end_date is the closest possible
+        date_range._ords = tighten_range(ords)
+        return date_range
+
+    @property
+    def start_date(self) -> datetime.date:
+        return datetime.date.fromordinal(self._ords.start)
+
+    @property
+    def end_date(self) -> datetime.date:
+        # raises for a stop just outside the calendar, use `span` instead
+        if not 1 <= self._ords.stop <= datetime.date.max.toordinal():
+            raise ValueError("end date is out of range")
+        return datetime.date.fromordinal(self._ords.stop)
+
+    @property
+    def span(self) -> datetime.timedelta:
+        # end_date - start_date, also for a stop outside the calendar
+        return datetime.timedelta(days=self._ords.stop - self._ords.start)
+
+    @property
+    def step(self) -> int:
+        return self._ords.step
+
+    def __repr__(self) -> str:
+        if 1 <= self._ords.stop <= datetime.date.max.toordinal():
+            stop_repr = repr(self.end_date)
+        else:
+            # stop just outside the calendar can't be a date -> span from start
+            stop_repr = repr(self.span)
+        step_repr = f', {self.step!r}' if self.step != 1 else ''
+        return f'{type(self).__name__}({self.start_date!r}, {stop_repr}{step_repr})'
+
+    def __len__(self) -> int:
+        return len(self._ords)
+
+    def __bool__(self) -> bool:
+        return bool(self._ords)
 
     def __iter__(self) -> Iterator[datetime.date]:
-        date = self.start_date
-        while date < self.end_date:
-            yield date
-            date += datetime.timedelta(days=1)
+        return map(datetime.date.fromordinal, self._ords)
+
+    def __reversed__(self) -> Iterator[datetime.date]:
+        return map(datetime.date.fromordinal, reversed(self._ords))
+
+    def iter_chunks(self, size: int, as_numpy: bool = False) -> Iterator:
+        # consecutive chunks of at most `size` dates, as lists or datetime64[D] arrays
+        if size < 1:
+            raise ValueError("size must be positive")
+
+        for index in range(0, len(self._ords), size):
+            chunk = self[index:index + size]
+            yield chunk.to_numpy() if as_numpy else list(chunk)
+
+    def to_numpy(self):
+        import numpy as np
+
+        ords = np.arange(self._ords.start, self._ords.stop, self._ords.step, dtype=np.int64)
+        return (ords - DATETIME64_EPOCH_ORD).astype('datetime64[D]')
+
+    def __contains__(self, date) -> bool:
+        if isinstance(date, datetime.date):
+            return date.toordinal() in self._ords
+
+        return False
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self._from_ords(self._ords[index])
+
+        return datetime.date.fromordinal(self._ords[index])
+
+    def index(self, date: datetime.date) -> int:
+        if date not in self:
+            raise ValueError(f"{date!r} is not in range")
+
+        return self._ords.index(date.toordinal())
+
+    def count(self, date: datetime.date) -> int:
+        return int(date in self)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, DateRange):
+            # same as `range`: equal when they produce the same dates
+            return self._ords == other._ords
+
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash((type(self).__name__, self._ords))
+
+    def intersection(self, other: 'DateRange') -> 'DateRange':
+        # result is always ascending
+        return self._from_ords(intersect_ranges(self._ords, other._ords))
+
+    def __and__(self, other):
+        if isinstance(other, DateRange):
+            return self.intersection(other)
+
+        return NotImplemented
+
+    def union(self, other: 'DateRange') -> 'DateRange':
+        # result is always ascending; must be representable as a single range
+        ords = unite_ranges(self._ords, other._ords)
+        if ords is None:
+            raise ValueError("union of date ranges is not a date range")
+
+        return self._from_ords(ords)
+
+    def __or__(self, other):
+        if isinstance(other, DateRange):
+            return self.union(other)
+
+        return NotImplemented
+
+
+def expand_ranges(rangelikes: Iterable) -> tuple:
+    # dates of many ranges (or Months etc.) at once, as one flat datetime64[D] array
+    # -> (dates, offsets), where dates of i-th range are `dates[offsets[i]:offsets[i + 1]]`
+    import numpy as np
+
+    ranges = [DateRange(rangelike)._ords for rangelike in rangelikes]
+    lengths = np.fromiter((len(r) for r in ranges), dtype=np.int64, count=len(ranges))
+    starts = np.fromiter((r.start for r in ranges), dtype=np.int64, count=len(ranges))
+    steps = np.fromiter((r.step for r in ranges), dtype=np.int64, count=len(ranges))
+
+    offsets = np.zeros(len(ranges) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+
+    # position of each date within its own range
+    positions = np.arange(offsets[-1], dtype=np.int64) - np.repeat(offsets[:-1], lengths)
+    ords = np.repeat(starts - DATETIME64_EPOCH_ORD, lengths) + positions * np.repeat(steps, lengths)
+
+    return ords.astype('datetime64[D]'), offsets
@@ -0,0 +1,191 @@
+from array import array
+import datetime
+import functools
+from typing import Iterable, Optional
+
+from calendarium.date_range import DATETIME64_EPOCH_ORD
+from calendarium.month import MAX_DATE_ORDINAL
+from calendarium.month import days_in_month
+from calendarium.month import Month
+
+# weeks in the periods of each quarter of a week-based (retail) fiscal year
+PERIOD_PATTERNS = ('4-4-5', '4-5-4', '5-4-4')
+
+
+@functools.lru_cache(maxsize=None)
+def _fiscal_year_ends(end_month: int, end_weekday: int, nearest: bool) -> array:
+    # `date.toordinal()` of the last day of week-based fiscal years 1..9999 (at index year - 1):
+    # the last `end_weekday` of `end_month`, or the one nearest to the end of `end_month`
+    ends = array('i')
+    for year in range(datetime.MINYEAR, datetime.MAXYEAR + 1):
+        last_day = Month(year, end_month).start_ordinal() + days_in_month(year, end_month) - 1
+        # ordinal 1 (0001-01-01) is a Monday
+        if nearest:
+            ends.append(last_day + (end_weekday - (last_day - 1) + 3) % 7 - 3)
+        else:
+            ends.append(last_day - ((last_day - 1) - end_weekday) % 7)
+    return ends
+
+
+class FiscalCalendar:
+    # Maps months and dates to (fiscal year, quarter, period) and back, using lookup tables:
+    # - month-based (pattern None): period is the month of the fiscal year starting with `start_month`
+    # - week-based ('4-4-5', '4-5-4', '5-4-4'): fiscal year of 52 or 53 weeks ends on the last
+    #   `end_weekday` (Monday is 0) of the month before `start_month`, or on the one nearest to its end;
+    #   a 53rd week belongs to the last period
+    # Fiscal years are named by the calendar year in which they end.
+
+    def __init__(
+        self,
+        start_month: int = 1,
+        pattern: Optional[str] = None,
+        end_weekday: int = 5,
+        nearest: bool = False
+    ):
+        if start_month not in range(1, 13):
+            raise ValueError("start_month must be in 1..12")
+        if pattern is not None and pattern not in PERIOD_PATTERNS:
+            raise ValueError(f"unknown period pattern {pattern!r}")
+        if end_weekday not in range(7):
+            raise ValueError("end_weekday must be in 0..6")
+
+        self.start_month = start_month
+        self.pattern = pattern
+        self.end_weekday = end_weekday
+        self.nearest = nearest
+
+        # month of year - 1 -> fiscal year offset and period
+        self._month_year_offsets = array('b', [
+            int(start_month != 1 and month >= start_month) for month in range(1, 13)
+        ])
+        self._month_periods = array('b', [(month - start_month) % 12 + 1 for month in range(1, 13)])
+
+        if pattern is not None:
+            weeks = [int(count) for count in pattern.split('-')] * 4
+            # week of fiscal year -> period, start week of each period
+            self._week_periods = array('b', [
+                period for period, count in enumerate(weeks, start=1) for _ in range(count)
+            ] + [12])
+            self._period_start_weeks = array('b', [sum(weeks[:period]) for period in range(12)])
+            self._year_ends = _fiscal_year_ends((start_month - 2) % 12 + 1, end_weekday, nearest)
+
+    def __repr__(self) -> str:
+        args = [repr(self.start_month)]
+        if self.pattern is not None:
+            args += [repr(self.pattern), f'end_weekday={self.end_weekday!r}', f'nearest={self.nearest!r}']
+        return f'{type(self).__name__}({", ".join(args)})'
+
+    def for_month(self, month: Month) -> tuple[int, int, int]:
+        if self.pattern is not None:
+            raise ValueError("months do not map to periods of a week-based fiscal calendar")
+
+        period = self._month_periods[month.month - 1]
+        return month.year + self._month_year_offsets[month.month - 1], (period + 2) // 3, period
+
+    def for_date(self, date: datetime.date) -> tuple[int, int, int]:
+        if self.pattern is None:
+            period = self._month_periods[date.month - 1]
+            return date.year + self._month_year_offsets[date.month - 1], (period + 2) // 3, period
+
+        ord_ = date.toordinal()
+        ends = self._year_ends
+        year = date.year
+        if year > 1 and ord_ <= ends[year - 2]:
+            year -= 1
+        elif ord_ > ends[year - 1]:
+            year += 1
+        if not 1 < year <= datetime.MAXYEAR:
+            raise ValueError(f"{date!r} is out of range of the fiscal calendar")
+
+        period = self._week_periods[(ord_ - ends[year - 2] - 1) // 7]
+        return year, (period + 2) // 3, period
+
+    def _check_period(self, year: int, period: int) -> None:
+        if period not in range(1, 13):
+            raise ValueError("period must be in 1..12")
+        # the start of week-based fiscal year 1 is unknown; months check their own range
+        if self.pattern is not None and not datetime.MINYEAR < year <= datetime.MAXYEAR:
+            raise ValueError(f"fiscal year {year} is out of range")
+
+    def period_month(self, year: int, period: int) -> Month:
+        if self.pattern is not None:
+            raise ValueError("periods of a week-based fiscal calendar are not months")
+        self._check_period(year, period)
+
+        month = (self.start_month + period - 2) % 12 + 1
+        return Month(year - self._month_year_offsets[month - 1], month)
+
+    def period_start(self, year: int, period: int) -> datetime.date:
+        if self.pattern is None:
+            return self.period_month(year, period).start_date
+
+        self._check_period(year, period)
+        return datetime.date.fromordinal(self._year_ends[year - 2] + 1 + 7 * self._period_start_weeks[period - 1])
+
+    def period_end(self, year: int, period: int) -> datetime.date:
+        # exclusive, same as `Month.end_date` (and clamped the same way in 9999)
+        if self.pattern is None:
+            return self.period_month(year, period).end_date
+
+        self._check_period(year, period)
+        if period == 12:
+            end_ord = self._year_ends[year - 1] + 1
+        else:
+            end_ord = self._year_ends[year - 2] + 1 + 7 * self._period_start_weeks[period]
+        return datetime.date.fromordinal(min(end_ord, MAX_DATE_ORDINAL))
+
+    def year_start(self, year: int) -> datetime.date:
+        return self.period_start(year, 1)
+
+    def year_end(self, year: int) -> datetime.date:
+        return self.period_end(year, 12)
+
+    def for_months(self, months: Iterable[Month]):
+        # columnar (fiscal years, quarters, periods):
+        # numpy integer array of `Month.ord()` -> ndarrays, other iterables of months -> arrays ('i')
+        if hasattr(months, 'dtype'):
+            if self.pattern is not None:
+                raise ValueError("months do not map to periods of a week-based fiscal calendar")
+
+            import numpy as np
+
+            # Month.EPOCH starts a year
+            years, months_of_year = np.divmod(np.asarray(months, dtype=np.int64), 12)
+            periods = np.frombuffer(self._month_periods, dtype=np.int8)[months_of_year].astype(np.int64)
+            offsets = np.frombuffer(self._month_year_offsets, dtype=np.int8)[months_of_year]
+            return years + Month.EPOCH_Y + offsets, (periods + 2) // 3, periods
+
+        return self._columns(self.for_month(month) for month in months)
+
+    def for_dates(self, dates: Iterable[datetime.date]):
+        # columnar (fiscal years, quarters, periods):
+        # numpy datetime64 array -> ndarrays, other iterables -> arrays ('i')
+        if getattr(getattr(dates, 'dtype', None), 'kind', None) != 'M':
+            return self._columns(self.for_date(date) for date in dates)
+
+        import numpy as np
+
+        days = dates.astype('datetime64[D]')
+        if self.pattern is None:
+            return self.for_months(days.astype('datetime64[M]').astype(np.int64))
+
+        ords = days.astype(np.int64) + DATETIME64_EPOCH_ORD
+        years = days.astype('datetime64[Y]').astype(np.int64) + 1970
+        ends = np.frombuffer(self._year_ends, dtype=np.int32).astype(np.int64)
+        # year 1 gives year 0 or 2, never 1; the former is rejected below
+        years = years - (ords <= ends[np.maximum(years - 2, 0)]) + (ords > ends[years - 1])
+        if len(years) and not (1 < years.min() and years.max() <= datetime.MAXYEAR):
+            raise ValueError("dates are out of range of the fiscal calendar")
+
+        weeks = (ords - ends[years - 2] - 1) // 7
+        periods = np.frombuffer(self._week_periods, dtype=np.int8)[weeks].astype(np.int64)
+        return years, (periods + 2) // 3, periods
+
+    @staticmethod
+    def _columns(rows: Iterable[tuple[int, int, int]]) -> tuple[array, array, array]:
+        years, quarters, periods = array('i'), array('i'), array('i')
+        for year, quarter, period in rows:
+            years.append(year)
+            quarters.append(quarter)
+            periods.append(period)
+        return years, quarters, periods
@@ -0,0 +1,157 @@
+import contextlib
+import functools
+import time
+from typing import Callable, Iterator
+
+from calendarium.date_range import DateRange
+from calendarium.month import Month
+from calendarium.month import MonthDelta
+
+# Opt-in counters of calls, time spent and objects created. `enable()` replaces public operations
+# of the instrumented classes with counting wrappers and `disable()` puts the original attributes
+# back, so that there is no cost at all while disabled. Times include nested calls. Counters are
+# plain dicts, updates from concurrent threads may occasionally be lost.
+
+INSTRUMENTED_CLASSES = (Month, MonthDelta, DateRange)
+
+# dunder operations to instrument, besides all public methods and properties
+INSTRUMENTED_DUNDERS = (
+    '__init__', '__format__', '__iter__', '__reversed__', '__contains__', '__getitem__',
+    '__add__', '__radd__', '__sub__', '__rsub__', '__mul__', '__rmul__', '__floordiv__', '__neg__',
+)
+
+# constructors that bypass `__init__`, only counted as object creation
+_PRIVATE_CONSTRUCTORS = ('_from_valid', '_from_total', '_from_ords')
+
+# operation name ('Month.parse') -> count or nanoseconds, class name -> objects created
+_calls = {}
+_nanoseconds = {}
+_yielded = {}
+_created = {}
+
+# (class, attribute name, original attribute) of installed wrappers
+_originals = []
+
+
+def _count_yielded(name: str, iterator: Iterator) -> Iterator:
+    count = 0
+    try:
+        for item in iterator:
+            count += 1
+            yield item
+    finally:
+        _yielded[name] = _yielded.get(name, 0) + count
+
+
+def _wrap(func: Callable, name: str, class_name: str) -> Callable:
+    creates = name.endswith('.__init__')
+    iterates = name.endswith(('.__iter__', '.__reversed__'))
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter_ns()
+        try:
+            result = func(*args, **kwargs)
+        finally:
+            _nanoseconds[name] = _nanoseconds.get(name, 0) + time.perf_counter_ns() - start
+            _calls[name] = _calls.get(name, 0) + 1
+
+        if creates:
+            _created[class_name] = _created.get(class_name, 0) + 1
+        if iterates:
+            return _count_yielded(name, result)
+        return result
+
+    return wrapper
+
+
+def _wrap_constructor(func: Callable, class_name: str) -> Callable:
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        result = func(*args, **kwargs)
+        _created[class_name] = _created.get(class_name, 0) + 1
+        return result
+
+    return wrapper
+
+
+def _wrap_attribute(attribute, name: str, class_name: str):
+    # methods, classmethods, staticmethods and properties; None for anything else
+    if isinstance(attribute, (classmethod, staticmethod)):
+        return type(attribute)(_wrap(attribute.__func__, name, class_name))
+    if isinstance(attribute, property):
+        return property(_wrap(attribute.fget, name, class_name), attribute.fset, attribute.fdel, attribute.__doc__)
+    if callable(attribute):
+        return _wrap(attribute, name, class_name)
+    return None
+
+
+def is_enabled() -> bool:
+    return bool(_originals)
+
+
+def enable() -> None:
+    if is_enabled():
+        return
+
+    for cls in INSTRUMENTED_CLASSES:
+        class_name = cls.__name__
+        for attr_name, attribute in list(vars(cls).items()):
+            if attr_name in _PRIVATE_CONSTRUCTORS:
+                wrapped = classmethod(_wrap_constructor(attribute.__func__, class_name))
+            elif attr_name in INSTRUMENTED_DUNDERS or not attr_name.startswith('_'):
+                wrapped = _wrap_attribute(attribute, f'{class_name}.{attr_name}', class_name)
+            else:
+                wrapped = None
+
+            if wrapped is not None:
+                _originals.append((cls, attr_name, attribute))
+                setattr(cls, attr_name, wrapped)
+
+
+def disable() -> None:
+    while _originals:
+        cls, attr_name, attribute = _originals.pop()
+        setattr(cls, attr_name, attribute)
+
+
+def reset() -> None:
+    for counters in (_calls, _nanoseconds, _yielded, _created):
+        counters.clear()
+
+
+def snapshot() -> dict[str, dict]:
+    # copies of the counters, e.g. for exporting to a metrics system:
+    # calls and seconds per operation, items yielded per iteration, objects created per class
+    return {
+        'calls': dict(_calls),
+        'seconds': {name: nanoseconds / 1e9 for name, nanoseconds in _nanoseconds.items()},
+        'yielded': dict(_yielded),
+        'created': dict(_created),
+    }
+
+
+def _difference(after: dict[str, dict], before: dict[str, dict]) -> dict[str, dict]:
+    return {
+        kind: {
+            name: value - before[kind].get(name, 0)
+            for name, value in counters.items()
+            if value != before[kind].get(name, 0)
+        }
+        for kind, counters in after.items()
+    }
+
+
+@contextlib.contextmanager
+def instrumented() -> Iterator[dict[str, dict]]:
+    # `with instrumented() as stats: ...` - stats are filled with the counts of the block on exit
+    was_enabled = is_enabled()
+    enable()
+    before = snapshot()
+    stats = {}
+    try:
+        yield stats
+    finally:
+        stats.update(_difference(snapshot(), before))
+        if not was_enabled:
+            disable()
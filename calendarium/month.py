@@ -1,34 +1,243 @@
+from array import array
 import datetime
-from typing import Iterator
+import functools
+from itertools import accumulate
+import re
+from typing import Callable, Iterable, Iterator, Optional, TYPE_CHECKING, Union
 
 from calendarium.date_range import DateRange
 
+if TYPE_CHECKING:
+    from calendarium.month_range import MonthRange
+    from calendarium.quarter import Quarter
+
 # except for leap years
 DAYS_IN_MONTH = [31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]
 
+# `date.toordinal()` of 9999-12-31
+MAX_DATE_ORDINAL = 3652059
+
+
+def is_leap_year(year: int) -> bool:
+    return year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+
+
+def days_in_month(year: int, month: int) -> int:
+    return DAYS_IN_MONTH[month - 1] + (month == 2 and is_leap_year(year))
+
+
+# The Gregorian calendar repeats every 400 years: 4800 months, 146097 days (a whole number of weeks).
+CYCLE_MONTHS = 4800
+CYCLE_DAYS = 146097
+
+# Tables of the months of one cycle starting at 0001-01, indexed by `(Month.ord() - Month.MIN_ORD) % CYCLE_MONTHS`:
+# days in month, days before the 1st within the cycle (plus one extra item for the end of the cycle)
+# and weekday of the 1st (Monday is 0). Small and built on first use, so that importing stays cheap.
+_cycle_tables = None
+
+
+def cycle_tables() -> tuple[array, array, array]:
+    global _cycle_tables
+
+    if _cycle_tables is None:
+        common_year = array('b', DAYS_IN_MONTH)
+        leap_year = array('b', DAYS_IN_MONTH)
+        leap_year[1] = 29
+        # every 4th year is leap, except for every 100th, except for every 400th
+        century = (common_year * 3 + leap_year) * 25
+        century[99 * 12 + 1] = 28
+        days = century * 4
+        days[399 * 12 + 1] = 29
+        days_before = array('i', accumulate(days, initial=0))
+        # 0001-01-01 is a Monday, and so is the start of every cycle
+        first_weekdays = array('b', [days % 7 for days in days_before[:-1]])
+        _cycle_tables = days, days_before, first_weekdays
+
+    return _cycle_tables
+
+
+def _cycle_indexes(ords: Iterable[int]) -> list[tuple[int, int]]:
+    # (cycle, index within cycle) of each month ord
+    min_ord = Month.MIN_ORD
+    indexes = [ord_ - min_ord for ord_ in ords]
+    if indexes and not 0 <= min(indexes) <= max(indexes) <= Month.MAX_ORD - min_ord:
+        raise ValueError("month ord is out of range")
+    return [divmod(index, CYCLE_MONTHS) for index in indexes]
+
+
+def _check_months_many(months) -> None:
+    # numpy datetime64[M] array must be within the calendar (NaT is fine), same error as `Month()`
+    ords = months[months == months].astype('int64')
+    if len(ords):
+        for ord_ in (int(ords.min()), int(ords.max())):
+            if not Month.MIN_ORD <= ord_ <= Month.MAX_ORD:
+                raise ValueError(f"year {ord_ // 12 + Month.EPOCH_Y} is out of range")
+
+
+def days_many(ords: Iterable[int]) -> array:
+    # days in months with given ords
+    days = cycle_tables()[0]
+    return array('b', [days[index] for _, index in _cycle_indexes(ords)])
+
+
+def start_ordinals_many(ords: Iterable[int]) -> array:
+    # `date.toordinal()` of the first days of months with given ords
+    days_before = cycle_tables()[1]
+    return array('i', [cycle * CYCLE_DAYS + days_before[index] + 1 for cycle, index in _cycle_indexes(ords)])
+
+
+def first_weekdays_many(ords: Iterable[int]) -> array:
+    # weekdays (Monday is 0) of the first days of months with given ords
+    first_weekdays = cycle_tables()[2]
+    return array('b', [first_weekdays[index] for _, index in _cycle_indexes(ords)])
+
+
+# placeholder for unparseable months in arrays of ords (int32 min)
+MISSING_ORD = -2 ** 31
+
+# same patterns as `strptime` uses, restricted to ASCII digits
+_DIRECTIVE_PATTERNS = {
+    '%Y': r'(?P<Y>[0-9]{4})',
+    '%m': r'(?P<m>1[0-2]|0[1-9]|[1-9])',
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _month_parser(format_spec: str) -> Callable[[str], tuple[int, int]]:
+    # formats with only '%Y', '%m' and literal text are matched by a precompiled regex,
+    # anything else (or anything the regex doesn't match) goes through `strptime`
+
+    def parse_strptime(month_string: str) -> tuple[int, int]:
+        date = datetime.datetime.strptime(month_string, format_spec)
+        return date.year, date.month
+
+    pattern_parts = []
+    for index, part in enumerate(re.split(r'(%.)', format_spec)):
+        if index % 2 == 0 and '%' not in part:
+            pattern_parts.append(re.escape(part))
+        elif part == '%%':
+            pattern_parts.append('%')
+        elif part in _DIRECTIVE_PATTERNS and _DIRECTIVE_PATTERNS[part] not in pattern_parts:
+            pattern_parts.append(_DIRECTIVE_PATTERNS[part])
+        else:
+            return parse_strptime
+
+    if not all(pattern in pattern_parts for pattern in _DIRECTIVE_PATTERNS.values()):
+        return parse_strptime
+
+    fullmatch = re.compile(''.join(pattern_parts)).fullmatch
+
+    def parse_fast(month_string: str) -> tuple[int, int]:
+        match = fullmatch(month_string)
+        # year 0000 matches, but `strptime` reports it as out of range
+        if match is None or match['Y'] == '0000':
+            return parse_strptime(month_string)
+
+        return int(match['Y']), int(match['m'])
+
+    return parse_fast
+
+
+# (year, month, format_spec) -> rendered string
+# note: rendered %b/%B are not invalidated on locale change
+FORMAT_CACHE_SIZE = 4096
+
+
+@functools.lru_cache(maxsize=FORMAT_CACHE_SIZE)
+def _format_month(year: int, month: int, format_spec: str) -> str:
+    return datetime.date(year, month, 1).strftime(format_spec)
+
+
+# (Month.ord(), firstweekday) -> calendar grid
+WEEKS_CACHE_SIZE = 1024
+
+# calendar grid: full weeks covering the month, including days of adjacent months
+MonthWeeks = tuple[tuple[datetime.date, ...], ...]
+
+
+@functools.lru_cache(maxsize=WEEKS_CACHE_SIZE)
+def _month_weeks(ord_: int, firstweekday: int) -> MonthWeeks:
+    month = Month.from_ord(ord_)
+    start_ordinal = month.start_ordinal()
+    # ordinal 1 (0001-01-01) is a Monday
+    leading_days = ((start_ordinal - 1) % 7 - firstweekday) % 7
+    grid_start = start_ordinal - leading_days
+    weeks_count = -(-(leading_days + month.days()) // 7)
+
+    return tuple(
+        tuple(datetime.date.fromordinal(grid_start + week * 7 + day) for day in range(7))
+        for week in range(weeks_count)
+    )
+
 
 class Month:
     # TODO: doctests
 
-    __slots__ = ('year', 'month', 'start_date', 'end_date')
+    # immutable: year and month are read-only properties, so that `_ord` (and shared instances) stay consistent
+    __slots__ = ('_year', '_month', '_ord', '_start_date', '_end_date')
 
     def __init__(self, year: int, month: int):
-        self.year = int(year)
-        self.month = int(month)
-        self.start_date = datetime.date(self.year, self.month, 1)
-
-        if self.month < 12:
-            # 2022-09 -> end_date = 2022-10-01
-            self.end_date = datetime.date(self.year, self.month + 1, 1)
-        elif self.year < datetime.MAXYEAR:
-            # 2022-12 -> end_date = 2023-01-01
-            self.end_date = datetime.date(self.year + 1, 1, 1)
-        else:
-            # 9999-12 -> end_date 9999-31-12 (max date!)
-            self.end_date = datetime.date(datetime.MAXYEAR, 12, 31)
+        self._year = year = int(year)
+        self._month = month = int(month)
+
+        # same validation (and messages) as `datetime.date`, without constructing one
+        if not datetime.MINYEAR <= year <= datetime.MAXYEAR:
+            raise ValueError(f"year {year} is out of range")
+        if not 1 <= month <= 12:
+            raise ValueError("month must be in 1..12")
+
+        # precomputed for hashing and comparisons
+        self._ord = (year - self.EPOCH_Y) * 12 + (month - self.EPOCH_M)
+
+        # dates are computed lazily on first access
+        self._start_date = None
+        self._end_date = None
+
+    # enough for every valid month
+    INTERN_CACHE_SIZE = 12 * (datetime.MAXYEAR - datetime.MINYEAR + 1)
+
+    @classmethod
+    def of(cls, year: int, month: int) -> 'Month':
+        # shared (interned) instance; arguments are normalized so that equal months share one entry
+        return cls._interned(int(year), int(month))
+
+    @classmethod
+    @functools.lru_cache(maxsize=INTERN_CACHE_SIZE)
+    def _interned(cls, year: int, month: int) -> 'Month':
+        return cls(year, month)
+
+    @property
+    def year(self) -> int:
+        return self._year
+
+    @property
+    def month(self) -> int:
+        return self._month
+
+    @property
+    def start_date(self) -> datetime.date:
+        if self._start_date is None:
+            self._start_date = datetime.date(self._year, self._month, 1)
+
+        return self._start_date
+
+    @property
+    def end_date(self) -> datetime.date:
+        if self._end_date is None:
+            if self._month < 12:
+                # 2022-09 -> end_date = 2022-10-01
+                self._end_date = datetime.date(self._year, self._month + 1, 1)
+            elif self._year < datetime.MAXYEAR:
+                # 2022-12 -> end_date = 2023-01-01
+                self._end_date = datetime.date(self._year + 1, 1, 1)
+            else:
+                # 9999-12 -> end_date 9999-31-12 (max date!)
+                self._end_date = datetime.date(datetime.MAXYEAR, 12, 31)
+
+        return self._end_date
 
     def __repr__(self) -> str:
-        return f'{type(self).__name__}({self.year!r}, {self.month!r})'
+        return f'{type(self).__name__}({self._year!r}, {self._month!r})'
 
     DEFAULT_FORMAT = '%Y-%m'
 
@@ -36,7 +245,27 @@ class Month:
         return format(self)
 
     def __format__(self, format_spec: str) -> str:
-        return format(self.start_date, format_spec or self.DEFAULT_FORMAT)
+        return _format_month(self._year, self._month, format_spec or self.DEFAULT_FORMAT)
+
+    @classmethod
+    def format_many(cls, months: Iterable['Month'], format_spec: str = DEFAULT_FORMAT, out=None):
+        # `out` may be a list or a numpy string array of matching length
+        format_spec = format_spec or cls.DEFAULT_FORMAT
+        rendered = {}
+
+        labels = []
+        for month in months:
+            key = (month.year, month.month)
+            label = rendered.get(key)
+            if label is None:
+                label = rendered[key] = _format_month(month.year, month.month, format_spec)
+            labels.append(label)
+
+        if out is None:
+            return labels
+
+        out[:] = labels
+        return out
 
     @classmethod
     def from_str(cls, month_string: str) -> 'Month':
@@ -44,23 +273,71 @@ class Month:
 
     @classmethod
     def parse(cls, month_string: str, format_spec: str = DEFAULT_FORMAT) -> 'Month':
-        return cls.for_date(datetime.datetime.strptime(month_string, format_spec).date())
+        return cls(*_month_parser(format_spec)(month_string))
+
+    @classmethod
+    def parse_many(
+        cls,
+        month_strings: Iterable[Union[str, bytes]],
+        format_spec: str = DEFAULT_FORMAT,
+        *,
+        as_ords: bool = False,
+        errors: str = 'raise'
+    ) -> Union[list[Optional['Month']], array]:
+        # errors='raise' -> ValueError naming the bad row
+        # errors='coerce' -> bad rows become None (or MISSING_ORD when as_ords=True)
+        if errors not in ('raise', 'coerce'):
+            raise ValueError(f"errors must be 'raise' or 'coerce', not {errors!r}")
+
+        parse = _month_parser(format_spec)
+        missing = MISSING_ORD if as_ords else None
+
+        # numpy arrays -> native str/bytes
+        if hasattr(month_strings, 'tolist'):
+            month_strings = month_strings.tolist()
+
+        results = []
+        for row, month_string in enumerate(month_strings):
+            try:
+                if isinstance(month_string, bytes):
+                    month_string = month_string.decode('ascii')
+                year, month = parse(month_string)
+                if as_ords:
+                    results.append((year - cls.EPOCH_Y) * 12 + (month - cls.EPOCH_M))
+                else:
+                    results.append(cls(year, month))
+            except (ValueError, TypeError) as exc:
+                if errors == 'coerce':
+                    results.append(missing)
+                else:
+                    raise ValueError(f"row {row}: {exc}") from exc
+
+        return array('i', results) if as_ords else results
 
     def __eq__(self, other) -> bool:
-        return self.year == other.year and self.month == other.month
+        if isinstance(other, Month):
+            return self._ord == other._ord
+
+        return NotImplemented
+
+    def __ne__(self, other) -> bool:
+        if isinstance(other, Month):
+            return self._ord != other._ord
+
+        return NotImplemented
 
     def __hash__(self) -> int:
-        return hash((type(self).__name__, self.ord()))
+        return hash(self._ord)
+
+    def sort_key(self) -> int:
+        # faster than comparisons: `sorted(months, key=Month.sort_key)`
+        return self._ord
 
     def is_leap(self) -> bool:
-        return (
-            self.month == 2
-            and self.year % 4 == 0
-            and (self.year % 100 != 0 or self.year % 400 == 0)
-        )
+        return self._month == 2 and is_leap_year(self._year)
 
     def days(self) -> int:
-        return DAYS_IN_MONTH[self.month - 1] + self.is_leap()
+        return (_cycle_tables or cycle_tables())[0][(self._ord - self.MIN_ORD) % CYCLE_MONTHS]
 
     def __len__(self) -> int:
         return self.days()
@@ -68,46 +345,178 @@ class Month:
     def __iter__(self) -> Iterator[datetime.date]:
         return iter(DateRange(self))
 
+    def weeks(self, firstweekday: int = 0) -> MonthWeeks:
+        # same dates as `calendar.Calendar(firstweekday).monthdatescalendar()`, shared and cached
+        if firstweekday not in range(7):
+            raise ValueError("firstweekday must be in 0..6")
+
+        return _month_weeks(self._ord, firstweekday)
+
+    @staticmethod
+    def weeks_many(months: Iterable['Month'], firstweekday: int = 0) -> list[MonthWeeks]:
+        return [month.weeks(firstweekday) for month in months]
+
+    def start_ordinal(self) -> int:
+        # same as `self.start_date.toordinal()`, without creating the date
+        cycle, index = divmod(self._ord - self.MIN_ORD, CYCLE_MONTHS)
+        return cycle * CYCLE_DAYS + (_cycle_tables or cycle_tables())[1][index] + 1
+
+    def end_ordinal(self) -> int:
+        # same as `self.end_date.toordinal()`
+        cycle, index = divmod(self._ord - self.MIN_ORD, CYCLE_MONTHS)
+        return min(cycle * CYCLE_DAYS + (_cycle_tables or cycle_tables())[1][index + 1] + 1, MAX_DATE_ORDINAL)
+
+    @property
+    def first_weekday(self) -> int:
+        # weekday of the first day (Monday is 0)
+        return (_cycle_tables or cycle_tables())[2][(self._ord - self.MIN_ORD) % CYCLE_MONTHS]
+
     def __contains__(self, date) -> bool:
+        if isinstance(date, datetime.date):
+            # not `end_ordinal()`, which is clamped in 9999-12
+            start = self.start_ordinal()
+            return start <= date.toordinal() < start + self.days()
+
         return self.start_date <= date < self.end_date
 
+    def overlap_days(self, start: datetime.date, end: datetime.date) -> int:
+        # number of days of [start, end) within this month
+        month_start = self.start_ordinal()
+        start_ord = max(start.toordinal(), month_start)
+        end_ord = min(end.toordinal(), month_start + self.days())
+        return max(end_ord - start_ord, 0)
+
     def __lt__(self, other) -> bool:
         if isinstance(other, Month):
-            return self.ord() < other.ord()
+            return self._ord < other._ord
 
         return NotImplemented
 
     def __le__(self, other) -> bool:
         if isinstance(other, Month):
-            return self.ord() <= other.ord()
+            return self._ord <= other._ord
+
+        return NotImplemented
+
+    def __gt__(self, other) -> bool:
+        if isinstance(other, Month):
+            return self._ord > other._ord
+
+        return NotImplemented
+
+    def __ge__(self, other) -> bool:
+        if isinstance(other, Month):
+            return self._ord >= other._ord
 
         return NotImplemented
 
     EPOCH = (1970, 1)
     EPOCH_Y, EPOCH_M = EPOCH
 
+    # ords of 0001-01 and 9999-12
+    MIN_ORD = (datetime.MINYEAR - EPOCH_Y) * 12 + (1 - EPOCH_M)
+    MAX_ORD = (datetime.MAXYEAR - EPOCH_Y) * 12 + (12 - EPOCH_M)
+
     def ord(self) -> int:
-        return (self.year - self.EPOCH_Y) * 12 + (self.month - self.EPOCH_M)
+        return self._ord
 
     @classmethod
     def from_ord(cls, ord_: int) -> 'Month':
+        ord_ = int(ord_)
         year, month = divmod(ord_, 12)
-        return cls(year + cls.EPOCH_Y, month + cls.EPOCH_M)
+        year += cls.EPOCH_Y
+        if not datetime.MINYEAR <= year <= datetime.MAXYEAR:
+            raise ValueError(f"year {year} is out of range")
+
+        return cls._from_valid(year, month + cls.EPOCH_M, ord_)
+
+    @classmethod
+    def _from_valid(cls, year: int, month: int, ord_: int) -> 'Month':
+        # skips conversions and validation of `__init__`
+        instance = cls.__new__(cls)
+        instance._year = year
+        instance._month = month
+        instance._ord = ord_
+        instance._start_date = None
+        instance._end_date = None
+        return instance
+
+    def __reduce__(self):
+        # pickled as a single int
+        return type(self).from_ord, (self._ord,)
+
+    def __copy__(self) -> 'Month':
+        # immutable
+        return self
+
+    def __deepcopy__(self, memo) -> 'Month':
+        return self
+
+    def to_bytes(self, length: int = 4) -> bytes:
+        # ord as signed little-endian int; length=2 is enough for years 1..4700
+        return self._ord.to_bytes(length, 'little', signed=True)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'Month':
+        return cls.from_ord(int.from_bytes(data, 'little', signed=True))
+
+    @staticmethod
+    def dump_many(months: Iterable['Month']) -> array:
+        # packed ords in native byte order, see `array.tobytes()`
+        return array('i', [month._ord for month in months])
+
+    @classmethod
+    def load_many(cls, data: Union[array, bytes]) -> list['Month']:
+        if not isinstance(data, array):
+            data = array('i', data)
+
+        return [cls.from_ord(ord_) for ord_ in data]
 
     def __sub__(self, other):
         # month - month
         if isinstance(other, Month):
-            return MonthDelta(self.ord() - other.ord())
+            return MonthDelta(self._ord - other._ord)
 
         return NotImplemented
 
     @property
     def last_date(self) -> datetime.date:
-        return datetime.date(self.year, self.month, len(self))
+        return datetime.date(self._year, self._month, len(self))
+
+    def range_to(self, stop: Union['Month', 'MonthDelta'], step: Union['MonthDelta', int] = 1) -> 'MonthRange':
+        # month_range.py imports this module
+        from calendarium.month_range import MonthRange
+        return MonthRange(self, stop, step)
+
+    def quarter(self) -> 'Quarter':
+        # quarter.py imports this module
+        from calendarium.quarter import Quarter
+        return Quarter.for_month(self)
 
     @classmethod
     def for_date(cls, date: datetime.date) -> 'Month':
-        return cls(date.year, date.month)
+        # year and month of a date are always valid
+        year, month = date.year, date.month
+        return cls._from_valid(year, month, (year - cls.EPOCH_Y) * 12 + (month - cls.EPOCH_M))
+
+    @classmethod
+    def for_dates(cls, dates: Iterable[Optional[datetime.date]]):
+        # ords of months containing given dates, without creating any Month:
+        # numpy datetime64 array -> int32 ndarray, other iterables -> array('i');
+        # missing dates (None/NaT) -> MISSING_ORD
+        if getattr(getattr(dates, 'dtype', None), 'kind', None) == 'M':
+            # Month.EPOCH is also the epoch of datetime64
+            months = dates.astype('datetime64[M]')
+            _check_months_many(months)
+            ords = months.astype('int64')
+            ords[months != months] = MISSING_ORD
+            return ords.astype('int32')
+
+        epoch_y, epoch_m = cls.EPOCH
+        return array('i', [
+            (date.year - epoch_y) * 12 + (date.month - epoch_m) if date is not None else MISSING_ORD
+            for date in dates
+        ])
 
     @classmethod
     def today(cls) -> 'Month':
@@ -115,16 +524,41 @@ class Month:
 
 
 class MonthDelta:
-    __slots__ = ('years', 'months')
+    # canonical total number of months; years and months are derived from it
+    __slots__ = ('_total',)
 
     def __init__(self, months: int = 0, *, years: int = 0):
-        total_months = int(years * 12 + months)
-        self.years, self.months = divmod(abs(total_months), 12)
-        if total_months < 0:
-            self.years, self.months = -self.years, -self.months
+        self._total = int(years * 12 + months)
+
+    @classmethod
+    def _from_total(cls, total: int) -> 'MonthDelta':
+        delta = cls.__new__(cls)
+        delta._total = total
+        return delta
+
+    @property
+    def years(self) -> int:
+        # both years and months have the sign of the whole delta
+        years = abs(self._total) // 12
+        return years if self._total >= 0 else -years
+
+    @property
+    def months(self) -> int:
+        months = abs(self._total) % 12
+        return months if self._total >= 0 else -months
 
     def total_months(self) -> int:
-        return self.years * 12 + self.months
+        return self._total
+
+    def __reduce__(self):
+        return type(self), (self._total,)
+
+    def __copy__(self) -> 'MonthDelta':
+        # immutable
+        return self
+
+    def __deepcopy__(self, memo) -> 'MonthDelta':
+        return self
 
     def __repr__(self) -> str:
         def parts():
@@ -147,24 +581,129 @@ class MonthDelta:
         return f'{sign}P{parts_str}'
 
     def __eq__(self, other) -> bool:
-        return self.months == other.months
+        if isinstance(other, MonthDelta):
+            return self._total == other._total
+
+        return NotImplemented
+
+    def __ne__(self, other) -> bool:
+        if isinstance(other, MonthDelta):
+            return self._total != other._total
+
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self._total)
+
+    def __lt__(self, other) -> bool:
+        if isinstance(other, MonthDelta):
+            return self._total < other._total
+
+        return NotImplemented
+
+    def __le__(self, other) -> bool:
+        if isinstance(other, MonthDelta):
+            return self._total <= other._total
+
+        return NotImplemented
+
+    def __gt__(self, other) -> bool:
+        if isinstance(other, MonthDelta):
+            return self._total > other._total
+
+        return NotImplemented
+
+    def __ge__(self, other) -> bool:
+        if isinstance(other, MonthDelta):
+            return self._total >= other._total
+
+        return NotImplemented
+
+    def __bool__(self) -> bool:
+        return self._total != 0
 
     def __neg__(self) -> 'MonthDelta':
-        return type(self)(years=-self.years, months=-self.months)
+        return self._from_total(-self._total)
+
+    def __pos__(self) -> 'MonthDelta':
+        return self
+
+    def __abs__(self) -> 'MonthDelta':
+        return self._from_total(abs(self._total))
 
     def __add__(self, other):
         # monthdelta + month
         if isinstance(other, Month):
-            return type(other).from_ord(other.ord() + self.total_months())
+            return type(other).from_ord(other.ord() + self._total)
+
+        # monthdelta + date (or datetime)
+        if isinstance(other, datetime.date):
+            return self.add_to(other)
 
         # monthdelta + monthdelta
         if isinstance(other, MonthDelta):
-            return type(self)(self.total_months() + other.total_months())
+            return self._from_total(self._total + other._total)
 
         return NotImplemented
 
     __radd__ = __add__
 
+    # what to do when the day doesn't exist in the target month (e.g. Jan 31 + 1 month):
+    # 'clamp' -> last day of the target month (Feb 28)
+    # 'overflow' -> extra days spill into the next month (Mar 3)
+    # 'end' -> like 'clamp', but last day of a month always maps to last day of the target month
+    EOM_POLICIES = ('clamp', 'overflow', 'end')
+
+    def add_to(self, date: datetime.date, policy: str = 'clamp') -> datetime.date:
+        # shift date (or datetime, keeping its time) by this delta
+        if policy not in self.EOM_POLICIES:
+            raise ValueError(f"unknown end-of-month policy {policy!r}")
+
+        year, month = divmod(date.year * 12 + date.month - 1 + self.total_months(), 12)
+        month += 1
+        if not datetime.MINYEAR <= year <= datetime.MAXYEAR:
+            raise ValueError(f"year {year} is out of range")
+
+        day, target_days = date.day, days_in_month(year, month)
+        if day <= target_days and not (policy == 'end' and day == days_in_month(date.year, date.month)):
+            return date.replace(year=year, month=month, day=day)
+
+        if policy == 'overflow':
+            return date.replace(year=year, month=month, day=1) + datetime.timedelta(days=day - 1)
+
+        return date.replace(year=year, month=month, day=target_days)
+
+    def add_to_many(self, dates, policy: str = 'clamp'):
+        # numpy datetime64 array -> vectorized datetime64 array of the same unit, other iterables -> list
+        if policy not in self.EOM_POLICIES:
+            raise ValueError(f"unknown end-of-month policy {policy!r}")
+
+        if getattr(getattr(dates, 'dtype', None), 'kind', None) != 'M':
+            return [self.add_to(date, policy) for date in dates]
+
+        import numpy as np
+
+        days = dates.astype('datetime64[D]')
+        time_of_day = dates - days
+        months = days.astype('datetime64[M]')
+        day_index = (days - months.astype('datetime64[D]')).astype(np.int64)
+
+        targets = months + self.total_months()
+        _check_months_many(targets)
+        target_starts = targets.astype('datetime64[D]')
+        target_days = ((targets + 1).astype('datetime64[D]') - target_starts).astype(np.int64)
+
+        if policy == 'overflow':
+            shifted = target_starts + day_index
+        else:
+            clamped = np.minimum(day_index, target_days - 1)
+            if policy == 'end':
+                source_days = ((months + 1).astype('datetime64[D]') - months.astype('datetime64[D]')).astype(np.int64)
+                clamped = np.where(day_index == source_days - 1, target_days - 1, clamped)
+            shifted = target_starts + clamped
+
+        return (shifted + time_of_day).astype(dates.dtype)
+
     def __sub__(self, other):
         try:
             return self + (-other)
@@ -178,7 +717,79 @@ class MonthDelta:
             return NotImplemented
 
     def __mul__(self, other):
-        return type(self)(self.total_months() * other)
+        if isinstance(other, MonthDelta):
+            return NotImplemented
+
+        try:
+            return self._from_total(int(self._total * other))
+        except TypeError:
+            return NotImplemented
+
+    __rmul__ = __mul__
 
     def __floordiv__(self, other):
-        return type(self)(self.total_months() // other)
+        # monthdelta // monthdelta -> int
+        if isinstance(other, MonthDelta):
+            return self._total // other._total
+
+        # monthdelta // int -> monthdelta
+        try:
+            return self._from_total(int(self._total // other))
+        except TypeError:
+            return NotImplemented
+
+    def __truediv__(self, other):
+        # monthdelta / monthdelta -> float
+        if isinstance(other, MonthDelta):
+            return self._total / other._total
+
+        return NotImplemented
+
+    def __mod__(self, other):
+        if isinstance(other, MonthDelta):
+            return self._from_total(self._total % other._total)
+
+        return NotImplemented
+
+    def __divmod__(self, other):
+        if isinstance(other, MonthDelta):
+            quotient, remainder = divmod(self._total, other._total)
+            return quotient, self._from_total(remainder)
+
+        return NotImplemented
+
+
+def group_by_month(dates, values, reducer: Callable) -> dict[int, object]:
+    # reduce values bucketed by month ords of corresponding dates -> {ord: reducer(bucket)}
+    # ordered by ord; rows with missing dates are dropped
+    ords = Month.for_dates(dates)
+
+    if not isinstance(ords, array):
+        # numpy: sort once, reduce contiguous slices
+        import numpy as np
+
+        values = np.asarray(values)
+        if len(values) != len(ords):
+            raise ValueError("dates and values must have the same length")
+
+        order = np.argsort(ords, kind='stable')
+        sorted_ords, sorted_values = ords[order], values[order]
+        keys, starts = np.unique(sorted_ords, return_index=True)
+        stops = list(starts[1:]) + [len(sorted_ords)]
+
+        return {
+            ord_: reducer(sorted_values[start:stop])
+            for ord_, start, stop in zip(keys.tolist(), starts.tolist(), stops)
+            if ord_ != MISSING_ORD
+        }
+
+    values = list(values)
+    if len(values) != len(ords):
+        raise ValueError("dates and values must have the same length")
+
+    buckets = {}
+    for ord_, value in zip(ords, values):
+        if ord_ != MISSING_ORD:
+            buckets.setdefault(ord_, []).append(value)
+
+    return {ord_: reducer(buckets[ord_]) for ord_ in sorted(buckets)}
@@ -0,0 +1,165 @@
+import datetime
+from typing import Iterable, Iterator
+
+# numpy is an optional dependency of calendarium, required by this module only
+import numpy as np
+
+from calendarium.month import DAYS_IN_MONTH
+from calendarium.month import Month
+from calendarium.month import MonthDelta
+
+MIN_ORD = Month.MIN_ORD
+MAX_ORD = Month.MAX_ORD
+
+_DAYS_IN_MONTH = np.array(DAYS_IN_MONTH, dtype=np.int32)
+
+# Month.EPOCH (1970-01) is also the epoch of numpy's datetime64
+_MAX_DATE = np.datetime64(datetime.date.max, 'D')
+
+
+class MonthArray:
+    # months stored as int32 array of `Month.ord()` ordinals
+
+    __slots__ = ('ords',)
+
+    def __init__(self, ords: Iterable[int] = ()):
+        ords = np.asarray(ords)
+        if ords.ndim != 1:
+            raise ValueError("ords must be one-dimensional")
+        # casting would silently truncate floats; an empty sequence has no integer dtype though
+        if ords.dtype.kind not in 'iu' and len(ords):
+            raise ValueError(f"ords must be integers, not {ords.dtype}")
+
+        if len(ords):
+            lowest, highest = int(ords.min()), int(ords.max())
+            for ord_ in (lowest, highest):
+                if not MIN_ORD <= ord_ <= MAX_ORD:
+                    raise ValueError(f"year {ord_ // 12 + Month.EPOCH_Y} is out of range")
+
+        self.ords = ords.astype(np.int32)
+
+    @classmethod
+    def from_months(cls, months: Iterable[Month]) -> 'MonthArray':
+        return cls(np.fromiter((month.ord() for month in months), dtype=np.int32))
+
+    def to_months(self) -> list[Month]:
+        return [Month.from_ord(ord_) for ord_ in self.ords.tolist()]
+
+    def __repr__(self) -> str:
+        months_repr = np.array2string(self.ords.astype('datetime64[M]'), separator=', ')
+        return f'{type(self).__name__}({months_repr})'
+
+    def __len__(self) -> int:
+        return len(self.ords)
+
+    def __iter__(self) -> Iterator[Month]:
+        return (Month.from_ord(ord_) for ord_ in self.ords.tolist())
+
+    def __getitem__(self, index):
+        if isinstance(index, (int, np.integer)):
+            return Month.from_ord(int(self.ords[index]))
+
+        return type(self)(self.ords[index])
+
+    def __contains__(self, month) -> bool:
+        if isinstance(month, Month):
+            return bool((self.ords == month.ord()).any())
+
+        return False
+
+    @property
+    def years(self) -> np.ndarray:
+        return self.ords // 12 + Month.EPOCH_Y
+
+    @property
+    def months(self) -> np.ndarray:
+        return self.ords % 12 + Month.EPOCH_M
+
+    def is_leap(self) -> np.ndarray:
+        years = self.years
+        return (
+            (self.months == 2)
+            & (years % 4 == 0)
+            & ((years % 100 != 0) | (years % 400 == 0))
+        )
+
+    def days(self) -> np.ndarray:
+        return _DAYS_IN_MONTH[self.months - 1] + self.is_leap()
+
+    @property
+    def start_date(self) -> np.ndarray:
+        return self.ords.astype('datetime64[M]').astype('datetime64[D]')
+
+    @property
+    def end_date(self) -> np.ndarray:
+        # 9999-12 -> end_date 9999-12-31 (max date!), same as Month.end_date
+        end_dates = (self.ords.astype(np.int64) + 1).astype('datetime64[M]').astype('datetime64[D]')
+        return np.minimum(end_dates, _MAX_DATE)
+
+    @property
+    def last_date(self) -> np.ndarray:
+        return self.start_date + (self.days() - 1)
+
+    @staticmethod
+    def _other_ords(other):
+        if isinstance(other, Month):
+            return other.ord()
+        if isinstance(other, MonthArray):
+            return other.ords
+        return None
+
+    def __add__(self, other):
+        # montharray + monthdelta
+        if isinstance(other, MonthDelta):
+            return type(self)(self.ords.astype(np.int64) + other.total_months())
+
+        return NotImplemented
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        # montharray - monthdelta
+        if isinstance(other, MonthDelta):
+            return type(self)(self.ords.astype(np.int64) - other.total_months())
+
+        # montharray - month(array) -> total months of each difference
+        other_ords = self._other_ords(other)
+        if other_ords is not None:
+            return self.ords - other_ords
+
+        return NotImplemented
+
+    def __rsub__(self, other):
+        # month - montharray
+        if isinstance(other, Month):
+            return other.ord() - self.ords
+
+        return NotImplemented
+
+    def _compare(self, other, op):
+        other_ords = self._other_ords(other)
+        if other_ords is None:
+            return NotImplemented
+
+        return op(self.ords, other_ords)
+
+    def __eq__(self, other):
+        return self._compare(other, np.equal)
+
+    def __ne__(self, other):
+        return self._compare(other, np.not_equal)
+
+    def __lt__(self, other):
+        return self._compare(other, np.less)
+
+    def __le__(self, other):
+        return self._compare(other, np.less_equal)
+
+    def __gt__(self, other):
+        return self._compare(other, np.greater)
+
+    def __ge__(self, other):
+        return self._compare(other, np.greater_equal)
+
+    # comparisons are elementwise
+    __hash__ = None
@@ -0,0 +1,139 @@
+from typing import Iterator, Union
+
+from calendarium.date_range import intersect_ranges
+from calendarium.date_range import tighten_range
+from calendarium.date_range import unite_ranges
+from calendarium.month import Month
+from calendarium.month import MonthDelta
+
+
+class MonthRange:
+    # sequence of months like `range`, computed arithmetically over `Month.ord()`
+
+    __slots__ = ('_ords',)
+
+    def __init__(
+        self,
+        start: Month,
+        stop: Union[Month, MonthDelta],
+        step: Union[MonthDelta, int] = 1
+    ):
+        # stop may also be given as span from start, e.g. `MonthRange(a, b - a)`
+        if isinstance(stop, MonthDelta):
+            stop_ord = start.ord() + stop.total_months()
+        else:
+            stop_ord = stop.ord()
+
+        # exclusive stop may be just outside the calendar, e.g. after 9999-12
+        if not Month.MIN_ORD - 1 <= stop_ord <= Month.MAX_ORD + 1:
+            raise ValueError("stop is out of range")
+
+        if isinstance(step, MonthDelta):
+            step = step.total_months()
+
+        if not step:
+            raise ValueError("step must not be zero")
+
+        self._ords = range(start.ord(), stop_ord, int(step))
+
+    @classmethod
+    def _from_ords(cls, ords: range) -> 'MonthRange':
+        month_range = cls.__new__(cls)
+        month_range._ords = tighten_range(ords)
+        return month_range
+
+    @property
+    def start(self) -> Month:
+        return Month.from_ord(self._ords.start)
+
+    @property
+    def stop(self) -> Month:
+        # raises for a stop just outside the calendar, use `span` instead
+        if not Month.MIN_ORD <= self._ords.stop <= Month.MAX_ORD:
+            raise ValueError("stop is out of range")
+        return Month.from_ord(self._ords.stop)
+
+    @property
+    def span(self) -> MonthDelta:
+        # stop - start, also for a stop outside the calendar
+        return MonthDelta(self._ords.stop - self._ords.start)
+
+    @property
+    def step(self) -> MonthDelta:
+        return MonthDelta(self._ords.step)
+
+    def __repr__(self) -> str:
+        if Month.MIN_ORD <= self._ords.stop <= Month.MAX_ORD:
+            stop_repr = repr(self.stop)
+        else:
+            # stop just outside the calendar can't be a Month -> span from start
+            stop_repr = repr(self.span)
+        step_repr = f', {self.step!r}' if self._ords.step != 1 else ''
+        return f'{type(self).__name__}({self.start!r}, {stop_repr}{step_repr})'
+
+    def __len__(self) -> int:
+        return len(self._ords)
+
+    def __bool__(self) -> bool:
+        return bool(self._ords)
+
+    def __iter__(self) -> Iterator[Month]:
+        return map(Month.from_ord, self._ords)
+
+    def __reversed__(self) -> Iterator[Month]:
+        return map(Month.from_ord, reversed(self._ords))
+
+    def __contains__(self, month) -> bool:
+        if isinstance(month, Month):
+            return month.ord() in self._ords
+
+        return False
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self._from_ords(self._ords[index])
+
+        return Month.from_ord(self._ords[index])
+
+    def index(self, month: Month) -> int:
+        if month not in self:
+            raise ValueError(f"{month!r} is not in range")
+
+        return self._ords.index(month.ord())
+
+    def count(self, month: Month) -> int:
+        return int(month in self)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, MonthRange):
+            # same as `range`: equal when they produce the same months
+            return self._ords == other._ords
+
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash((type(self).__name__, self._ords))
+
+    def intersection(self, other: 'MonthRange') -> 'MonthRange':
+        # result is always ascending
+        return self._from_ords(intersect_ranges(self._ords, other._ords))
+
+    def __and__(self, other):
+        if isinstance(other, MonthRange):
+            return self.intersection(other)
+
+        return NotImplemented
+
+    def union(self, other: 'MonthRange') -> 'MonthRange':
+        # result is always ascending; must be representable as a single range
+        ords = unite_ranges(self._ords, other._ords)
+        if ords is None:
+            raise ValueError("union of month ranges is not a month range")
+
+        return self._from_ords(ords)
+
+    def __or__(self, other):
+        if isinstance(other, MonthRange):
+            return self.union(other)
+
+        return NotImplemented
@@ -0,0 +1,177 @@
+from array import array
+from bisect import bisect_left
+from typing import Callable, Iterable, Iterator, Mapping, Optional, Sequence, Union
+
+from calendarium.month import Month
+from calendarium.month import MonthDelta
+from calendarium.year import Year
+
+
+def _compact_ords(ords: Sequence[int]) -> Union[range, array]:
+    # consecutive ords are stored as a `range` (dense series), others as sorted array('i') (sparse)
+    if not ords:
+        return range(0)
+    if ords[-1] - ords[0] + 1 == len(ords):
+        return range(ords[0], ords[-1] + 1)
+    return array('i', ords)
+
+
+class MonthSeries:
+    # Immutable mapping of months to values, stored as `Month.ord()` keys plus a parallel sequence
+    # of values (list, array or numpy array, kept as given). Keys of a dense series are a `range`,
+    # so that lookups are O(1); keys of a sparse series are a sorted array('i') searched by bisection.
+
+    __slots__ = ('_ords', '_values')
+
+    def __init__(self, data: Union[Mapping[Month, object], Iterable[tuple[Month, object]]] = ()):
+        if isinstance(data, Mapping):
+            data = data.items()
+
+        items = sorted((month.ord(), value) for month, value in data)
+        ords = [ord_ for ord_, _ in items]
+        if any(ords[index] == ords[index + 1] for index in range(len(ords) - 1)):
+            raise ValueError("duplicate month in series")
+
+        self._ords = _compact_ords(ords)
+        self._values = [value for _, value in items]
+
+    @classmethod
+    def _from_ords(cls, ords: Union[range, array], values: Sequence) -> 'MonthSeries':
+        series = cls.__new__(cls)
+        series._ords = ords
+        series._values = values
+        return series
+
+    @classmethod
+    def dense(cls, start: Month, values: Sequence) -> 'MonthSeries':
+        # consecutive months from `start`; `values` is kept as is, e.g. array('d') or numpy array
+        ords = range(start.ord(), start.ord() + len(values))
+        if ords and ords[-1] > Month.MAX_ORD:
+            raise ValueError("series is out of range")
+
+        return cls._from_ords(ords, values)
+
+    def is_dense(self) -> bool:
+        return isinstance(self._ords, range)
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({dict(self.items())!r})'
+
+    def __len__(self) -> int:
+        return len(self._ords)
+
+    def __bool__(self) -> bool:
+        return bool(self._ords)
+
+    def __iter__(self) -> Iterator[Month]:
+        return map(Month.from_ord, self._ords)
+
+    def months(self) -> list[Month]:
+        return list(self)
+
+    def values(self) -> Sequence:
+        return self._values
+
+    def items(self) -> Iterator[tuple[Month, object]]:
+        return zip(self, self._values)
+
+    @property
+    def first_month(self) -> Month:
+        return Month.from_ord(self._ords[0])
+
+    @property
+    def last_month(self) -> Month:
+        return Month.from_ord(self._ords[-1])
+
+    def _index(self, ord_: int) -> Optional[int]:
+        ords = self._ords
+        if isinstance(ords, range):
+            return ord_ - ords.start if ord_ in ords else None
+
+        index = bisect_left(ords, ord_)
+        return index if index < len(ords) and ords[index] == ord_ else None
+
+    def __contains__(self, month) -> bool:
+        if isinstance(month, Month):
+            return self._index(month.ord()) is not None
+
+        return False
+
+    def __getitem__(self, key):
+        # series[month] -> value, series[start:stop] -> series of months in [start, stop)
+        if isinstance(key, slice):
+            if key.step is not None:
+                raise ValueError("slicing by months does not support step")
+            ords = self._ords
+            start = bisect_left(ords, key.start.ord()) if key.start is not None else 0
+            stop = bisect_left(ords, key.stop.ord()) if key.stop is not None else len(ords)
+            return self._from_ords(_compact_ords(ords[start:stop]), self._values[start:stop])
+
+        index = self._index(key.ord())
+        if index is None:
+            raise KeyError(key)
+
+        return self._values[index]
+
+    def get(self, month: Month, default=None):
+        index = self._index(month.ord())
+        return self._values[index] if index is not None else default
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, MonthSeries):
+            return list(self._ords) == list(other._ords) and list(self._values) == list(other._values)
+
+        return NotImplemented
+
+    __hash__ = None
+
+    def reindex(self, months: Iterable[Month], fill_value=None) -> 'MonthSeries':
+        # series over given months (in ascending order), missing values replaced by `fill_value`
+        ords = sorted({month.ord() for month in months})
+        values = []
+        for ord_ in ords:
+            index = self._index(ord_)
+            values.append(self._values[index] if index is not None else fill_value)
+
+        return self._from_ords(_compact_ords(ords), values)
+
+    def shift(self, delta: Union[MonthDelta, int]) -> 'MonthSeries':
+        # same values, months moved by `delta`
+        if isinstance(delta, MonthDelta):
+            delta = delta.total_months()
+
+        ords = self._ords
+        if ords and not Month.MIN_ORD <= ords[0] + delta <= ords[-1] + delta <= Month.MAX_ORD:
+            raise ValueError("shifted series is out of range")
+
+        if isinstance(ords, range):
+            shifted = range(ords.start + delta, ords.stop + delta)
+        else:
+            shifted = array('i', (ord_ + delta for ord_ in ords))
+
+        return self._from_ords(shifted, self._values)
+
+    def align(
+        self,
+        other: 'MonthSeries',
+        join: str = 'outer',
+        fill_value=None
+    ) -> tuple['MonthSeries', 'MonthSeries']:
+        # both series reindexed over the union ('outer') or the intersection ('inner') of their months
+        if join == 'outer':
+            ords = set(self._ords) | set(other._ords)
+        elif join == 'inner':
+            ords = set(self._ords) & set(other._ords)
+        else:
+            raise ValueError(f"join must be 'outer' or 'inner', not {join!r}")
+
+        months = list(map(Month.from_ord, ords))
+        return self.reindex(months, fill_value), other.reindex(months, fill_value)
+
+    def resample_years(self, reducer: Callable[[list], object] = sum) -> dict[Year, object]:
+        # values grouped by year (Month.EPOCH starts a year), reduced by `reducer`
+        groups = {}
+        for ord_, value in zip(self._ords, self._values):
+            groups.setdefault(ord_ // 12, []).append(value)
+
+        return {Year(year + Month.EPOCH_Y): reducer(values) for year, values in groups.items()}
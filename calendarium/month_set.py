@@ -0,0 +1,154 @@
+from array import array
+from bisect import bisect_right
+from typing import Callable, Iterable, Iterator
+
+from calendarium.month import Month
+
+
+def _combine(a: array, b: array, keep: Callable[[bool, bool], bool]) -> array:
+    # merge two sorted lists of run bounds, keeping months for which `keep(in_a, in_b)` holds
+    result = array('i')
+    i = j = 0
+    in_a = in_b = inside = False
+
+    while i < len(a) or j < len(b):
+        if j == len(b) or (i < len(a) and a[i] <= b[j]):
+            point = a[i]
+        else:
+            point = b[j]
+
+        if i < len(a) and a[i] == point:
+            in_a = not in_a
+            i += 1
+        if j < len(b) and b[j] == point:
+            in_b = not in_b
+            j += 1
+
+        if keep(in_a, in_b) != inside:
+            inside = not inside
+            result.append(point)
+
+    return result
+
+
+class MonthSet:
+    # immutable set of months stored as sorted disjoint runs of `Month.ord()`:
+    # flat bounds [start_0, stop_0, start_1, stop_1, ...] with exclusive stops,
+    # so that a month is in the set when an odd number of bounds is <= its ord
+
+    __slots__ = ('_bounds',)
+
+    def __init__(self, months: Iterable[Month] = ()):
+        bounds = array('i')
+        for ord_ in sorted({month.ord() for month in months}):
+            if bounds and bounds[-1] == ord_:
+                bounds[-1] = ord_ + 1
+            else:
+                bounds.extend((ord_, ord_ + 1))
+
+        self._bounds = bounds
+
+    @classmethod
+    def _from_bounds(cls, bounds: array) -> 'MonthSet':
+        month_set = cls.__new__(cls)
+        month_set._bounds = bounds
+        return month_set
+
+    @classmethod
+    def from_runs(cls, runs: Iterable[tuple[Month, Month]]) -> 'MonthSet':
+        # runs of months from first to last (both inclusive, so that 9999-12 can be included), may overlap
+        bounds = array('i')
+        for start, stop in sorted((first.ord(), last.ord() + 1) for first, last in runs):
+            if start >= stop:
+                continue
+            if bounds and start <= bounds[-1]:
+                bounds[-1] = max(bounds[-1], stop)
+            else:
+                bounds.extend((start, stop))
+
+        return cls._from_bounds(bounds)
+
+    def _runs(self, offset: int) -> list[tuple[Month, Month]]:
+        # (first, last) months between bounds starting at `offset`, both inclusive
+        bounds = self._bounds
+        return [
+            (Month.from_ord(bounds[index]), Month.from_ord(bounds[index + 1] - 1))
+            for index in range(offset, len(bounds) - 1, 2)
+        ]
+
+    def runs(self) -> list[tuple[Month, Month]]:
+        # (first, last) months of each run, same as accepted by `from_runs`
+        return self._runs(0)
+
+    def gaps(self) -> list[tuple[Month, Month]]:
+        # (first, last) months missing between the first and the last month of the set
+        return self._runs(1)
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}.from_runs({self.runs()!r})'
+
+    def count(self) -> int:
+        bounds = self._bounds
+        return sum(bounds[index + 1] - bounds[index] for index in range(0, len(bounds), 2))
+
+    def __len__(self) -> int:
+        return self.count()
+
+    def __bool__(self) -> bool:
+        return bool(self._bounds)
+
+    def __contains__(self, month) -> bool:
+        if isinstance(month, Month):
+            return bisect_right(self._bounds, month.ord()) % 2 == 1
+
+        return False
+
+    def __iter__(self) -> Iterator[Month]:
+        bounds = self._bounds
+        for index in range(0, len(bounds), 2):
+            yield from map(Month.from_ord, range(bounds[index], bounds[index + 1]))
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, MonthSet):
+            return self._bounds == other._bounds
+
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash((type(self).__name__, self._bounds.tobytes()))
+
+    def union(self, other: 'MonthSet') -> 'MonthSet':
+        return self._from_bounds(_combine(self._bounds, other._bounds, lambda a, b: a or b))
+
+    def intersection(self, other: 'MonthSet') -> 'MonthSet':
+        return self._from_bounds(_combine(self._bounds, other._bounds, lambda a, b: a and b))
+
+    def difference(self, other: 'MonthSet') -> 'MonthSet':
+        return self._from_bounds(_combine(self._bounds, other._bounds, lambda a, b: a and not b))
+
+    def symmetric_difference(self, other: 'MonthSet') -> 'MonthSet':
+        return self._from_bounds(_combine(self._bounds, other._bounds, lambda a, b: a != b))
+
+    def __or__(self, other):
+        if isinstance(other, MonthSet):
+            return self.union(other)
+
+        return NotImplemented
+
+    def __and__(self, other):
+        if isinstance(other, MonthSet):
+            return self.intersection(other)
+
+        return NotImplemented
+
+    def __sub__(self, other):
+        if isinstance(other, MonthSet):
+            return self.difference(other)
+
+        return NotImplemented
+
+    def __xor__(self, other):
+        if isinstance(other, MonthSet):
+            return self.symmetric_difference(other)
+
+        return NotImplemented
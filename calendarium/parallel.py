@@ -0,0 +1,69 @@
+from array import array
+import concurrent.futures
+import os
+from typing import Callable, Iterable, Optional, Union
+
+from calendarium.month import Month
+from calendarium.month_range import MonthRange
+
+# Chunks are passed to workers as MonthRange (pickled as a `range`) or array('i') of `Month.ord()`
+# (pickled as raw bytes), never as lists of Month objects.
+Chunk = Union[MonthRange, array]
+
+
+def as_ords(months: Iterable) -> array:
+    # Months, ints or a numpy integer array -> array('i') of ords
+    if isinstance(months, array) and months.typecode == 'i':
+        return months
+
+    if hasattr(months, 'astype'):
+        # checked before the cast, which would silently wrap around
+        if len(months):
+            for ord_ in (int(months.min()), int(months.max())):
+                if not Month.MIN_ORD <= ord_ <= Month.MAX_ORD:
+                    raise ValueError(f"year {ord_ // 12 + Month.EPOCH_Y} is out of range")
+        return array('i', months.astype('int32').tobytes())
+
+    return array('i', (month.ord() if isinstance(month, Month) else month for month in months))
+
+
+def partition(months: Union[MonthRange, Iterable], chunks: int) -> list[Chunk]:
+    # split into at most `chunks` non-empty parts whose sizes differ by at most one
+    if chunks < 1:
+        raise ValueError("chunks must be positive")
+
+    if not isinstance(months, MonthRange):
+        months = as_ords(months)
+
+    size = len(months)
+    parts = (months[size * index // chunks:size * (index + 1) // chunks] for index in range(chunks))
+    return [part for part in parts if len(part)]
+
+
+def map_chunks(
+    func: Callable[[Chunk], object],
+    months: Union[MonthRange, Iterable],
+    *,
+    executor: Union[str, concurrent.futures.Executor] = 'process',
+    max_workers: Optional[int] = None,
+    chunks: Optional[int] = None,
+    merge: Callable[[list], object] = list
+):
+    # run `func` over balanced chunks of months in a pool and merge the results (in chunk order);
+    # with executor='process', `func` must be picklable (i.e. defined at module level)
+    max_workers = max_workers or os.cpu_count() or 1
+    # a few chunks per worker even out uneven work
+    parts = partition(months, chunks or max_workers * 4)
+
+    if isinstance(executor, concurrent.futures.Executor):
+        return merge(list(executor.map(func, parts)))
+
+    if executor == 'process':
+        pool = concurrent.futures.ProcessPoolExecutor(max_workers=max_workers)
+    elif executor == 'thread':
+        pool = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
+    else:
+        raise ValueError(f"executor must be 'process', 'thread' or an Executor, not {executor!r}")
+
+    with pool:
+        return merge(list(pool.map(func, parts)))
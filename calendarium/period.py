@@ -0,0 +1,184 @@
+import datetime
+from typing import Iterator
+
+from calendarium.date_range import DateRange
+
+# shared base of calendar periods with integer ordinals (Week, Quarter, Year);
+# subclasses implement `ord()`, `from_ord()`, `for_date()`, `start_date` and `days()`
+
+
+class Period:
+    __slots__ = ()
+
+    # set by subclasses
+    Delta = None
+
+    @classmethod
+    def today(cls) -> 'Period':
+        return cls.for_date(datetime.date.today())
+
+    @property
+    def end_date(self) -> datetime.date:
+        # first date after the period, except for the very last one (max date!)
+        next_ord = self.start_date.toordinal() + self.days()
+        return datetime.date.fromordinal(min(next_ord, datetime.date.max.toordinal()))
+
+    @property
+    def last_date(self) -> datetime.date:
+        return datetime.date.fromordinal(self.start_date.toordinal() + self.days() - 1)
+
+    def __len__(self) -> int:
+        return self.days()
+
+    def __iter__(self) -> Iterator[datetime.date]:
+        return iter(DateRange(self))
+
+    def __contains__(self, date) -> bool:
+        if isinstance(date, datetime.date):
+            start_ord = self.start_date.toordinal()
+            return start_ord <= date.toordinal() < start_ord + self.days()
+
+        return self.start_date <= date < self.end_date
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, type(self)):
+            return self.ord() == other.ord()
+
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self.ord())
+
+    def __lt__(self, other) -> bool:
+        if isinstance(other, type(self)):
+            return self.ord() < other.ord()
+
+        return NotImplemented
+
+    def __le__(self, other) -> bool:
+        if isinstance(other, type(self)):
+            return self.ord() <= other.ord()
+
+        return NotImplemented
+
+    def __gt__(self, other) -> bool:
+        if isinstance(other, type(self)):
+            return self.ord() > other.ord()
+
+        return NotImplemented
+
+    def __ge__(self, other) -> bool:
+        if isinstance(other, type(self)):
+            return self.ord() >= other.ord()
+
+        return NotImplemented
+
+    def __add__(self, other):
+        # period + delta
+        if isinstance(other, self.Delta):
+            return type(self).from_ord(self.ord() + other.count)
+
+        return NotImplemented
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        # period - period
+        if isinstance(other, type(self)):
+            return self.Delta(self.ord() - other.ord())
+
+        # period - delta
+        if isinstance(other, self.Delta):
+            return type(self).from_ord(self.ord() - other.count)
+
+        return NotImplemented
+
+
+class PeriodDelta:
+    # number of periods between two periods of the same type
+
+    __slots__ = ('count',)
+
+    # set by subclasses
+    Period = None
+
+    def __init__(self, count: int = 0):
+        self.count = int(count)
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({self.count!r})'
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, type(self)):
+            return self.count == other.count
+
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash((type(self).__name__, self.count))
+
+    def __lt__(self, other) -> bool:
+        if isinstance(other, type(self)):
+            return self.count < other.count
+
+        return NotImplemented
+
+    def __le__(self, other) -> bool:
+        if isinstance(other, type(self)):
+            return self.count <= other.count
+
+        return NotImplemented
+
+    def __gt__(self, other) -> bool:
+        if isinstance(other, type(self)):
+            return self.count > other.count
+
+        return NotImplemented
+
+    def __ge__(self, other) -> bool:
+        if isinstance(other, type(self)):
+            return self.count >= other.count
+
+        return NotImplemented
+
+    def __bool__(self) -> bool:
+        return bool(self.count)
+
+    def __neg__(self) -> 'PeriodDelta':
+        return type(self)(-self.count)
+
+    def __abs__(self) -> 'PeriodDelta':
+        return type(self)(abs(self.count))
+
+    def __add__(self, other):
+        # delta + period
+        if isinstance(other, self.Period):
+            return other + self
+
+        # delta + delta
+        if isinstance(other, type(self)):
+            return type(self)(self.count + other.count)
+
+        return NotImplemented
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        if isinstance(other, type(self)):
+            return type(self)(self.count - other.count)
+
+        return NotImplemented
+
+    def __mul__(self, other):
+        if isinstance(other, int):
+            return type(self)(self.count * other)
+
+        return NotImplemented
+
+    __rmul__ = __mul__
+
+    def __floordiv__(self, other):
+        if isinstance(other, int):
+            return type(self)(self.count // other)
+
+        return NotImplemented
@@ -0,0 +1,128 @@
+from array import array
+import datetime
+from itertools import repeat
+from typing import Iterable, Iterator, Union
+
+from calendarium.month import cycle_tables
+from calendarium.month import CYCLE_DAYS
+from calendarium.month import CYCLE_MONTHS
+from calendarium.month import Month
+
+# how the covered part of a month is turned into a fraction of a monthly amount:
+# 'actual/actual' - covered days / days in the month
+# '30/360'        - covered days counted as in 30E/360 (every month has 30 days) / 30
+# 'actual/365'    - covered days * 12 / 365 (may be slightly above 1 for a whole month)
+DAY_COUNT_CONVENTIONS = ('actual/actual', '30/360', 'actual/365')
+
+
+def _check_policy(policy: str) -> None:
+    if policy not in DAY_COUNT_CONVENTIONS:
+        raise ValueError(f"unknown day-count convention {policy!r}")
+
+
+def _fraction(policy: str, start_index: int, end_index: int, month_days: int) -> float:
+    # fraction of a month covered by its days [start_index, end_index) (0-based)
+    if policy == 'actual/actual':
+        return (end_index - start_index) / month_days
+
+    if policy == 'actual/365':
+        return (end_index - start_index) * 12 / 365
+
+    # 30E/360: days 31 count as 30, reaching the end of the month counts as reaching day 31
+    end_day = 31 if end_index == month_days else min(end_index + 1, 30)
+    return (end_day - min(start_index + 1, 30)) / 30
+
+
+def _pieces(start_ord: int, end_ord: int, policy: str) -> Iterator[tuple[int, int, float]]:
+    # (month ord, days, fraction) for each month overlapping [start_ord, end_ord) of `date.toordinal()`;
+    # walks months, not days
+    if end_ord <= start_ord:
+        return
+
+    days_in_month, days_before, _ = cycle_tables()
+    first = Month.for_date(datetime.date.fromordinal(start_ord)).ord()
+    last = Month.for_date(datetime.date.fromordinal(end_ord - 1)).ord()
+
+    for ord_ in range(first, last + 1):
+        cycle, index = divmod(ord_ - Month.MIN_ORD, CYCLE_MONTHS)
+        month_start = cycle * CYCLE_DAYS + days_before[index] + 1
+        month_days = days_in_month[index]
+        start_index = max(start_ord, month_start) - month_start
+        end_index = min(end_ord - month_start, month_days)
+        yield ord_, end_index - start_index, _fraction(policy, start_index, end_index, month_days)
+
+
+def prorate(
+    start: datetime.date,
+    end: datetime.date,
+    amount: float = 1.0,
+    policy: str = 'actual/actual'
+) -> list[tuple[Month, int, float]]:
+    # split [start, end) into (month, covered days, monthly amount * covered fraction) pieces;
+    # with the default amount the last item is the covered fraction itself
+    _check_policy(policy)
+
+    return [
+        (Month.from_ord(ord_), days, amount * fraction)
+        for ord_, days, fraction in _pieces(start.toordinal(), end.toordinal(), policy)
+    ]
+
+
+def prorate_many(
+    starts: Iterable[datetime.date],
+    ends: Iterable[datetime.date],
+    amounts: Union[float, Iterable[float]] = 1.0,
+    policy: str = 'actual/actual'
+):
+    # columnar pieces of many intervals: (interval indexes, month ords, days, prorated amounts);
+    # numpy datetime64 arrays -> vectorized ndarrays, other iterables -> arrays ('i', 'i', 'i', 'd')
+    _check_policy(policy)
+
+    if getattr(getattr(starts, 'dtype', None), 'kind', None) == 'M':
+        return _prorate_numpy(starts, ends, amounts, policy)
+
+    if isinstance(amounts, (int, float)):
+        amounts = repeat(amounts)
+
+    indexes, ords, days, values = array('i'), array('i'), array('i'), array('d')
+    for interval, (start, end, amount) in enumerate(zip(starts, ends, amounts)):
+        for ord_, piece_days, fraction in _pieces(start.toordinal(), end.toordinal(), policy):
+            indexes.append(interval)
+            ords.append(ord_)
+            days.append(piece_days)
+            values.append(amount * fraction)
+
+    return indexes, ords, days, values
+
+
+def _prorate_numpy(starts, ends, amounts, policy: str):
+    import numpy as np
+
+    starts = starts.astype('datetime64[D]')
+    ends = np.asarray(ends).astype('datetime64[D]')
+    amounts = np.broadcast_to(np.asarray(amounts, dtype=np.float64), starts.shape)
+
+    # Month.EPOCH is also the epoch of datetime64
+    first = starts.astype('datetime64[M]').astype(np.int64)
+    last = (ends - 1).astype('datetime64[M]').astype(np.int64)
+    counts = np.where(ends > starts, last - first + 1, 0)
+
+    indexes = np.repeat(np.arange(len(starts)), counts)
+    offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    ords = first[indexes] + offsets
+
+    month_starts = ords.astype('datetime64[M]').astype('datetime64[D]')
+    month_days = ((ords + 1).astype('datetime64[M]').astype('datetime64[D]') - month_starts).astype(np.int64)
+    start_index = (np.maximum(starts[indexes], month_starts) - month_starts).astype(np.int64)
+    end_index = np.minimum((ends[indexes] - month_starts).astype(np.int64), month_days)
+    days = end_index - start_index
+
+    if policy == 'actual/actual':
+        fractions = days / month_days
+    elif policy == 'actual/365':
+        fractions = days * 12 / 365
+    else:
+        end_day = np.where(end_index == month_days, 31, np.minimum(end_index + 1, 30))
+        fractions = (end_day - np.minimum(start_index + 1, 30)) / 30
+
+    return indexes, ords.astype(np.int32), days, amounts[indexes] * fractions
@@ -0,0 +1,91 @@
+import datetime
+import re
+
+from calendarium.month import DAYS_IN_MONTH
+from calendarium.month import is_leap_year
+from calendarium.month import Month
+from calendarium.month import MonthDelta
+from calendarium.period import Period
+from calendarium.period import PeriodDelta
+
+
+class Quarter(Period):
+    __slots__ = ('year', 'quarter')
+
+    def __init__(self, year: int, quarter: int):
+        self.year = int(year)
+        self.quarter = int(quarter)
+
+        if not datetime.MINYEAR <= self.year <= datetime.MAXYEAR:
+            raise ValueError(f"year {self.year} is out of range")
+        if not 1 <= self.quarter <= 4:
+            raise ValueError("quarter must be in 1..4")
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({self.year!r}, {self.quarter!r})'
+
+    def __str__(self) -> str:
+        return f'{self.year:04d}-Q{self.quarter}'
+
+    @classmethod
+    def from_str(cls, quarter_string: str) -> 'Quarter':
+        match = re.fullmatch(r'([0-9]{4})-Q([1-4])', quarter_string)
+        if not match:
+            raise ValueError(f"invalid quarter string {quarter_string!r}")
+
+        return cls(int(match[1]), int(match[2]))
+
+    EPOCH = (1970, 1)
+    EPOCH_Y, EPOCH_Q = EPOCH
+
+    def ord(self) -> int:
+        return (self.year - self.EPOCH_Y) * 4 + (self.quarter - self.EPOCH_Q)
+
+    @classmethod
+    def from_ord(cls, ord_: int) -> 'Quarter':
+        year, quarter = divmod(ord_, 4)
+        return cls(year + cls.EPOCH_Y, quarter + cls.EPOCH_Q)
+
+    @classmethod
+    def for_date(cls, date: datetime.date) -> 'Quarter':
+        return cls(date.year, (date.month + 2) // 3)
+
+    @classmethod
+    def for_month(cls, month: Month) -> 'Quarter':
+        return cls(month.year, (month.month + 2) // 3)
+
+    @property
+    def first_month(self) -> Month:
+        return Month(self.year, self.quarter * 3 - 2)
+
+    @property
+    def last_month(self) -> Month:
+        return Month(self.year, self.quarter * 3)
+
+    def months(self) -> list[Month]:
+        return [Month(self.year, month) for month in range(self.quarter * 3 - 2, self.quarter * 3 + 1)]
+
+    @property
+    def start_date(self) -> datetime.date:
+        return datetime.date(self.year, self.quarter * 3 - 2, 1)
+
+    def days(self) -> int:
+        # only Q1 contains February
+        return sum(DAYS_IN_MONTH[self.quarter * 3 - 3:self.quarter * 3]) + (self.quarter == 1 and is_leap_year(self.year))
+
+
+class QuarterDelta(PeriodDelta):
+    __slots__ = ()
+
+    Period = Quarter
+
+    @property
+    def quarters(self) -> int:
+        return self.count
+
+    def __str__(self) -> str:
+        # ISO 8601 has no quarters -> 3 months each
+        return str(MonthDelta(self.count * 3))
+
+
+Quarter.Delta = QuarterDelta
@@ -0,0 +1,108 @@
+from collections import deque
+from typing import Iterable, Iterator, Optional, Union
+
+from calendarium.month import Month
+from calendarium.month import MonthDelta
+
+REDUCERS = ('sum', 'mean', 'min', 'max', 'count')
+
+
+class RollingWindow:
+    # Trailing window of `size` months ending at the last pushed month, updated incrementally:
+    # values are kept in a deque keyed by `Month.ord()` and evicted once they fall out of the window,
+    # sum and mean use a running total, min and max a monotonic deque. Memory is bounded by `size`.
+
+    __slots__ = ('size', 'reducer', '_values', '_extremes', '_total', '_last_ord')
+
+    def __init__(self, size: Union[MonthDelta, int], reducer: str = 'sum'):
+        if isinstance(size, MonthDelta):
+            size = size.total_months()
+
+        self.size = int(size)
+        if self.size < 1:
+            raise ValueError("size must be positive")
+
+        if reducer not in REDUCERS:
+            raise ValueError(f"unknown reducer {reducer!r}")
+        self.reducer = reducer
+
+        # (ord, value) of months in the window that have a value
+        self._values = deque()
+        # (ord, value) candidates for min/max, values increasing (min) or decreasing (max)
+        self._extremes = deque()
+        self._total = 0
+        self._last_ord = None
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({self.size!r}, {self.reducer!r})'
+
+    @property
+    def month(self) -> Optional[Month]:
+        # last pushed month, i.e. the end of the window
+        return Month.from_ord(self._last_ord) if self._last_ord is not None else None
+
+    def push(self, month: Month, value=None) -> None:
+        # move the window to end at `month` (months must be ascending); value None marks a gap
+        ord_ = month.ord()
+        if self._last_ord is not None and ord_ <= self._last_ord:
+            raise ValueError("months must be ascending")
+        self._last_ord = ord_
+
+        horizon = ord_ - self.size
+        values = self._values
+        while values and values[0][0] <= horizon:
+            self._total -= values.popleft()[1]
+        extremes = self._extremes
+        while extremes and extremes[0][0] <= horizon:
+            extremes.popleft()
+
+        if value is None:
+            return
+
+        values.append((ord_, value))
+        if self.reducer in ('sum', 'mean'):
+            self._total += value
+        elif self.reducer == 'min':
+            while extremes and extremes[-1][1] >= value:
+                extremes.pop()
+            extremes.append((ord_, value))
+        elif self.reducer == 'max':
+            while extremes and extremes[-1][1] <= value:
+                extremes.pop()
+            extremes.append((ord_, value))
+
+    def result(self):
+        # sum and count of an empty window are 0, mean, min and max are None
+        if self.reducer == 'count':
+            return len(self._values)
+        if self.reducer == 'sum':
+            return self._total
+        if not self._values:
+            return None
+        if self.reducer == 'mean':
+            return self._total / len(self._values)
+        return self._extremes[0][1]
+
+
+def rolling(
+    series: Iterable[tuple[Month, object]],
+    size: Union[MonthDelta, int],
+    reducer: str = 'sum',
+    fill_value=None
+) -> Iterator[tuple[Month, object]]:
+    # (month, result) for each month from the first to the last month of an ascending series,
+    # including missing months, which are gaps unless `fill_value` is given
+    window = RollingWindow(size, reducer)
+    last_ord = None
+
+    for month, value in series:
+        ord_ = month.ord()
+        if last_ord is not None:
+            for gap_ord in range(last_ord + 1, ord_):
+                gap = Month.from_ord(gap_ord)
+                window.push(gap, fill_value)
+                yield gap, window.result()
+
+        window.push(month, value)
+        last_ord = ord_
+        yield month, window.result()
@@ -0,0 +1,128 @@
+import datetime
+import re
+
+from calendarium.month import CYCLE_DAYS
+from calendarium.month import MAX_DATE_ORDINAL
+from calendarium.period import Period
+from calendarium.period import PeriodDelta
+
+
+def _year_start_ordinal(year: int) -> int:
+    # same as `datetime.date(year, 1, 1).toordinal()`, also for year 10000
+    y = year - 1
+    return y * 365 + y // 4 - y // 100 + y // 400 + 1
+
+
+def _iso_year_start_ordinal(year: int) -> int:
+    # Monday of ISO week 1, which contains January 4 (ordinal 1 is a Monday)
+    january_4 = _year_start_ordinal(year) + 3
+    return january_4 - (january_4 - 1) % 7
+
+
+def _iso_weeks_in_year(year: int) -> int:
+    return (_iso_year_start_ordinal(year + 1) - _iso_year_start_ordinal(year)) // 7
+
+
+class Week(Period):
+    # ISO 8601 week (Monday to Sunday) in ISO week-numbering year
+
+    # immutable: year and week are read-only properties, so that `_ord` stays consistent
+    __slots__ = ('_year', '_week', '_ord')
+
+    def __init__(self, year: int, week: int):
+        self._year = year = int(year)
+        self._week = week = int(week)
+
+        if not datetime.MINYEAR <= year <= datetime.MAXYEAR:
+            raise ValueError(f"year {year} is out of range")
+        weeks_in_year = _iso_weeks_in_year(year)
+        if not 1 <= week <= weeks_in_year:
+            raise ValueError(f"week must be in 1..{weeks_in_year}")
+
+        # precomputed for hashing and comparisons, without going through datetime
+        monday_ord = _iso_year_start_ordinal(year) + (week - 1) * 7
+        self._ord = (monday_ord - self.EPOCH_ORDINAL) // 7
+
+    @classmethod
+    def _from_valid(cls, year: int, week: int, ord_: int) -> 'Week':
+        week_ = cls.__new__(cls)
+        week_._year = year
+        week_._week = week
+        week_._ord = ord_
+        return week_
+
+    @property
+    def year(self) -> int:
+        return self._year
+
+    @property
+    def week(self) -> int:
+        return self._week
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({self.year!r}, {self.week!r})'
+
+    def __str__(self) -> str:
+        return f'{self.year:04d}-W{self.week:02d}'
+
+    @classmethod
+    def from_str(cls, week_string: str) -> 'Week':
+        match = re.fullmatch(r'([0-9]{4})-W([0-9]{2})', week_string)
+        if not match:
+            raise ValueError(f"invalid week string {week_string!r}")
+
+        return cls(int(match[1]), int(match[2]))
+
+    # Monday of 1970-W01
+    EPOCH_DATE = datetime.date(1969, 12, 29)
+    EPOCH_ORDINAL = EPOCH_DATE.toordinal()
+
+    def ord(self) -> int:
+        return self._ord
+
+    @classmethod
+    def from_ord(cls, ord_: int) -> 'Week':
+        ord_ = int(ord_)
+        monday_ord = cls.EPOCH_ORDINAL + ord_ * 7
+        if not 1 <= monday_ord <= MAX_DATE_ORDINAL:
+            raise ValueError(f"week ordinal {ord_} is out of range")
+
+        # ISO year is the calendar year of the Thursday
+        thursday_ord = monday_ord + 3
+        year = thursday_ord * 400 // CYCLE_DAYS + 1
+        if _year_start_ordinal(year) > thursday_ord:
+            year -= 1
+        elif _year_start_ordinal(year + 1) <= thursday_ord:
+            year += 1
+
+        return cls._from_valid(year, (monday_ord - _iso_year_start_ordinal(year)) // 7 + 1, ord_)
+
+    @classmethod
+    def for_date(cls, date: datetime.date) -> 'Week':
+        year, week, _ = date.isocalendar()
+        return cls(year, week)
+
+    @property
+    def start_date(self) -> datetime.date:
+        return datetime.date.fromordinal(self.EPOCH_ORDINAL + self._ord * 7)
+
+    def days(self) -> int:
+        # the last week (9999-W52) is cut short by the max date
+        return min(7, MAX_DATE_ORDINAL - (self.EPOCH_ORDINAL + self._ord * 7) + 1)
+
+
+class WeekDelta(PeriodDelta):
+    __slots__ = ()
+
+    Period = Week
+
+    @property
+    def weeks(self) -> int:
+        return self.count
+
+    def __str__(self) -> str:
+        sign = '-' if self.count < 0 else ''
+        return f'{sign}P{abs(self.count)}W'
+
+
+Week.Delta = WeekDelta
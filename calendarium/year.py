@@ -0,0 +1,86 @@
+import datetime
+import re
+
+from calendarium.month import is_leap_year
+from calendarium.month import Month
+from calendarium.month import MonthWeeks
+from calendarium.period import Period
+from calendarium.period import PeriodDelta
+from calendarium.quarter import Quarter
+
+
+class Year(Period):
+    __slots__ = ('year',)
+
+    def __init__(self, year: int):
+        self.year = int(year)
+
+        if not datetime.MINYEAR <= self.year <= datetime.MAXYEAR:
+            raise ValueError(f"year {self.year} is out of range")
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({self.year!r})'
+
+    def __str__(self) -> str:
+        return f'{self.year:04d}'
+
+    @classmethod
+    def from_str(cls, year_string: str) -> 'Year':
+        if not re.fullmatch(r'[0-9]{4}', year_string):
+            raise ValueError(f"invalid year string {year_string!r}")
+
+        return cls(int(year_string))
+
+    EPOCH = 1970
+
+    def ord(self) -> int:
+        return self.year - self.EPOCH
+
+    @classmethod
+    def from_ord(cls, ord_: int) -> 'Year':
+        return cls(ord_ + cls.EPOCH)
+
+    @classmethod
+    def for_date(cls, date: datetime.date) -> 'Year':
+        return cls(date.year)
+
+    @classmethod
+    def for_month(cls, month: Month) -> 'Year':
+        return cls(month.year)
+
+    @property
+    def start_date(self) -> datetime.date:
+        return datetime.date(self.year, 1, 1)
+
+    def is_leap(self) -> bool:
+        return is_leap_year(self.year)
+
+    def days(self) -> int:
+        return 365 + self.is_leap()
+
+    def months(self) -> list[Month]:
+        return [Month(self.year, month) for month in range(1, 13)]
+
+    def month_weeks(self, firstweekday: int = 0) -> list[MonthWeeks]:
+        # calendar grids of all months, e.g. for a year view
+        return Month.weeks_many(self.months(), firstweekday)
+
+    def quarters(self) -> list[Quarter]:
+        return [Quarter(self.year, quarter) for quarter in range(1, 5)]
+
+
+class YearDelta(PeriodDelta):
+    __slots__ = ()
+
+    Period = Year
+
+    @property
+    def years(self) -> int:
+        return self.count
+
+    def __str__(self) -> str:
+        sign = '-' if self.count < 0 else ''
+        return f'{sign}P{abs(self.count)}Y'
+
+
+Year.Delta = YearDelta
@@ -0,0 +1,120 @@
+import datetime
+import random
+
+import pytest
+
+from calendarium.business_calendar import BusinessCalendar
+from calendarium.month import Month
+
+
+def d(year: int, month: int, day: int) -> datetime.date:
+    return datetime.date(year, month, day)
+
+
+HOLIDAYS = [d(2022, 1, 1), d(2022, 4, 15), d(2022, 4, 18), d(2022, 5, 1), d(2022, 12, 24), d(2022, 12, 26)]
+
+
+def test_weekmask():
+    assert BusinessCalendar().weekmask == (True, True, True, True, True, False, False)
+    assert BusinessCalendar('Sun Mon Tue Wed Thu').weekmask == (True, True, True, True, False, False, True)
+    assert BusinessCalendar([1, 1, 1, 1, 0, 0, 0]).days_per_week == 4
+
+    with pytest.raises(ValueError) as exc_info:
+        BusinessCalendar('Mon Fry')
+    assert str(exc_info.value) == "invalid weekmask 'Mon Fry'"
+
+    with pytest.raises(ValueError) as exc_info:
+        BusinessCalendar([1, 1])
+    assert str(exc_info.value) == "weekmask must have 7 days"
+
+    with pytest.raises(ValueError) as exc_info:
+        BusinessCalendar('0000000')
+    assert str(exc_info.value) == "weekmask must contain at least one business day"
+
+
+def test_holidays():
+    # holidays on weekends are ignored
+    calendar = BusinessCalendar(holidays=HOLIDAYS)
+    assert calendar.holidays == [d(2022, 4, 15), d(2022, 4, 18), d(2022, 12, 26)]
+    assert repr(BusinessCalendar(holidays=[d(2022, 4, 15)])) == \
+           "BusinessCalendar('1111100', holidays=[datetime.date(2022, 4, 15)])"
+
+
+def test_is_business_day():
+    calendar = BusinessCalendar(holidays=HOLIDAYS)
+    assert calendar.is_business_day(d(2022, 4, 14))
+    assert not calendar.is_business_day(d(2022, 4, 15))
+    assert not calendar.is_business_day(d(2022, 4, 16))
+    assert not calendar.is_business_day(d(2022, 4, 17))
+    assert not calendar.is_business_day(d(2022, 4, 18))
+    assert calendar.is_business_day(d(2022, 4, 19))
+    assert calendar.is_business_day_many([d(2022, 4, 14), d(2022, 4, 15)]) == [True, False]
+
+
+def test_business_days():
+    calendar = BusinessCalendar(holidays=HOLIDAYS)
+    assert calendar.business_days(Month(2022, 4)) == 19
+    assert calendar.business_days(Month(2022, 2)) == 20
+    assert calendar.business_days(Month(1, 1)) == 23
+    assert [calendar.business_days(Month(2022, m)) for m in range(1, 13)] == \
+           [sum(calendar.is_business_day(date) for date in Month(2022, m)) for m in range(1, 13)]
+
+
+def test_month_bitmap():
+    calendar = BusinessCalendar(holidays=HOLIDAYS)
+    bitmap = calendar.month_bitmap(Month(2022, 4))
+    assert [day for day in range(1, 31) if bitmap >> (day - 1) & 1] == \
+           [date.day for date in Month(2022, 4) if calendar.is_business_day(date)]
+    assert bin(bitmap).count('1') == calendar.business_days(Month(2022, 4))
+
+
+def test_business_days_between():
+    calendar = BusinessCalendar(holidays=HOLIDAYS)
+    assert calendar.business_days_between(d(2022, 4, 11), d(2022, 4, 25)) == 8
+    assert calendar.business_days_between(d(2022, 4, 25), d(2022, 4, 11)) == -8
+    assert calendar.business_days_between(d(2022, 4, 11), d(2022, 4, 11)) == 0
+    assert calendar.business_days_between_many([d(2022, 4, 11)], [d(2022, 4, 12)]) == [1]
+
+
+def test_add_business_days():
+    calendar = BusinessCalendar(holidays=HOLIDAYS)
+    assert calendar.add_business_days(d(2022, 4, 14), 0) == d(2022, 4, 14)
+    assert calendar.add_business_days(d(2022, 4, 14), 1) == d(2022, 4, 19)
+    assert calendar.add_business_days(d(2022, 4, 19), -1) == d(2022, 4, 14)
+    # rolled forward / backward first
+    assert calendar.add_business_days(d(2022, 4, 16), 0) == d(2022, 4, 19)
+    assert calendar.add_business_days(d(2022, 4, 16), 1) == d(2022, 4, 20)
+    assert calendar.add_business_days(d(2022, 4, 16), -1) == d(2022, 4, 13)
+    assert calendar.add_business_days_many([d(2022, 4, 14), d(2022, 4, 14)], [1, 2]) == [d(2022, 4, 19), d(2022, 4, 20)]
+
+
+def test_add_business_days_long_holiday_block():
+    first = d(2000, 1, 3).toordinal()
+    holidays = [datetime.date.fromordinal(first + day) for day in range(3000)]
+    calendar = BusinessCalendar(holidays=holidays)
+    after = datetime.date.fromordinal(first + 3000)
+    assert calendar.add_business_days(d(1999, 12, 31), 1) == after
+    assert calendar.add_business_days(d(2000, 1, 3), 0) == after
+    assert calendar.add_business_days(after, -1) == d(1999, 12, 31)
+    assert calendar.business_days_between(d(1999, 12, 31), after) == 1
+
+
+def test_against_numpy():
+    np = pytest.importorskip('numpy')
+    rng = random.Random(1)
+    first = d(2020, 1, 1).toordinal()
+    holidays = [datetime.date.fromordinal(first + rng.randrange(1500)) for _ in range(60)]
+
+    for weekmask in ['1111100', '1111110', '0111011', '0000001']:
+        calendar = BusinessCalendar(weekmask, holidays)
+        np_calendar = np.busdaycalendar(weekmask=weekmask, holidays=holidays)
+        for _ in range(300):
+            a = datetime.date.fromordinal(first + rng.randrange(1500))
+            b = datetime.date.fromordinal(first + rng.randrange(1500))
+            n = rng.randrange(-50, 50)
+            a, b = min(a, b), max(a, b)
+            assert calendar.business_days_between(a, b) == np.busday_count(a, b, busdaycal=np_calendar)
+            assert calendar.is_business_day(a) == np.is_busday(a, busdaycal=np_calendar)
+            roll = 'forward' if n >= 0 else 'backward'
+            expected = np.busday_offset(a, n, roll=roll, busdaycal=np_calendar).astype(datetime.date)
+            assert calendar.add_business_days(a, n) == expected
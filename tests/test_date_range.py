@@ -0,0 +1,266 @@
+import datetime
+import itertools
+
+import pytest
+
+from calendarium.date_range import DateRange
+from calendarium.date_range import expand_ranges
+from calendarium.month import Month
+
+
+def d(year: int, month: int, day: int) -> datetime.date:
+    return datetime.date(year, month, day)
+
+
+def test_init():
+    dr = DateRange(d(2022, 1, 1), d(2022, 1, 10))
+    assert dr.start_date == d(2022, 1, 1)
+    assert dr.end_date == d(2022, 1, 10)
+    assert dr.step == 1
+
+    assert DateRange(d(2022, 1, 1), d(2022, 2, 1), datetime.timedelta(weeks=1)).step == 7
+    assert DateRange(Month(2022, 1)) == DateRange(d(2022, 1, 1), d(2022, 2, 1))
+    assert DateRange(DateRange(Month(2022, 1))) == DateRange(Month(2022, 1))
+
+
+def test_init_step_validation():
+    with pytest.raises(ValueError) as exc_info:
+        DateRange(d(2022, 1, 1), d(2022, 1, 10), 0)
+    assert str(exc_info.value) == "step must not be zero"
+
+    with pytest.raises(ValueError) as exc_info:
+        DateRange(d(2022, 1, 1), d(2022, 1, 10), datetime.timedelta(hours=36))
+    assert str(exc_info.value) == "step must be a whole number of days"
+
+
+def test_repr():
+    assert repr(DateRange(d(2022, 1, 1), d(2022, 1, 10))) == \
+           'DateRange(datetime.date(2022, 1, 1), datetime.date(2022, 1, 10))'
+    assert repr(DateRange(d(2022, 1, 1), d(2022, 1, 10), 3)) == \
+           'DateRange(datetime.date(2022, 1, 1), datetime.date(2022, 1, 10), 3)'
+
+
+def test_span():
+    dr = DateRange(d(2022, 1, 1), datetime.timedelta(days=9))
+    assert dr == DateRange(d(2022, 1, 1), d(2022, 1, 10))
+    assert dr.span == datetime.timedelta(days=9)
+
+    with pytest.raises(ValueError) as exc_info:
+        DateRange(d(9999, 12, 1), datetime.timedelta(days=32))
+    assert str(exc_info.value) == "stop is out of range"
+
+    with pytest.raises(ValueError) as exc_info:
+        DateRange(d(2022, 1, 1), datetime.timedelta(hours=36))
+    assert str(exc_info.value) == "stop must be a whole number of days"
+
+
+def test_last_day_of_calendar():
+    dr = DateRange(Month(9999, 12))
+    assert d(9999, 12, 31) in dr
+    assert len(dr) == 31
+    assert dr.span == datetime.timedelta(days=31)
+
+    with pytest.raises(ValueError) as exc_info:
+        dr.end_date
+    assert str(exc_info.value) == "end date is out of range"
+
+    assert repr(dr) == 'DateRange(datetime.date(9999, 12, 1), datetime.timedelta(days=31))'
+    assert eval(repr(dr)) == dr
+
+
+def test_first_day_of_calendar():
+    dr = DateRange(d(1, 1, 1), d(1, 1, 5))[::-1]
+    assert list(dr) == [d(1, 1, 4), d(1, 1, 3), d(1, 1, 2), d(1, 1, 1)]
+    assert dr.span == datetime.timedelta(days=-4)
+
+    with pytest.raises(ValueError) as exc_info:
+        dr.end_date
+    assert str(exc_info.value) == "end date is out of range"
+
+    assert repr(dr) == 'DateRange(datetime.date(1, 1, 4), datetime.timedelta(days=-4), -1)'
+    assert eval(repr(dr)) == dr
+
+
+def test_iter():
+    assert list(DateRange(d(2022, 1, 30), d(2022, 2, 2))) == \
+           [d(2022, 1, 30), d(2022, 1, 31), d(2022, 2, 1)]
+    assert list(DateRange(d(2022, 1, 1), d(2022, 1, 20), datetime.timedelta(weeks=1))) == \
+           [d(2022, 1, 1), d(2022, 1, 8), d(2022, 1, 15)]
+    assert list(DateRange(d(2022, 1, 3), d(2022, 1, 1), -1)) == [d(2022, 1, 3), d(2022, 1, 2)]
+    assert list(DateRange(d(2022, 1, 3), d(2022, 1, 1))) == []
+
+
+def test_reversed():
+    assert list(reversed(DateRange(d(2022, 1, 30), d(2022, 2, 2)))) == \
+           [d(2022, 2, 1), d(2022, 1, 31), d(2022, 1, 30)]
+
+
+def test_len():
+    assert len(DateRange(Month(2022, 2))) == 28
+    assert len(DateRange(Month(2024, 2))) == 29
+    assert len(DateRange(d(1900, 1, 1), d(2100, 1, 1))) == 73049
+    assert len(DateRange(d(2022, 1, 1), d(2022, 1, 20), 7)) == 3
+    assert len(DateRange(d(2022, 1, 3), d(2022, 1, 1))) == 0
+    assert not DateRange(d(2022, 1, 3), d(2022, 1, 1))
+    assert DateRange(d(2022, 1, 1), d(2022, 1, 3))
+
+
+def test_contains():
+    dr = DateRange(d(2000, 1, 1), d(2100, 1, 1))
+    assert d(2000, 1, 1) in dr
+    assert d(2099, 12, 31) in dr
+    assert d(2100, 1, 1) not in dr
+    assert d(1999, 12, 31) not in dr
+    assert 730120 not in dr
+
+    weekly = DateRange(d(2022, 1, 1), d(2023, 1, 1), 7)
+    assert d(2022, 1, 8) in weekly
+    assert d(2022, 1, 9) not in weekly
+
+
+def test_getitem():
+    dr = DateRange(d(2022, 1, 1), d(2022, 2, 1))
+    assert dr[0] == d(2022, 1, 1)
+    assert dr[30] == d(2022, 1, 31)
+    assert dr[-1] == d(2022, 1, 31)
+    with pytest.raises(IndexError):
+        _ = dr[31]
+
+    assert dr[10:13] == DateRange(d(2022, 1, 11), d(2022, 1, 14))
+    assert dr[::7] == DateRange(d(2022, 1, 1), d(2022, 2, 1), 7)
+    assert list(dr[2::-1]) == [d(2022, 1, 3), d(2022, 1, 2), d(2022, 1, 1)]
+    assert dr[::10].end_date == d(2022, 2, 1)
+
+
+def test_index_count():
+    dr = DateRange(d(2022, 1, 1), d(2022, 2, 1), 2)
+    assert dr.index(d(2022, 1, 1)) == 0
+    assert dr.index(d(2022, 1, 5)) == 2
+    assert dr.count(d(2022, 1, 5)) == 1
+    assert dr.count(d(2022, 1, 6)) == 0
+
+    with pytest.raises(ValueError) as exc_info:
+        dr.index(d(2022, 1, 6))
+    assert str(exc_info.value) == "datetime.date(2022, 1, 6) is not in range"
+
+
+def test_eq_hash():
+    assert DateRange(d(2022, 1, 1), d(2022, 1, 10)) == DateRange(d(2022, 1, 1), d(2022, 1, 10))
+    assert DateRange(d(2022, 1, 1), d(2022, 1, 10)) != DateRange(d(2022, 1, 1), d(2022, 1, 11))
+    # same dates, different stop
+    assert DateRange(d(2022, 1, 1), d(2022, 1, 10), 3) == DateRange(d(2022, 1, 1), d(2022, 1, 9), 3)
+    assert hash(DateRange(d(2022, 1, 1), d(2022, 1, 10), 3)) == hash(DateRange(d(2022, 1, 1), d(2022, 1, 9), 3))
+    assert DateRange(d(2022, 1, 1), d(2022, 1, 10)) != (d(2022, 1, 1), d(2022, 1, 10))
+
+
+def test_intersection():
+    jan, feb = DateRange(Month(2022, 1)), DateRange(Month(2022, 2))
+    assert jan & feb == DateRange(d(2022, 1, 1), d(2022, 1, 1))
+    assert not jan & feb
+    assert DateRange(d(2022, 1, 20), d(2022, 2, 10)) & jan == DateRange(d(2022, 1, 20), d(2022, 2, 1))
+    assert jan.intersection(jan) == jan
+
+
+def test_intersection_steps():
+    base = d(2022, 1, 1)
+    for (a0, a1, a2), (b0, b1, b2) in itertools.product(
+        itertools.product(range(0, 6), range(8, 30, 7), (1, 2, 3, -2)),
+        itertools.product(range(0, 6), range(10, 30, 9), (1, 4, 6, -3)),
+    ):
+        if a2 < 0:
+            a0, a1 = a1, a0
+        if b2 < 0:
+            b0, b1 = b1, b0
+        a = DateRange(base + datetime.timedelta(a0), base + datetime.timedelta(a1), a2)
+        b = DateRange(base + datetime.timedelta(b0), base + datetime.timedelta(b1), b2)
+        assert list(a & b) == sorted(set(a) & set(b))
+
+
+def test_union():
+    jan, feb = DateRange(Month(2022, 1)), DateRange(Month(2022, 2))
+    assert jan | feb == DateRange(d(2022, 1, 1), d(2022, 3, 1))
+    assert jan.union(DateRange(d(2022, 1, 10), d(2022, 1, 12))) == jan
+    assert jan | DateRange(d(2022, 2, 1), d(2022, 2, 2)) == DateRange(d(2022, 1, 1), d(2022, 2, 2))
+    assert jan | DateRange(d(2022, 3, 1), d(2022, 3, 1)) == jan
+    assert DateRange(d(2022, 1, 1), d(2022, 1, 10), 3) | DateRange(d(2022, 1, 10), d(2022, 1, 20), 3) == \
+           DateRange(d(2022, 1, 1), d(2022, 1, 20), 3)
+
+    with pytest.raises(ValueError) as exc_info:
+        _ = jan | DateRange(Month(2022, 3))
+    assert str(exc_info.value) == "union of date ranges is not a date range"
+
+    with pytest.raises(ValueError):
+        _ = DateRange(d(2022, 1, 1), d(2022, 1, 10), 2) | DateRange(d(2022, 1, 2), d(2022, 1, 5), 2)
+
+
+def test_union_subset():
+    daily = DateRange(d(2022, 1, 1), d(2022, 1, 31))
+    weekly = DateRange(d(2022, 1, 1), d(2022, 1, 31), 7)
+    assert daily | weekly == daily
+    assert weekly | daily == daily
+    assert DateRange(d(2022, 1, 1), d(2022, 2, 1), 2) | DateRange(d(2022, 1, 5), d(2022, 1, 20), 4) == \
+           DateRange(d(2022, 1, 1), d(2022, 2, 1), 2)
+
+
+def test_union_singletons():
+    first, sixth = DateRange(d(2022, 1, 1), d(2022, 1, 2)), DateRange(d(2022, 1, 6), d(2022, 1, 7))
+    assert first | sixth == DateRange(d(2022, 1, 1), d(2022, 1, 7), 5)
+    assert sixth | first == DateRange(d(2022, 1, 1), d(2022, 1, 7), 5)
+    assert first | first == first
+    # interleaved ranges
+    assert DateRange(d(2022, 1, 1), d(2022, 1, 7), 2) | DateRange(d(2022, 1, 2), d(2022, 1, 8), 2) == \
+           DateRange(d(2022, 1, 1), d(2022, 1, 7))
+
+
+def test_iter_chunks():
+    dr = DateRange(d(2022, 1, 1), d(2022, 1, 8))
+    chunks = list(dr.iter_chunks(3))
+    assert chunks == [
+        [d(2022, 1, 1), d(2022, 1, 2), d(2022, 1, 3)],
+        [d(2022, 1, 4), d(2022, 1, 5), d(2022, 1, 6)],
+        [d(2022, 1, 7)],
+    ]
+    assert list(DateRange(d(2022, 1, 1), d(2022, 1, 1)).iter_chunks(3)) == []
+
+    with pytest.raises(ValueError) as exc_info:
+        next(dr.iter_chunks(0))
+    assert str(exc_info.value) == "size must be positive"
+
+
+def test_iter_chunks_numpy():
+    np = pytest.importorskip('numpy')
+    chunks = list(DateRange(Month(2022, 2)).iter_chunks(10, as_numpy=True))
+    assert [len(chunk) for chunk in chunks] == [10, 10, 8]
+    assert all(chunk.dtype == np.dtype('datetime64[D]') for chunk in chunks)
+    assert np.concatenate(chunks).tolist() == list(Month(2022, 2))
+
+
+def test_to_numpy():
+    np = pytest.importorskip('numpy')
+    for dr in [
+        DateRange(Month(2022, 2)),
+        DateRange(d(1, 1, 1), d(1, 1, 10)),
+        DateRange(d(2022, 1, 1), d(2022, 3, 1), 7),
+        DateRange(d(2022, 1, 10), d(2022, 1, 1), -2),
+        DateRange(d(2022, 1, 10), d(2022, 1, 1)),
+    ]:
+        array = dr.to_numpy()
+        assert array.dtype == np.dtype('datetime64[D]')
+        assert array.tolist() == list(dr)
+
+
+def test_expand_ranges():
+    pytest.importorskip('numpy')
+    months = [Month(2022, 1), Month(2022, 2), Month(2024, 2)]
+    dates, offsets = expand_ranges(months)
+    assert offsets.tolist() == [0, 31, 59, 88]
+    for i, month in enumerate(months):
+        assert dates[offsets[i]:offsets[i + 1]].tolist() == list(month)
+
+    dates, offsets = expand_ranges([DateRange(d(2022, 1, 1), d(2022, 1, 20), 7), DateRange(d(2022, 1, 1), d(2022, 1, 1))])
+    assert dates.tolist() == [d(2022, 1, 1), d(2022, 1, 8), d(2022, 1, 15)]
+    assert offsets.tolist() == [0, 3, 3]
+
+    dates, offsets = expand_ranges([])
+    assert dates.tolist() == []
+    assert offsets.tolist() == [0]
@@ -0,0 +1,135 @@
+import datetime
+
+import pytest
+
+from calendarium.date_range import DateRange
+from calendarium.fiscal_calendar import FiscalCalendar
+from calendarium.month import Month
+
+
+def test_month_based():
+    calendar = FiscalCalendar(4)
+    assert repr(calendar) == 'FiscalCalendar(4)'
+    assert calendar.for_month(Month(2023, 4)) == (2024, 1, 1)
+    assert calendar.for_month(Month(2023, 12)) == (2024, 3, 9)
+    assert calendar.for_month(Month(2024, 3)) == (2024, 4, 12)
+    assert calendar.for_date(datetime.date(2024, 3, 31)) == (2024, 4, 12)
+
+    assert FiscalCalendar().for_month(Month(2023, 5)) == (2023, 2, 5)
+    assert FiscalCalendar(10).for_month(Month(2023, 10)) == (2024, 1, 1)
+
+
+def test_month_based_back():
+    for start_month in range(1, 13):
+        calendar = FiscalCalendar(start_month)
+        for month in Month(2020, 1).range_to(Month(2023, 1)):
+            year, _, period = calendar.for_month(month)
+            assert calendar.period_month(year, period) == month
+            assert calendar.period_start(year, period) == month.start_date
+            assert calendar.period_end(year, period) == month.end_date
+
+    calendar = FiscalCalendar(7)
+    assert calendar.year_start(2024) == datetime.date(2023, 7, 1)
+    assert calendar.year_end(2024) == datetime.date(2024, 7, 1)
+
+    with pytest.raises(ValueError) as exc_info:
+        calendar.period_month(2024, 13)
+    assert str(exc_info.value) == "period must be in 1..12"
+
+
+def test_week_based():
+    # Saturday nearest to the end of January, like the NRF retail calendar
+    calendar = FiscalCalendar(2, '4-4-5', nearest=True)
+    assert repr(calendar) == "FiscalCalendar(2, '4-4-5', end_weekday=5, nearest=True)"
+
+    assert calendar.year_start(2023) == datetime.date(2022, 1, 30)
+    assert calendar.year_end(2023) == datetime.date(2023, 1, 29)
+    assert calendar.year_end(2024) == datetime.date(2024, 2, 4)
+
+    assert calendar.for_date(datetime.date(2022, 1, 30)) == (2023, 1, 1)
+    assert calendar.for_date(datetime.date(2022, 2, 26)) == (2023, 1, 1)
+    assert calendar.for_date(datetime.date(2022, 2, 27)) == (2023, 1, 2)
+    assert calendar.for_date(datetime.date(2022, 4, 30)) == (2023, 1, 3)
+    assert calendar.for_date(datetime.date(2022, 5, 1)) == (2023, 2, 4)
+    # 53rd week
+    assert calendar.for_date(datetime.date(2024, 2, 3)) == (2024, 4, 12)
+    assert calendar.period_end(2024, 12) - calendar.period_start(2024, 12) == datetime.timedelta(weeks=6)
+
+    with pytest.raises(ValueError):
+        calendar.for_month(Month(2022, 1))
+
+
+def test_week_based_periods():
+    for pattern in ['4-4-5', '4-5-4', '5-4-4']:
+        for nearest in [False, True]:
+            calendar = FiscalCalendar(1, pattern, end_weekday=6, nearest=nearest)
+            weeks = [int(count) for count in pattern.split('-')] * 4
+            for year in [2, 1999, 2020, 2021, 9998]:
+                start = calendar.year_start(year)
+                is_long_year = (calendar.year_end(year) - start).days == 53 * 7
+                assert start.weekday() == 0
+                for period in range(1, 13):
+                    period_start = calendar.period_start(year, period)
+                    period_end = calendar.period_end(year, period)
+                    assert period_start == start
+                    assert (period_end - period_start).days == 7 * (weeks[period - 1] + (period == 12 and is_long_year))
+                    for date in [period_start, period_end - datetime.timedelta(days=1)]:
+                        assert calendar.for_date(date) == (year, (period + 2) // 3, period)
+                    start = period_end
+
+
+def test_week_based_range():
+    calendar = FiscalCalendar(1, '4-4-5')
+    with pytest.raises(ValueError):
+        calendar.for_date(datetime.date(1, 1, 5))
+    with pytest.raises(ValueError) as exc_info:
+        calendar.year_start(1)
+    assert str(exc_info.value) == "fiscal year 1 is out of range"
+
+    # 9999-12-31 is a Friday, the end is clamped like `Month(9999, 12).end_date`
+    assert calendar.year_end(9999) == datetime.date(9999, 12, 26)
+    assert FiscalCalendar(1, '4-4-5', end_weekday=4).year_end(9999) == datetime.date(9999, 12, 31)
+
+
+def test_validation():
+    with pytest.raises(ValueError) as exc_info:
+        FiscalCalendar(13)
+    assert str(exc_info.value) == "start_month must be in 1..12"
+
+    with pytest.raises(ValueError) as exc_info:
+        FiscalCalendar(1, '4-4-4')
+    assert str(exc_info.value) == "unknown period pattern '4-4-4'"
+
+    with pytest.raises(ValueError) as exc_info:
+        FiscalCalendar(1, '4-4-5', end_weekday=7)
+    assert str(exc_info.value) == "end_weekday must be in 0..6"
+
+
+CALENDARS = [FiscalCalendar(), FiscalCalendar(10), FiscalCalendar(2, '5-4-4', nearest=True)]
+
+
+def test_many():
+    dates = list(DateRange(datetime.date(2021, 12, 1), datetime.date(2024, 3, 1), 5))
+    for calendar in CALENDARS:
+        expected = [calendar.for_date(date) for date in dates]
+        assert list(zip(*calendar.for_dates(dates))) == expected
+
+    calendar = FiscalCalendar(4)
+    months = list(Month(2022, 1).range_to(Month(2023, 6)))
+    expected = [calendar.for_month(month) for month in months]
+    assert list(zip(*calendar.for_months(months))) == expected
+
+
+def test_many_numpy():
+    np = pytest.importorskip('numpy')
+    dates = list(DateRange(datetime.date(2021, 12, 1), datetime.date(2024, 3, 1), 5))
+    for calendar in CALENDARS:
+        expected = [calendar.for_date(date) for date in dates]
+        columns = calendar.for_dates(np.array(dates, dtype='datetime64[D]'))
+        assert list(zip(*(column.tolist() for column in columns))) == expected
+
+    calendar = FiscalCalendar(4)
+    months = list(Month(2022, 1).range_to(Month(2023, 6)))
+    expected = [calendar.for_month(month) for month in months]
+    columns = calendar.for_months(np.array([month.ord() for month in months]))
+    assert list(zip(*(column.tolist() for column in columns))) == expected
@@ -0,0 +1,90 @@
+import datetime
+
+import pytest
+
+from calendarium import instrumentation
+from calendarium.date_range import DateRange
+from calendarium.month import Month
+from calendarium.month import MonthDelta
+
+
+@pytest.fixture(autouse=True)
+def clean_instrumentation():
+    instrumentation.disable()
+    instrumentation.reset()
+    yield
+    instrumentation.disable()
+    instrumentation.reset()
+
+
+def test_disabled_is_untouched():
+    originals = {cls: dict(vars(cls)) for cls in instrumentation.INSTRUMENTED_CLASSES}
+
+    instrumentation.enable()
+    assert instrumentation.is_enabled()
+    assert vars(Month)['parse'] is not originals[Month]['parse']
+    instrumentation.disable()
+
+    assert not instrumentation.is_enabled()
+    assert {cls: dict(vars(cls)) for cls in instrumentation.INSTRUMENTED_CLASSES} == originals
+
+    Month(2022, 1)
+    assert instrumentation.snapshot() == {'calls': {}, 'seconds': {}, 'yielded': {}, 'created': {}}
+
+
+def test_counts():
+    instrumentation.enable()
+    Month.parse('2022-03', '%Y-%m')
+    Month.parse('2022-04', '%Y-%m')
+    delta = MonthDelta(2) * 3
+    days = list(DateRange(datetime.date(2022, 1, 1), datetime.date(2022, 1, 11)))
+
+    stats = instrumentation.snapshot()
+    assert stats['calls']['Month.parse'] == 2
+    assert stats['calls']['MonthDelta.__mul__'] == 1
+    assert stats['calls']['DateRange.__iter__'] == 1
+    assert stats['yielded']['DateRange.__iter__'] == len(days) == 10
+    assert stats['created']['MonthDelta'] == 2
+    assert stats['created']['DateRange'] == 1
+    assert stats['seconds']['Month.parse'] > 0
+    assert delta == MonthDelta(6)
+
+    instrumentation.reset()
+    assert instrumentation.snapshot()['calls'] == {}
+
+
+def test_instrumented():
+    with instrumentation.instrumented() as stats:
+        month = Month(2022, 1)
+        Month.from_ord(month.ord() + 1)
+        month.start_date
+    assert not instrumentation.is_enabled()
+
+    assert stats['calls'] == {
+        'Month.__init__': 1,
+        'Month.ord': 1,
+        'Month.from_ord': 1,
+        'Month.start_date': 1,
+    }
+    assert stats['created'] == {'Month': 2}
+
+
+def test_instrumented_nested():
+    instrumentation.enable()
+    Month(2022, 1)
+
+    with instrumentation.instrumented() as stats:
+        Month(2022, 2)
+    assert instrumentation.is_enabled()
+
+    assert stats['created'] == {'Month': 1}
+    assert instrumentation.snapshot()['created'] == {'Month': 2}
+
+
+def test_errors_are_counted():
+    with instrumentation.instrumented() as stats:
+        with pytest.raises(ValueError):
+            Month(2022, 13)
+
+    assert stats['calls'] == {'Month.__init__': 1}
+    assert stats['created'] == {}
@@ -1,11 +1,19 @@
+import calendar
+import copy
 import datetime
+import pickle
 from typing import Iterable
 
 from freezegun import freeze_time
 import pytest
 
+from calendarium.month import days_many
+from calendarium.month import first_weekdays_many
+from calendarium.month import group_by_month
+from calendarium.month import MISSING_ORD
 from calendarium.month import Month
 from calendarium.month import MonthDelta
+from calendarium.month import start_ordinals_many
 
 
 def test_init_year_validation():
@@ -162,6 +170,9 @@ def test_iter():
     assert day_30 == datetime.date(2022, 1, 30)
     assert day_31 == datetime.date(2022, 1, 31)
 
+    assert list(Month(9999, 12))[-1] == datetime.date(9999, 12, 31)
+    assert len(list(Month(9999, 12))) == len(Month(9999, 12)) == 31
+
     days = list(Month(1985, 11))
     assert len(days) == 30
     for day, date_ in enumerate(days, start=1):
@@ -310,3 +321,313 @@ def test_sub_others():
             subtracted - month
         assert str(exc_info.value).startswith("unsupported operand type(s) for -: '")
         assert str(exc_info.value).endswith("' and 'Month'")
+
+
+def test_of():
+    assert Month.of(2022, 9) == Month(2022, 9)
+    assert Month.of(2022, 9) is Month.of(2022, 9)
+    assert Month.of(2022, 9) is not Month.of(2022, 10)
+    assert Month.of(2022, 9.0) is Month.of(year=2022, month=9) is Month.of('2022', 9)
+
+    with pytest.raises(ValueError) as exc_info:
+        Month.of(2022, 13)
+    assert str(exc_info.value) == "month must be in 1..12"
+
+
+def test_immutable():
+    month = Month.of(2022, 9)
+    with pytest.raises(AttributeError):
+        month.month = 10
+    with pytest.raises(AttributeError):
+        month.year = 2023
+    assert month == Month(2022, 9)
+    assert Month.of(2022, 9).month == 9
+
+
+def test_lazy_dates():
+    m = Month(2022, 9)
+    assert m._start_date is None
+    assert m._end_date is None
+    assert m.start_date == datetime.date(2022, 9, 1)
+    assert m.start_date is m.start_date
+    assert m._end_date is None
+    assert m.end_date == datetime.date(2022, 10, 1)
+    assert m.end_date is m.end_date
+
+    assert Month(9999, 12).end_date == datetime.date(9999, 12, 31)
+
+
+def test_parse_fast_path_matches_strptime():
+    for month_string in ["2022-09", "2022-9", "1-01", "0001-01", "9999-12", "0000-01", "2022-13", "2022-00",
+                         "2022-09 ", "２０２２-09", "2022/09", "2022-010", ""]:
+        try:
+            expected = Month.for_date(datetime.datetime.strptime(month_string, '%Y-%m').date())
+        except ValueError as exc:
+            with pytest.raises(ValueError) as exc_info:
+                Month.parse(month_string)
+            assert str(exc_info.value) == str(exc)
+        else:
+            assert Month.parse(month_string) == expected
+
+    assert Month.parse("092022", '%m%Y') == Month(2022, 9)
+    assert Month.parse("2022%09", '%Y%%%m') == Month(2022, 9)
+
+
+def test_parse_many():
+    assert Month.parse_many(["2022-09", "1999-12"]) == [Month(2022, 9), Month(1999, 12)]
+    assert Month.parse_many([b"2022-09", b"1999-12"]) == [Month(2022, 9), Month(1999, 12)]
+    assert Month.parse_many(["12/2013", "1/2014"], '%m/%Y') == [Month(2013, 12), Month(2014, 1)]
+    assert Month.parse_many(["Oct 80"], '%b %y') == [Month(1980, 10)]
+    assert Month.parse_many([]) == []
+
+
+def test_parse_many_ords():
+    ords = Month.parse_many(["1970-01", "2022-09", "1969-12"], as_ords=True)
+    assert ords.typecode == 'i'
+    assert ords.tolist() == [0, 632, -1]
+
+
+def test_parse_many_numpy():
+    np = pytest.importorskip('numpy')
+    assert Month.parse_many(np.array(["2022-09", "1999-12"])) == [Month(2022, 9), Month(1999, 12)]
+    assert Month.parse_many(np.array([b"2022-09", b"1999-12"]), as_ords=True).tolist() == [632, 359]
+
+
+def test_parse_many_errors():
+    with pytest.raises(ValueError) as exc_info:
+        Month.parse_many(["2022-09", "2022/09"])
+    assert str(exc_info.value) == "row 1: time data '2022/09' does not match format '%Y-%m'"
+
+    with pytest.raises(ValueError) as exc_info:
+        Month.parse_many(["2022-09", None])
+    assert str(exc_info.value).startswith("row 1: ")
+
+    assert Month.parse_many(["2022-09", "x", b"\xff"], errors='coerce') == [Month(2022, 9), None, None]
+    assert Month.parse_many(["x", "1970-02"], as_ords=True, errors='coerce').tolist() == [MISSING_ORD, 1]
+
+    with pytest.raises(ValueError) as exc_info:
+        Month.parse_many(["2022-09"], errors='ignore')
+    assert str(exc_info.value) == "errors must be 'raise' or 'coerce', not 'ignore'"
+
+
+def test_format_cached():
+    m = Month(2022, 9)
+    assert format(m, '%B %Y') == 'September 2022'
+    assert format(m, '%B %Y') is format(Month(2022, 9), '%B %Y')
+    assert format(Month(1, 1)) == format(datetime.date(1, 1, 1), '%Y-%m')
+
+
+def test_format_many():
+    months = [Month(2022, 9), Month(2022, 10), Month(2022, 9)]
+    assert Month.format_many(months) == ['2022-09', '2022-10', '2022-09']
+    assert Month.format_many(months, '%b %y') == ['Sep 22', 'Oct 22', 'Sep 22']
+    assert Month.format_many([]) == []
+
+    out = ['', '', '']
+    assert Month.format_many(months, '%m/%Y', out=out) is out
+    assert out == ['09/2022', '10/2022', '09/2022']
+
+
+def test_format_many_numpy():
+    np = pytest.importorskip('numpy')
+    out = np.empty(3, dtype='U7')
+    Month.format_many([Month(2022, 9), Month(2022, 10), Month(1999, 1)], out=out)
+    assert out.tolist() == ['2022-09', '2022-10', '1999-01']
+
+
+def test_eq_others():
+    assert Month(2001, 1) != (2001, 1)
+    assert Month(2001, 1) != 372
+    assert not Month(2001, 1) == None  # noqa: E711
+
+
+def test_comparison_total_ordering():
+    months = [Month(2001, 1), Month(2001, 2), Month(2002, 1)]
+    for a in months:
+        for b in months:
+            assert (a < b) == (a.ord() < b.ord())
+            assert (a <= b) == (a.ord() <= b.ord())
+            assert (a > b) == (a.ord() > b.ord())
+            assert (a >= b) == (a.ord() >= b.ord())
+            assert (a != b) == (a.ord() != b.ord())
+
+
+def test_sort_key():
+    months = [Month(2001, 5), Month(1999, 12), Month(2001, 1)]
+    assert sorted(months, key=Month.sort_key) == sorted(months) == [Month(1999, 12), Month(2001, 1), Month(2001, 5)]
+
+
+def test_pickle():
+    for month in [Month(2022, 9), Month(1, 1), Month(9999, 12)]:
+        assert pickle.loads(pickle.dumps(month)) == month
+
+    assert len(pickle.dumps(Month(2022, 9))) < 100
+
+
+def test_copy():
+    month = Month(2022, 9)
+    assert copy.copy(month) is month
+    assert copy.deepcopy([month])[0] is month
+
+
+def test_to_from_bytes():
+    assert Month(2022, 9).to_bytes() == (632).to_bytes(4, 'little', signed=True)
+    assert Month(1969, 12).to_bytes(2) == b'\xff\xff'
+    for month in [Month(2022, 9), Month(1969, 12), Month(1, 1), Month(9999, 12)]:
+        assert Month.from_bytes(month.to_bytes()) == month
+
+    assert Month.from_bytes(Month(2022, 9).to_bytes(2)) == Month(2022, 9)
+
+    with pytest.raises(OverflowError):
+        Month(9999, 12).to_bytes(2)
+
+
+def test_dump_load_many():
+    months = [Month(2022, 9), Month(1969, 12), Month(1, 1), Month(9999, 12)]
+    dumped = Month.dump_many(months)
+    assert dumped.typecode == 'i'
+    assert dumped.tolist() == [632, -1, -23628, 96359]
+    assert Month.load_many(dumped) == months
+    assert Month.load_many(dumped.tobytes()) == months
+    assert Month.load_many(b'') == []
+
+
+def test_for_dates():
+    dates = [datetime.date(1970, 1, 31), datetime.date(2022, 9, 18), None, datetime.datetime(1969, 12, 31, 23, 59)]
+    ords = Month.for_dates(dates)
+    assert ords.typecode == 'i'
+    assert ords.tolist() == [0, 632, MISSING_ORD, -1]
+    assert Month.for_dates([]).tolist() == []
+
+
+def test_for_dates_numpy():
+    np = pytest.importorskip('numpy')
+    dates = np.array(['1970-01-31', '2022-09-18', 'NaT', '1969-12-31', '0001-01-01'], dtype='datetime64[D]')
+    ords = Month.for_dates(dates)
+    assert ords.dtype == np.int32
+    assert ords.tolist() == [0, 632, MISSING_ORD, -1, Month(1, 1).ord()]
+    assert Month.for_dates(dates.astype('datetime64[s]')).tolist() == ords.tolist()
+
+    with pytest.raises(ValueError) as exc_info:
+        Month.for_dates(np.array(['10000-01-01'], dtype='datetime64[D]'))
+    assert str(exc_info.value) == "year 10000 is out of range"
+
+
+def test_group_by_month():
+    dates = [datetime.date(2022, 9, 1), datetime.date(2022, 8, 31), datetime.date(2022, 9, 30), None]
+    values = [1, 2, 3, 4]
+    assert group_by_month(dates, values, sum) == {Month(2022, 8).ord(): 2, Month(2022, 9).ord(): 4}
+    assert list(group_by_month(dates, values, list).values()) == [[2], [1, 3]]
+    assert group_by_month([], [], sum) == {}
+
+    with pytest.raises(ValueError) as exc_info:
+        group_by_month(dates, values[:2], sum)
+    assert str(exc_info.value) == "dates and values must have the same length"
+
+
+def test_group_by_month_numpy():
+    np = pytest.importorskip('numpy')
+    dates = np.array(['2022-09-01', '2022-08-31', 'NaT', '2022-09-30', '2021-01-01'], dtype='datetime64[D]')
+    values = np.array([1.0, 2.0, 4.0, 3.0, 5.0])
+    grouped = group_by_month(dates, values, np.sum)
+    assert grouped == {Month(2021, 1).ord(): 5.0, Month(2022, 8).ord(): 2.0, Month(2022, 9).ord(): 4.0}
+    assert list(grouped) == sorted(grouped)
+
+
+def test_from_ord_validation():
+    assert Month.from_ord(Month.MIN_ORD) == Month(1, 1)
+    assert Month.from_ord(Month.MAX_ORD) == Month(9999, 12)
+
+    with pytest.raises(ValueError) as exc_info:
+        Month.from_ord(Month.MAX_ORD + 1)
+    assert str(exc_info.value) == "year 10000 is out of range"
+
+    with pytest.raises(ValueError) as exc_info:
+        Month.from_ord(Month.MIN_ORD - 1)
+    assert str(exc_info.value) == "year 0 is out of range"
+
+    assert type(Month.from_ord(True).year) is int
+
+
+def test_start_end_ordinal():
+    for month in [Month(1, 1), Month(1600, 2), Month(1900, 3), Month(2000, 3), Month(2022, 12), Month(9999, 12)]:
+        assert month.start_ordinal() == month.start_date.toordinal()
+        assert month.end_ordinal() == month.end_date.toordinal()
+
+
+def test_contains_edges():
+    assert datetime.date(9999, 12, 30) in Month(9999, 12)
+    assert datetime.date(9999, 12, 31) in Month(9999, 12)
+    assert datetime.date(9999, 12, 31) not in Month(9999, 11)
+    assert datetime.date(1, 1, 1) in Month(1, 1)
+    assert datetime.datetime(2021, 9, 30, 23, 59) in Month(2021, 9)
+
+
+def test_tables_match_datetime():
+    for year in [1, 4, 100, 1582, 1900, 1970, 2000, 2024, 9998, 9999]:
+        for month_no in range(1, 13):
+            month = Month(year, month_no)
+            start_date = datetime.date(year, month_no, 1)
+            assert month.days() == calendar.monthrange(year, month_no)[1]
+            assert month.start_ordinal() == start_date.toordinal()
+            assert month.first_weekday == start_date.weekday()
+
+
+def test_tables_all_months():
+    ords = range(Month.MIN_ORD, Month.MAX_ORD + 1)
+    start_ordinals = start_ordinals_many(ords)
+    first_weekdays = first_weekdays_many(ords)
+    assert list(start_ordinals[1:]) == [
+        start_ordinal + days for start_ordinal, days in zip(start_ordinals, days_many(ords))
+    ][:-1]
+    assert start_ordinals[0] == 1
+    assert start_ordinals[-1] == datetime.date(9999, 12, 1).toordinal()
+    assert all(weekday == (ordinal - 1) % 7 for weekday, ordinal in zip(first_weekdays, start_ordinals))
+
+
+def test_tables_many():
+    months = [Month(1, 1), Month(1970, 1), Month(2024, 2), Month(9999, 12)]
+    ords = [month.ord() for month in months]
+    assert list(days_many(ords)) == [31, 31, 29, 31]
+    assert list(start_ordinals_many(ords)) == [month.start_ordinal() for month in months]
+    assert list(first_weekdays_many(ords)) == [month.first_weekday for month in months]
+    assert list(days_many([])) == []
+
+    with pytest.raises(ValueError):
+        days_many([Month.MAX_ORD + 1])
+    with pytest.raises(ValueError):
+        start_ordinals_many([Month.MIN_ORD - 1])
+
+
+def test_weeks():
+    weeks = Month(2022, 9).weeks()
+    assert weeks[0] == tuple(datetime.date(2022, 8, 29) + datetime.timedelta(days=d) for d in range(7))
+    assert weeks[-1][-1] == datetime.date(2022, 10, 2)
+    assert len(weeks) == 5
+
+    # February 2021 starts on Monday and has exactly 4 weeks
+    assert len(Month(2021, 2).weeks()) == 4
+    assert Month(2021, 2).weeks()[0][0] == datetime.date(2021, 2, 1)
+    assert Month(2021, 2).weeks(6)[0][0] == datetime.date(2021, 1, 31)
+
+
+def test_weeks_like_calendar():
+    for firstweekday in range(7):
+        cal = calendar.Calendar(firstweekday)
+        for month in [Month(2021, 2), Month(2022, 1), Month(2022, 5), Month(2024, 2), Month(1900, 3)]:
+            expected = cal.monthdatescalendar(month.year, month.month)
+            assert [list(week) for week in month.weeks(firstweekday)] == expected
+
+
+def test_weeks_cached():
+    assert Month(2022, 9).weeks() is Month(2022, 9).weeks()
+    assert Month(2022, 9).weeks(6) is not Month(2022, 9).weeks()
+
+    with pytest.raises(ValueError) as exc_info:
+        Month(2022, 9).weeks(7)
+    assert str(exc_info.value) == "firstweekday must be in 0..6"
+
+
+def test_weeks_many():
+    months = [Month(2022, 1), Month(2022, 2)]
+    assert Month.weeks_many(months, 6) == [months[0].weeks(6), months[1].weeks(6)]
@@ -0,0 +1,128 @@
+import datetime
+
+import numpy as np
+import pytest
+
+from calendarium.month import Month
+from calendarium.month import MonthDelta
+from calendarium.month_array import MonthArray
+
+
+def test_init():
+    ma = MonthArray([0, 1, 632])
+    assert ma.ords.dtype == np.int32
+    assert ma.ords.tolist() == [0, 1, 632]
+    assert len(MonthArray()) == 0
+
+
+def test_init_validation():
+    MonthArray([Month(1, 1).ord(), Month(9999, 12).ord()])
+
+    with pytest.raises(ValueError) as exc_info:
+        MonthArray([0, Month(9999, 12).ord() + 1])
+    assert str(exc_info.value) == "year 10000 is out of range"
+
+    with pytest.raises(ValueError) as exc_info:
+        MonthArray([Month(1, 1).ord() - 1])
+    assert str(exc_info.value) == "year 0 is out of range"
+
+    with pytest.raises(ValueError) as exc_info:
+        MonthArray([1.7])
+    assert str(exc_info.value) == "ords must be integers, not float64"
+    with pytest.raises(ValueError):
+        MonthArray([True])
+
+    with pytest.raises(ValueError) as exc_info:
+        MonthArray([[0, 1], [2, 3]])
+    assert str(exc_info.value) == "ords must be one-dimensional"
+    with pytest.raises(ValueError):
+        MonthArray(5)
+
+
+def test_from_to_months():
+    months = [Month(2022, 9), Month(1969, 12), Month(2000, 1)]
+    ma = MonthArray.from_months(months)
+    assert ma.ords.tolist() == [632, -1, 360]
+    assert ma.to_months() == months
+    assert list(ma) == months
+
+
+def test_repr():
+    assert repr(MonthArray.from_months([Month(2022, 9), Month(1999, 12)])) == \
+           "MonthArray(['2022-09', '1999-12'])"
+
+
+def test_getitem():
+    ma = MonthArray.from_months([Month(2022, 9), Month(2022, 10), Month(2022, 11)])
+    assert ma[0] == Month(2022, 9)
+    assert ma[-1] == Month(2022, 11)
+    assert ma[1:].to_months() == [Month(2022, 10), Month(2022, 11)]
+    assert ma[ma > Month(2022, 9)].to_months() == [Month(2022, 10), Month(2022, 11)]
+
+
+def test_contains():
+    ma = MonthArray.from_months([Month(2022, 9), Month(2022, 10)])
+    assert Month(2022, 9) in ma
+    assert Month(2022, 11) not in ma
+    assert 632 not in ma
+
+
+def test_years_months():
+    ma = MonthArray.from_months([Month(2022, 9), Month(1969, 12), Month(1, 1), Month(9999, 12)])
+    assert ma.years.tolist() == [2022, 1969, 1, 9999]
+    assert ma.months.tolist() == [9, 12, 1, 12]
+
+
+def test_is_leap_days():
+    months = [Month(y, m) for y in (1900, 2000, 2004, 2022) for m in range(1, 13)]
+    ma = MonthArray.from_months(months)
+    assert ma.is_leap().tolist() == [m.is_leap() for m in months]
+    assert ma.days().tolist() == [m.days() for m in months]
+
+
+def test_dates():
+    months = [Month(2003, 1), Month(1999, 12), Month(2004, 2), Month(1, 1), Month(9999, 12)]
+    ma = MonthArray.from_months(months)
+    assert ma.start_date.dtype == np.dtype('datetime64[D]')
+    assert ma.start_date.tolist() == [m.start_date for m in months]
+    assert ma.end_date.tolist() == [m.end_date for m in months]
+    assert ma.last_date.tolist() == [m.last_date for m in months]
+
+
+def test_add_monthdelta():
+    ma = MonthArray.from_months([Month(2022, 5), Month(2022, 12)])
+    assert (ma + MonthDelta(1)).to_months() == [Month(2022, 6), Month(2023, 1)]
+    assert (MonthDelta(-5) + ma).to_months() == [Month(2021, 12), Month(2022, 7)]
+    assert (ma - MonthDelta(years=1)).to_months() == [Month(2021, 5), Month(2021, 12)]
+
+    with pytest.raises(ValueError):
+        ma + MonthDelta(years=8000)
+
+
+def test_add_others():
+    ma = MonthArray.from_months([Month(2022, 5)])
+    for added in [1, Month(2021, 1), datetime.date(2022, 1, 1), None]:
+        with pytest.raises(TypeError):
+            ma + added
+
+
+def test_sub_month():
+    ma = MonthArray.from_months([Month(2022, 5), Month(2021, 12)])
+    assert (ma - Month(2022, 1)).tolist() == [4, -1]
+    assert (Month(2022, 1) - ma).tolist() == [-4, 1]
+    assert (ma - ma).tolist() == [0, 0]
+
+
+def test_comparison():
+    ma = MonthArray.from_months([Month(2001, 3), Month(2001, 4), Month(2001, 5)])
+    assert (ma == Month(2001, 4)).tolist() == [False, True, False]
+    assert (ma != Month(2001, 4)).tolist() == [True, False, True]
+    assert (ma < Month(2001, 4)).tolist() == [True, False, False]
+    assert (ma <= Month(2001, 4)).tolist() == [True, True, False]
+    assert (ma > Month(2001, 4)).tolist() == [False, False, True]
+    assert (ma >= Month(2001, 4)).tolist() == [False, True, True]
+    assert (Month(2001, 4) < ma).tolist() == [False, False, True]
+    assert (ma == ma).tolist() == [True, True, True]
+
+    with pytest.raises(TypeError):
+        _ = ma < 3
@@ -0,0 +1,119 @@
+import pytest
+
+from calendarium.month import Month
+from calendarium.month import MonthDelta
+from calendarium.month_range import MonthRange
+
+
+def test_init():
+    mr = MonthRange(Month(2022, 1), Month(2022, 4))
+    assert mr.start == Month(2022, 1)
+    assert mr.stop == Month(2022, 4)
+    assert mr.step == MonthDelta(1)
+    assert mr.span == MonthDelta(3)
+    assert list(mr) == [Month(2022, 1), Month(2022, 2), Month(2022, 3)]
+
+    assert MonthRange(Month(2022, 1), MonthDelta(3)) == mr
+    assert MonthRange(Month(2022, 1), Month(2022, 4) - Month(2022, 1)) == mr
+    assert Month(2022, 1).range_to(Month(2022, 4)) == mr
+    assert MonthRange(Month(2022, 1), Month(2023, 1), MonthDelta(3)).step == MonthDelta(3)
+    assert MonthRange(Month(2022, 1), Month(2023, 1), 3) == MonthRange(Month(2022, 1), Month(2023, 1), MonthDelta(3))
+
+    with pytest.raises(ValueError) as exc_info:
+        MonthRange(Month(2022, 1), Month(2023, 1), MonthDelta(0))
+    assert str(exc_info.value) == "step must not be zero"
+
+    assert list(MonthRange(Month(9999, 11), MonthDelta(2))) == [Month(9999, 11), Month(9999, 12)]
+    assert list(MonthRange(Month(1, 2), MonthDelta(-2), -1)) == [Month(1, 2), Month(1, 1)]
+
+    with pytest.raises(ValueError) as exc_info:
+        MonthRange(Month(9999, 1), MonthDelta(24))
+    assert str(exc_info.value) == "stop is out of range"
+    with pytest.raises(ValueError):
+        MonthRange(Month(1, 2), MonthDelta(-3), -1)
+
+
+def test_stop_outside_calendar():
+    mr = MonthRange(Month(9999, 1), MonthDelta(12))
+    assert mr.span == MonthDelta(years=1)
+    assert mr[-1] == Month(9999, 12)
+    with pytest.raises(ValueError) as exc_info:
+        mr.stop
+    assert str(exc_info.value) == "stop is out of range"
+
+    assert MonthRange(Month(1, 3), MonthDelta(-3), -1).span == MonthDelta(-3)
+    with pytest.raises(ValueError):
+        MonthRange(Month(1, 3), MonthDelta(-3), -1).stop
+
+
+def test_repr():
+    assert repr(MonthRange(Month(2022, 1), Month(2022, 4))) == 'MonthRange(Month(2022, 1), Month(2022, 4))'
+    assert repr(MonthRange(Month(2022, 1), Month(2023, 1), 3)) == \
+           'MonthRange(Month(2022, 1), Month(2023, 1), MonthDelta(months=3))'
+    assert repr(MonthRange(Month(9999, 1), MonthDelta(12))) == 'MonthRange(Month(9999, 1), MonthDelta(years=1))'
+    assert repr(MonthRange(Month(1, 3), MonthDelta(-3), -1)) == \
+           'MonthRange(Month(1, 3), MonthDelta(months=-3), MonthDelta(months=-1))'
+
+
+def test_iter():
+    assert list(MonthRange(Month(2021, 11), Month(2022, 2))) == [Month(2021, 11), Month(2021, 12), Month(2022, 1)]
+    assert list(Month(2022, 1).range_to(Month(2023, 1), MonthDelta(years=1) // 2)) == [Month(2022, 1), Month(2022, 7)]
+    assert list(MonthRange(Month(2022, 2), Month(2021, 11), -1)) == [Month(2022, 2), Month(2022, 1), Month(2021, 12)]
+    assert list(reversed(MonthRange(Month(2021, 11), Month(2022, 1)))) == [Month(2021, 12), Month(2021, 11)]
+    assert list(MonthRange(Month(2022, 2), Month(2021, 11))) == []
+
+
+def test_len_contains():
+    mr = MonthRange(Month(1900, 1), Month(2100, 1))
+    assert len(mr) == 2400
+    assert Month(1900, 1) in mr
+    assert Month(2099, 12) in mr
+    assert Month(2100, 1) not in mr
+    assert 0 not in mr
+    assert not MonthRange(Month(2022, 2), Month(2021, 11))
+
+    quarterly = MonthRange(Month(2022, 1), Month(2024, 1), 3)
+    assert len(quarterly) == 8
+    assert Month(2022, 4) in quarterly
+    assert Month(2022, 5) not in quarterly
+
+
+def test_getitem_index():
+    mr = MonthRange(Month(2022, 1), Month(2023, 1))
+    assert mr[0] == Month(2022, 1)
+    assert mr[-1] == Month(2022, 12)
+    assert mr[3:6] == MonthRange(Month(2022, 4), Month(2022, 7))
+    assert mr[::6] == MonthRange(Month(2022, 1), Month(2022, 8), 6)
+    assert mr.index(Month(2022, 5)) == 4
+    assert mr.count(Month(2022, 5)) == 1
+    assert mr.count(Month(2023, 5)) == 0
+
+    with pytest.raises(ValueError) as exc_info:
+        mr.index(Month(2023, 1))
+    assert str(exc_info.value) == "Month(2023, 1) is not in range"
+
+
+def test_eq_hash():
+    a = MonthRange(Month(2022, 1), Month(2022, 10), 3)
+    b = MonthRange(Month(2022, 1), Month(2022, 8), 3)
+    assert a == b
+    assert hash(a) == hash(b)
+    assert a != MonthRange(Month(2022, 1), Month(2022, 10))
+
+
+def test_intersection_union():
+    h1 = MonthRange(Month(2022, 1), Month(2022, 7))
+    h2 = MonthRange(Month(2022, 7), Month(2023, 1))
+    assert not h1 & h2
+    assert h1 | h2 == MonthRange(Month(2022, 1), Month(2023, 1))
+    assert MonthRange(Month(2022, 1), Month(2023, 1), 2) & MonthRange(Month(2022, 1), Month(2023, 1), 3) == \
+           MonthRange(Month(2022, 1), Month(2023, 1), 6)
+
+    with pytest.raises(ValueError) as exc_info:
+        _ = h1 | MonthRange(Month(2022, 8), Month(2023, 1))
+    assert str(exc_info.value) == "union of month ranges is not a month range"
+
+    year = MonthRange(Month(2022, 1), Month(2023, 1))
+    assert year | MonthRange(Month(2022, 1), Month(2023, 1), 3) == year
+    assert MonthRange(Month(2022, 1), MonthDelta(1)) | MonthRange(Month(2022, 5), MonthDelta(1)) == \
+           MonthRange(Month(2022, 1), Month(2022, 6), 4)
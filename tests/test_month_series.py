@@ -0,0 +1,107 @@
+from array import array
+
+import pytest
+
+from calendarium.month import Month
+from calendarium.month import MonthDelta
+from calendarium.month_series import MonthSeries
+from calendarium.year import Year
+
+
+def test_init_dense_and_sparse():
+    dense = MonthSeries({Month(2022, 2): 2, Month(2022, 1): 1, Month(2022, 3): 3})
+    assert dense.is_dense()
+    assert dense.months() == [Month(2022, 1), Month(2022, 2), Month(2022, 3)]
+    assert dense.values() == [1, 2, 3]
+
+    sparse = MonthSeries([(Month(2022, 5), 'b'), (Month(2021, 1), 'a')])
+    assert not sparse.is_dense()
+    assert list(sparse.items()) == [(Month(2021, 1), 'a'), (Month(2022, 5), 'b')]
+    assert sparse.first_month == Month(2021, 1)
+    assert sparse.last_month == Month(2022, 5)
+
+    assert len(MonthSeries()) == 0
+    assert not MonthSeries()
+
+    with pytest.raises(ValueError) as exc_info:
+        MonthSeries([(Month(2022, 1), 1), (Month(2022, 1), 2)])
+    assert str(exc_info.value) == "duplicate month in series"
+
+
+def test_dense():
+    values = array('d', [1.0, 2.0, 3.0])
+    series = MonthSeries.dense(Month(2021, 11), values)
+    assert series.values() is values
+    assert series == MonthSeries({Month(2021, 11): 1.0, Month(2021, 12): 2.0, Month(2022, 1): 3.0})
+    assert repr(series) == 'MonthSeries({Month(2021, 11): 1.0, Month(2021, 12): 2.0, Month(2022, 1): 3.0})'
+
+    with pytest.raises(ValueError):
+        MonthSeries.dense(Month(9999, 12), [1, 2])
+
+
+def test_getitem():
+    for series in [
+        MonthSeries.dense(Month(2022, 1), [10, 20, 30]),
+        MonthSeries({Month(2022, 1): 10, Month(2022, 2): 20, Month(2022, 3): 30, Month(2023, 1): 40}),
+    ]:
+        assert series[Month(2022, 2)] == 20
+        assert Month(2022, 3) in series
+        assert Month(2021, 12) not in series
+        assert 'x' not in series
+        assert series.get(Month(2021, 12)) is None
+        assert series.get(Month(2022, 1), 0) == 10
+
+        with pytest.raises(KeyError):
+            series[Month(2022, 4)]
+
+
+def test_slice():
+    series = MonthSeries({Month(2022, 1): 1, Month(2022, 2): 2, Month(2022, 5): 5, Month(2022, 6): 6})
+    assert series[Month(2022, 2):Month(2022, 6)] == MonthSeries({Month(2022, 2): 2, Month(2022, 5): 5})
+    assert series[Month(2022, 5):].is_dense()
+    assert series[:Month(2022, 3)].values() == [1, 2]
+    assert series[Month(2023, 1):] == MonthSeries()
+
+    with pytest.raises(ValueError):
+        series[Month(2022, 1):Month(2022, 6):2]
+
+
+def test_reindex():
+    series = MonthSeries({Month(2022, 1): 1, Month(2022, 3): 3})
+    reindexed = series.reindex(Month(2021, 12).range_to(Month(2022, 4)), fill_value=0)
+    assert reindexed.is_dense()
+    assert reindexed.values() == [0, 1, 0, 3]
+
+
+def test_shift():
+    series = MonthSeries({Month(2022, 1): 1, Month(2022, 3): 3})
+    assert series.shift(MonthDelta(years=1)) == MonthSeries({Month(2023, 1): 1, Month(2023, 3): 3})
+    assert MonthSeries.dense(Month(2022, 1), [1]).shift(-1) == MonthSeries({Month(2021, 12): 1})
+
+    with pytest.raises(ValueError) as exc_info:
+        series.shift(MonthDelta(years=8000))
+    assert str(exc_info.value) == "shifted series is out of range"
+
+
+def test_align():
+    a = MonthSeries({Month(2022, 1): 1, Month(2022, 2): 2})
+    b = MonthSeries({Month(2022, 2): 20, Month(2022, 4): 40})
+
+    a_outer, b_outer = a.align(b, fill_value=0)
+    assert a_outer.months() == b_outer.months() == [Month(2022, 1), Month(2022, 2), Month(2022, 4)]
+    assert a_outer.values() == [1, 2, 0]
+    assert b_outer.values() == [0, 20, 40]
+
+    a_inner, b_inner = a.align(b, join='inner')
+    assert list(a_inner.items()) == [(Month(2022, 2), 2)]
+    assert list(b_inner.items()) == [(Month(2022, 2), 20)]
+
+    with pytest.raises(ValueError):
+        a.align(b, join='left')
+
+
+def test_resample_years():
+    series = MonthSeries.dense(Month(2021, 11), list(range(1, 16)))
+    assert series.resample_years() == {Year(2021): 3, Year(2022): sum(range(3, 15)), Year(2023): 15}
+    assert series.resample_years(len) == {Year(2021): 2, Year(2022): 12, Year(2023): 1}
+    assert MonthSeries({Month(1, 1): 1}).resample_years() == {Year(1): 1}
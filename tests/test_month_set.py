@@ -0,0 +1,91 @@
+import random
+
+import pytest
+
+from calendarium.month import Month
+from calendarium.month_set import MonthSet
+
+
+def m(ord_: int) -> Month:
+    return Month.from_ord(ord_)
+
+
+def test_init():
+    ms = MonthSet([Month(2022, 3), Month(2022, 1), Month(2022, 2), Month(2022, 6), Month(2022, 1)])
+    assert ms.runs() == [(Month(2022, 1), Month(2022, 3)), (Month(2022, 6), Month(2022, 6))]
+    assert list(ms) == [Month(2022, 1), Month(2022, 2), Month(2022, 3), Month(2022, 6)]
+    assert len(ms) == ms.count() == 4
+    assert not MonthSet()
+    assert ms
+
+
+def test_from_runs():
+    ms = MonthSet.from_runs([
+        (Month(2022, 6), Month(2022, 7)),
+        (Month(2022, 1), Month(2022, 2)),
+        (Month(2022, 2), Month(2022, 3)),
+        (Month(2022, 4), Month(2022, 4)),
+        (Month(2023, 1), Month(2022, 1)),
+    ])
+    assert ms.runs() == [(Month(2022, 1), Month(2022, 4)), (Month(2022, 6), Month(2022, 7))]
+
+
+def test_calendar_edges():
+    ms = MonthSet([Month(1, 1), Month(9999, 11), Month(9999, 12)])
+    assert ms.runs() == [(Month(1, 1), Month(1, 1)), (Month(9999, 11), Month(9999, 12))]
+    assert ms.gaps() == [(Month(1, 2), Month(9999, 10))]
+    assert MonthSet.from_runs(ms.runs()) == ms
+    assert repr(MonthSet([Month(9999, 12)])) == 'MonthSet.from_runs([(Month(9999, 12), Month(9999, 12))])'
+    assert Month(9999, 12) in ms
+
+
+def test_repr():
+    assert repr(MonthSet([Month(2022, 1)])) == 'MonthSet.from_runs([(Month(2022, 1), Month(2022, 1))])'
+
+
+def test_gaps():
+    ms = MonthSet.from_runs([
+        (Month(2022, 1), Month(2022, 2)),
+        (Month(2022, 5), Month(2022, 5)),
+        (Month(2023, 1), Month(2023, 1)),
+    ])
+    assert ms.gaps() == [(Month(2022, 3), Month(2022, 4)), (Month(2022, 6), Month(2022, 12))]
+    assert MonthSet().gaps() == []
+    assert MonthSet([Month(2022, 1)]).gaps() == []
+
+
+def test_contains():
+    ms = MonthSet.from_runs([(Month(2022, 1), Month(2022, 2)), (Month(2022, 5), Month(2022, 5))])
+    assert Month(2021, 12) not in ms
+    assert Month(2022, 1) in ms
+    assert Month(2022, 2) in ms
+    assert Month(2022, 3) not in ms
+    assert Month(2022, 5) in ms
+    assert Month(2022, 6) not in ms
+    assert 632 not in ms
+
+
+def test_eq_hash():
+    january_february = MonthSet.from_runs([(Month(2022, 1), Month(2022, 2))])
+    assert MonthSet([Month(2022, 1), Month(2022, 2)]) == january_february
+    assert hash(MonthSet([Month(2022, 1), Month(2022, 2)])) == hash(january_february)
+    assert MonthSet([Month(2022, 1)]) != MonthSet([Month(2022, 2)])
+    assert MonthSet() != set()
+
+
+def test_set_operations():
+    rng = random.Random(7)
+    for _ in range(200):
+        a = {rng.randrange(40) for _ in range(rng.randrange(30))}
+        b = {rng.randrange(40) for _ in range(rng.randrange(30))}
+        sa, sb = MonthSet(map(m, a)), MonthSet(map(m, b))
+        assert list(sa | sb) == [m(o) for o in sorted(a | b)]
+        assert list(sa & sb) == [m(o) for o in sorted(a & b)]
+        assert list(sa - sb) == [m(o) for o in sorted(a - b)]
+        assert list(sa ^ sb) == [m(o) for o in sorted(a ^ b)]
+        assert sa.union(sb) == MonthSet(map(m, a | b))
+
+
+def test_operations_others():
+    with pytest.raises(TypeError):
+        _ = MonthSet() | {Month(2022, 1)}
@@ -1,3 +1,7 @@
+import copy
+import datetime
+import pickle
+
 import pytest
 
 from calendarium.month import Month
@@ -126,7 +130,7 @@ def test_sub_others():
 
 
 def test_mul():
-    assert MonthDelta(6) * 2 == MonthDelta(years=12)
+    assert MonthDelta(6) * 2 == MonthDelta(years=1)
     assert MonthDelta(0) * 10 == MonthDelta(0)
     assert MonthDelta(1) * (-2) == MonthDelta(-2)
 
@@ -136,3 +140,138 @@ def test_div():
     assert MonthDelta(5) // 2 == MonthDelta(2)
     assert MonthDelta(-9) // 3 == MonthDelta(-3)
     assert MonthDelta(-10) // 7 == MonthDelta(-2)
+
+
+def test_pickle_copy():
+    for delta in [MonthDelta(), MonthDelta(-15), MonthDelta(years=3, months=2)]:
+        assert pickle.loads(pickle.dumps(delta)) == delta
+        assert copy.copy(delta) is delta
+
+
+def test_add_date():
+    assert datetime.date(2022, 1, 15) + MonthDelta(1) == datetime.date(2022, 2, 15)
+    assert MonthDelta(1) + datetime.date(2022, 1, 31) == datetime.date(2022, 2, 28)
+    assert datetime.date(2024, 1, 31) + MonthDelta(1) == datetime.date(2024, 2, 29)
+    assert datetime.date(2022, 3, 31) - MonthDelta(1) == datetime.date(2022, 2, 28)
+    assert datetime.date(2022, 12, 5) + MonthDelta(years=1, months=2) == datetime.date(2024, 2, 5)
+    assert datetime.datetime(2022, 1, 31, 12, 30) + MonthDelta(1) == datetime.datetime(2022, 2, 28, 12, 30)
+
+    with pytest.raises(ValueError) as exc_info:
+        datetime.date(9999, 12, 1) + MonthDelta(1)
+    assert str(exc_info.value) == "year 10000 is out of range"
+
+    with pytest.raises(TypeError):
+        MonthDelta(1) - datetime.date(2022, 1, 1)
+
+
+def test_add_to_policies():
+    jan31 = datetime.date(2022, 1, 31)
+    assert MonthDelta(1).add_to(jan31, 'clamp') == datetime.date(2022, 2, 28)
+    assert MonthDelta(1).add_to(jan31, 'overflow') == datetime.date(2022, 3, 3)
+    assert MonthDelta(1).add_to(jan31, 'end') == datetime.date(2022, 2, 28)
+
+    feb28 = datetime.date(2022, 2, 28)
+    assert MonthDelta(1).add_to(feb28, 'clamp') == datetime.date(2022, 3, 28)
+    assert MonthDelta(1).add_to(feb28, 'overflow') == datetime.date(2022, 3, 28)
+    assert MonthDelta(1).add_to(feb28, 'end') == datetime.date(2022, 3, 31)
+    assert MonthDelta(12).add_to(datetime.date(2023, 2, 28), 'end') == datetime.date(2024, 2, 29)
+    assert MonthDelta(1).add_to(datetime.datetime(2022, 1, 31, 8), 'overflow') == datetime.datetime(2022, 3, 3, 8)
+
+    with pytest.raises(ValueError) as exc_info:
+        MonthDelta(1).add_to(jan31, 'nearest')
+    assert str(exc_info.value) == "unknown end-of-month policy 'nearest'"
+
+
+def test_add_to_many():
+    dates = [datetime.date(2022, 1, 31), datetime.date(2022, 2, 28)]
+    assert MonthDelta(1).add_to_many(dates, 'end') == [datetime.date(2022, 2, 28), datetime.date(2022, 3, 31)]
+
+
+def test_add_to_many_numpy():
+    np = pytest.importorskip('numpy')
+    first, last = datetime.date(1999, 1, 1).toordinal(), datetime.date(2001, 12, 31).toordinal()
+    dates = [datetime.date.fromordinal(ord_) for ord_ in range(first, last, 3)]
+    array = np.array(dates, dtype='datetime64[D]')
+    for policy in MonthDelta.EOM_POLICIES:
+        for delta in [MonthDelta(1), MonthDelta(-1), MonthDelta(13), MonthDelta(0)]:
+            shifted = delta.add_to_many(array, policy)
+            assert shifted.dtype == array.dtype
+            assert shifted.tolist() == [delta.add_to(date, policy) for date in dates]
+
+    timestamps = np.array(['2022-01-31T08:15', '2022-02-28T23:59'], dtype='datetime64[m]')
+    assert MonthDelta(1).add_to_many(timestamps, 'end').tolist() == [
+        datetime.datetime(2022, 2, 28, 8, 15), datetime.datetime(2022, 3, 31, 23, 59)
+    ]
+
+
+def test_add_to_many_numpy_out_of_range():
+    np = pytest.importorskip('numpy')
+    dates = np.array(['9999-12-15', 'NaT'], dtype='datetime64[D]')
+    assert np.isnat(MonthDelta(-1).add_to_many(dates)[1])
+
+    for delta, array in [(MonthDelta(1), dates), (MonthDelta(-1), np.array(['0001-01-15'], dtype='datetime64[D]'))]:
+        with pytest.raises(ValueError) as scalar_exc_info:
+            delta.add_to(array[0].item())
+        with pytest.raises(ValueError) as exc_info:
+            delta.add_to_many(array)
+        assert str(exc_info.value) == str(scalar_exc_info.value)
+
+
+def test_eq_years():
+    assert MonthDelta(years=1) != MonthDelta(0)
+    assert MonthDelta(years=1, months=1) != MonthDelta(1)
+    assert MonthDelta(years=-1) == MonthDelta(-12)
+    assert MonthDelta(1) != 1
+    assert MonthDelta(0) != Month(1970, 1)
+
+
+def test_hash():
+    d = {MonthDelta(12): 'year', MonthDelta(1): 'month'}
+    assert d[MonthDelta(years=1)] == 'year'
+    assert d[MonthDelta(months=1)] == 'month'
+    assert MonthDelta(13) not in d
+
+
+def test_comparison():
+    assert MonthDelta(1) < MonthDelta(2)
+    assert MonthDelta(-1) < MonthDelta(0)
+    assert MonthDelta(years=1) > MonthDelta(11)
+    assert MonthDelta(12) >= MonthDelta(years=1)
+    assert MonthDelta(12) <= MonthDelta(years=1)
+    assert sorted([MonthDelta(5), MonthDelta(-3), MonthDelta(years=1)]) == [MonthDelta(-3), MonthDelta(5), MonthDelta(12)]
+
+    with pytest.raises(TypeError):
+        _ = MonthDelta(1) < 2
+
+
+def test_abs_bool():
+    assert abs(MonthDelta(-15)) == MonthDelta(15)
+    assert abs(MonthDelta(15)) == MonthDelta(15)
+    assert +MonthDelta(-2) == MonthDelta(-2)
+    assert not MonthDelta(0)
+    assert MonthDelta(years=1)
+    assert MonthDelta(-1)
+
+
+def test_div_monthdelta():
+    assert MonthDelta(years=1) / MonthDelta(3) == 4.0
+    assert MonthDelta(18) / MonthDelta(years=1) == 1.5
+    assert MonthDelta(18) // MonthDelta(years=1) == 1
+    assert MonthDelta(18) % MonthDelta(years=1) == MonthDelta(6)
+    assert divmod(MonthDelta(-18), MonthDelta(years=1)) == (-2, MonthDelta(6))
+
+    with pytest.raises(ZeroDivisionError):
+        _ = MonthDelta(1) / MonthDelta(0)
+
+    with pytest.raises(TypeError):
+        _ = MonthDelta(1) / 2
+
+
+def test_mul_others():
+    assert 3 * MonthDelta(2) == MonthDelta(6)
+
+    with pytest.raises(TypeError):
+        _ = MonthDelta(2) * MonthDelta(2)
+
+    with pytest.raises(TypeError):
+        _ = MonthDelta(2) * None
@@ -0,0 +1,77 @@
+from array import array
+import concurrent.futures
+
+import pytest
+
+from calendarium.month import Month
+from calendarium.month_range import MonthRange
+from calendarium.parallel import as_ords
+from calendarium.parallel import map_chunks
+from calendarium.parallel import partition
+
+
+def total_days(chunk) -> int:
+    months = chunk if isinstance(chunk, MonthRange) else map(Month.from_ord, chunk)
+    return sum(month.days() for month in months)
+
+
+def test_as_ords():
+    assert as_ords([Month(1970, 1), Month(2022, 9), 5]).tolist() == [0, 632, 5]
+    ords = array('i', [1, 2])
+    assert as_ords(ords) is ords
+
+
+def test_as_ords_numpy():
+    np = pytest.importorskip('numpy')
+    assert as_ords(np.array([0, 632, -1], dtype=np.int64)).tolist() == [0, 632, -1]
+    assert as_ords(np.array([], dtype=np.int64)).tolist() == []
+
+    with pytest.raises(ValueError) as exc_info:
+        as_ords(np.array([2 ** 40]))
+    assert str(exc_info.value) == "year 91625970951 is out of range"
+    with pytest.raises(ValueError):
+        as_ords(np.array([Month.MIN_ORD - 1]))
+
+
+def test_partition_month_range():
+    span = MonthRange(Month(2000, 1), Month(2001, 1))
+    parts = partition(span, 5)
+    assert [len(part) for part in parts] == [2, 2, 3, 2, 3]
+    assert all(isinstance(part, MonthRange) for part in parts)
+    assert [month for part in parts for month in part] == list(span)
+
+    assert len(partition(span, 20)) == 12
+    assert partition(MonthRange(Month(2000, 1), Month(2000, 1)), 3) == []
+
+
+def test_partition_ords():
+    parts = partition([Month.from_ord(ord_) for ord_ in range(10)], 3)
+    assert [part.tolist() for part in parts] == [[0, 1, 2], [3, 4, 5], [6, 7, 8, 9]]
+    assert all(part.typecode == 'i' for part in parts)
+
+    with pytest.raises(ValueError) as exc_info:
+        partition([], 0)
+    assert str(exc_info.value) == "chunks must be positive"
+
+
+def test_map_chunks_thread():
+    span = MonthRange(Month(2000, 1), Month(2100, 1))
+    expected = sum(month.days() for month in span)
+    assert map_chunks(total_days, span, executor='thread', max_workers=4, merge=sum) == expected
+    assert len(map_chunks(total_days, span, executor='thread', chunks=7)) == 7
+
+
+def test_map_chunks_process():
+    ords = array('i', range(0, 1200, 3))
+    expected = sum(Month.from_ord(ord_).days() for ord_ in ords)
+    assert map_chunks(total_days, ords, max_workers=2, merge=sum) == expected
+
+
+def test_map_chunks_executor():
+    span = MonthRange(Month(2000, 1), Month(2001, 1))
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+        assert map_chunks(total_days, span, executor=executor, chunks=2) == [182, 184]
+
+    with pytest.raises(ValueError) as exc_info:
+        map_chunks(total_days, span, executor='fiber')
+    assert str(exc_info.value) == "executor must be 'process', 'thread' or an Executor, not 'fiber'"
@@ -0,0 +1,98 @@
+import datetime
+
+import pytest
+
+from calendarium.month import Month
+from calendarium.proration import prorate
+from calendarium.proration import prorate_many
+
+
+def test_overlap_days():
+    month = Month(2024, 2)
+    assert month.overlap_days(datetime.date(2024, 1, 15), datetime.date(2024, 3, 10)) == 29
+    assert month.overlap_days(datetime.date(2024, 2, 10), datetime.date(2024, 2, 20)) == 10
+    assert month.overlap_days(datetime.date(2024, 2, 20), datetime.date(2024, 4, 1)) == 10
+    assert month.overlap_days(datetime.date(2024, 3, 1), datetime.date(2024, 4, 1)) == 0
+    assert month.overlap_days(datetime.date(2024, 2, 20), datetime.date(2024, 2, 10)) == 0
+    assert Month(9999, 12).overlap_days(datetime.date(9999, 12, 1), datetime.date(9999, 12, 31)) == 30
+
+
+def test_overlap_days_like_counting():
+    start, end = datetime.date(2023, 11, 17), datetime.date(2024, 3, 5)
+    for month in Month(2023, 10).range_to(Month(2024, 5)):
+        assert month.overlap_days(start, end) == sum(start <= date < end for date in month)
+
+
+def test_prorate_actual():
+    pieces = prorate(datetime.date(2024, 1, 16), datetime.date(2024, 3, 11), 100.0)
+    assert [(month, days) for month, days, _ in pieces] == [
+        (Month(2024, 1), 16),
+        (Month(2024, 2), 29),
+        (Month(2024, 3), 10),
+    ]
+    assert [amount for _, _, amount in pieces] == pytest.approx([100 * 16 / 31, 100.0, 100 * 10 / 31])
+
+    assert prorate(datetime.date(2024, 1, 1), datetime.date(2024, 1, 1)) == []
+    assert prorate(datetime.date(2024, 2, 1), datetime.date(2024, 1, 1)) == []
+
+
+def test_prorate_conventions():
+    start, end = datetime.date(2023, 2, 15), datetime.date(2023, 4, 1)
+    assert [fraction for _, _, fraction in prorate(start, end, policy='30/360')] == pytest.approx([16 / 30, 1.0])
+    assert [fraction for _, _, fraction in prorate(start, end, policy='actual/365')] == pytest.approx(
+        [14 * 12 / 365, 31 * 12 / 365]
+    )
+
+    # day 31 counts as day 30
+    pieces = prorate(datetime.date(2023, 1, 31), datetime.date(2023, 2, 1), policy='30/360')
+    assert pieces == [(Month(2023, 1), 1, pytest.approx(1 / 30))]
+
+    with pytest.raises(ValueError) as exc_info:
+        prorate(start, end, policy='30/365')
+    assert str(exc_info.value) == "unknown day-count convention '30/365'"
+
+
+def _expected_pieces(starts, ends, amounts, policy):
+    return [
+        (index, month.ord(), days, amount)
+        for index, (start, end, total) in enumerate(zip(starts, ends, amounts))
+        for month, days, amount in prorate(start, end, total, policy)
+    ]
+
+
+STARTS = [datetime.date(2024, 1, 16), datetime.date(2023, 12, 31), datetime.date(2024, 5, 1)]
+ENDS = [datetime.date(2024, 3, 11), datetime.date(2024, 1, 1), datetime.date(2024, 5, 1)]
+AMOUNTS = [100.0, 31.0, 5.0]
+
+
+def test_prorate_many():
+    for policy in ['actual/actual', '30/360', 'actual/365']:
+        indexes, ords, days, values = prorate_many(STARTS, ENDS, AMOUNTS, policy)
+        assert list(zip(indexes, ords, days, values)) == _expected_pieces(STARTS, ENDS, AMOUNTS, policy)
+
+
+def test_prorate_many_numpy():
+    np = pytest.importorskip('numpy')
+    for policy in ['actual/actual', '30/360', 'actual/365']:
+        expected = _expected_pieces(STARTS, ENDS, AMOUNTS, policy)
+        indexes, ords, days, values = prorate_many(
+            np.array(STARTS, dtype='datetime64[D]'),
+            np.array(ENDS, dtype='datetime64[D]'),
+            np.array(AMOUNTS),
+            policy
+        )
+        assert [tuple(piece[:3]) for piece in expected] == list(zip(indexes.tolist(), ords.tolist(), days.tolist()))
+        assert values.tolist() == pytest.approx([piece[3] for piece in expected])
+
+
+def test_prorate_many_scalar_amount():
+    starts = [datetime.date(2024, 1, 1), datetime.date(2024, 2, 1)]
+    ends = [datetime.date(2024, 2, 1), datetime.date(2024, 2, 15)]
+    assert list(prorate_many(starts, ends)[3]) == pytest.approx([1.0, 14 / 29])
+
+
+def test_prorate_many_scalar_amount_numpy():
+    np = pytest.importorskip('numpy')
+    starts = np.array(['2024-01-01', '2024-02-01'], dtype='datetime64[D]')
+    ends = np.array(['2024-02-01', '2024-02-15'], dtype='datetime64[D]')
+    assert prorate_many(starts, ends, 2.0)[3].tolist() == pytest.approx([2.0, 28 / 29])
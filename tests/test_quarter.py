@@ -0,0 +1,84 @@
+import datetime
+
+import pytest
+
+from calendarium.month import Month
+from calendarium.quarter import Quarter
+from calendarium.quarter import QuarterDelta
+
+
+def test_init_validation():
+    Quarter(1, 1)
+    Quarter(9999, 4)
+
+    for quarter in (0, 5):
+        with pytest.raises(ValueError) as exc_info:
+            Quarter(2022, quarter)
+        assert str(exc_info.value) == "quarter must be in 1..4"
+
+    with pytest.raises(ValueError) as exc_info:
+        Quarter(10_000, 1)
+    assert str(exc_info.value) == "year 10000 is out of range"
+
+
+def test_repr_str():
+    assert repr(Quarter(2022, 3)) == 'Quarter(2022, 3)'
+    assert str(Quarter(2022, 3)) == '2022-Q3'
+    assert Quarter.from_str('2022-Q3') == Quarter(2022, 3)
+
+    with pytest.raises(ValueError) as exc_info:
+        Quarter.from_str('2022-Q5')
+    assert str(exc_info.value) == "invalid quarter string '2022-Q5'"
+
+
+def test_ord():
+    assert Quarter(1970, 1).ord() == 0
+    assert Quarter(1970, 4).ord() == 3
+    assert Quarter(1971, 1).ord() == 4
+    assert Quarter(1969, 4).ord() == -1
+    for ord_ in range(-10, 10):
+        assert Quarter.from_ord(ord_).ord() == ord_
+
+
+def test_for_date():
+    assert Quarter.for_date(datetime.date(2022, 3, 31)) == Quarter(2022, 1)
+    assert Quarter.for_date(datetime.date(2022, 4, 1)) == Quarter(2022, 2)
+    assert Quarter.for_date(datetime.date(2022, 12, 31)) == Quarter(2022, 4)
+
+
+def test_months():
+    assert [Quarter.for_month(Month(2022, m)).quarter for m in range(1, 13)] == \
+           [1, 1, 1, 2, 2, 2, 3, 3, 3, 4, 4, 4]
+    assert Month(2022, 8).quarter() == Quarter(2022, 3)
+    assert Quarter(2022, 3).months() == [Month(2022, 7), Month(2022, 8), Month(2022, 9)]
+    assert Quarter(2022, 3).first_month == Month(2022, 7)
+    assert Quarter(2022, 3).last_month == Month(2022, 9)
+
+
+def test_dates():
+    assert Quarter(2022, 4).start_date == datetime.date(2022, 10, 1)
+    assert Quarter(2022, 4).end_date == datetime.date(2023, 1, 1)
+    assert Quarter(2022, 4).last_date == datetime.date(2022, 12, 31)
+    assert datetime.date(2022, 11, 11) in Quarter(2022, 4)
+    assert datetime.date(2023, 1, 1) not in Quarter(2022, 4)
+
+
+def test_days():
+    for year in (1900, 2000, 2022, 2024):
+        for q in range(1, 5):
+            quarter = Quarter(year, q)
+            assert len(quarter) == sum(len(month) for month in quarter.months())
+            assert len(list(quarter)) == len(quarter)
+
+
+def test_arithmetic():
+    assert Quarter(2022, 4) + QuarterDelta(1) == Quarter(2023, 1)
+    assert Quarter(2022, 1) - QuarterDelta(1) == Quarter(2021, 4)
+    assert Quarter(2023, 1) - Quarter(2021, 4) == QuarterDelta(5)
+    assert Quarter(2021, 4) < Quarter(2022, 1)
+
+
+def test_delta():
+    assert QuarterDelta(5).quarters == 5
+    assert str(QuarterDelta(5)) == 'P1Y3M'
+    assert str(QuarterDelta(-1)) == '-P3M'
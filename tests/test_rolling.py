@@ -0,0 +1,92 @@
+import pytest
+
+from calendarium.month import Month
+from calendarium.month import MonthDelta
+from calendarium.rolling import rolling
+from calendarium.rolling import RollingWindow
+
+
+def _naive(series: dict[Month, float], size: int, reducer):
+    months = Month(2020, 1).range_to(Month(2021, 7))
+    for month in months:
+        values = [series[m] for m in month.range_to(month - MonthDelta(size), -1) if m in series]
+        yield month, reducer(values)
+
+
+def test_rolling_like_naive():
+    series = {month: float((month.ord() * 7) % 11) for month in Month(2020, 1).range_to(Month(2021, 7))}
+    del series[Month(2020, 5)], series[Month(2020, 6)], series[Month(2021, 1)]
+    items = sorted(series.items())
+
+    naive = {
+        'sum': sum,
+        'count': len,
+        'mean': lambda values: sum(values) / len(values) if values else None,
+        'min': lambda values: min(values, default=None),
+        'max': lambda values: max(values, default=None),
+    }
+    for size in [1, 2, 3, 12]:
+        for reducer, func in naive.items():
+            assert list(rolling(items, MonthDelta(size), reducer)) == list(_naive(series, size, func))
+
+
+def test_rolling_gaps():
+    items = [(Month(2022, 1), 1), (Month(2022, 4), 2)]
+    assert list(rolling(items, 2)) == [
+        (Month(2022, 1), 1),
+        (Month(2022, 2), 1),
+        (Month(2022, 3), 0),
+        (Month(2022, 4), 2),
+    ]
+    assert list(rolling(items, 2, 'mean')) == [
+        (Month(2022, 1), 1.0),
+        (Month(2022, 2), 1.0),
+        (Month(2022, 3), None),
+        (Month(2022, 4), 2.0),
+    ]
+    assert list(rolling(items, 2, 'count', fill_value=0)) == [
+        (Month(2022, 1), 1),
+        (Month(2022, 2), 2),
+        (Month(2022, 3), 2),
+        (Month(2022, 4), 2),
+    ]
+
+
+def test_rolling_streaming():
+    def feed():
+        month = Month(2000, 1)
+        while True:
+            yield month, 1
+            month += MonthDelta(1)
+
+    stream = rolling(feed(), MonthDelta(years=1))
+    results = [next(stream)[1] for _ in range(24)]
+    assert results == list(range(1, 13)) + [12] * 12
+
+
+def test_window():
+    window = RollingWindow(MonthDelta(3), 'max')
+    assert repr(window) == "RollingWindow(3, 'max')"
+    assert window.month is None
+    assert window.result() is None
+
+    window.push(Month(2022, 1), 5)
+    window.push(Month(2022, 2), 3)
+    assert window.result() == 5
+    window.push(Month(2022, 4), 1)
+    assert window.result() == 3
+    assert window.month == Month(2022, 4)
+
+    with pytest.raises(ValueError) as exc_info:
+        window.push(Month(2022, 4), 1)
+    assert str(exc_info.value) == "months must be ascending"
+
+
+def test_window_validation():
+    with pytest.raises(ValueError) as exc_info:
+        RollingWindow(MonthDelta(0))
+    assert str(exc_info.value) == "size must be positive"
+
+    with pytest.raises(ValueError) as exc_info:
+        RollingWindow(3, 'median')
+    assert str(exc_info.value) == "unknown reducer 'median'"
@@ -0,0 +1,110 @@
+import datetime
+
+import pytest
+
+from calendarium.week import Week
+from calendarium.week import WeekDelta
+
+
+def test_init_validation():
+    Week(2020, 53)
+    Week(2022, 52)
+
+    with pytest.raises(ValueError) as exc_info:
+        Week(2022, 53)
+    assert str(exc_info.value) == "week must be in 1..52"
+
+    with pytest.raises(ValueError) as exc_info:
+        Week(2020, 54)
+    assert str(exc_info.value) == "week must be in 1..53"
+
+    with pytest.raises(ValueError) as exc_info:
+        Week(0, 1)
+    assert str(exc_info.value) == "year 0 is out of range"
+
+
+def test_repr_str():
+    assert repr(Week(2022, 9)) == 'Week(2022, 9)'
+    assert str(Week(2022, 9)) == '2022-W09'
+    assert Week.from_str('2022-W09') == Week(2022, 9)
+
+    with pytest.raises(ValueError) as exc_info:
+        Week.from_str('2022-9')
+    assert str(exc_info.value) == "invalid week string '2022-9'"
+
+
+def test_for_date():
+    # ISO week-numbering year differs from calendar year around new year
+    assert Week.for_date(datetime.date(2021, 1, 3)) == Week(2020, 53)
+    assert Week.for_date(datetime.date(2021, 1, 4)) == Week(2021, 1)
+    assert Week.for_date(datetime.date(2019, 12, 30)) == Week(2020, 1)
+
+
+def test_ord():
+    assert Week(1970, 1).ord() == 0
+    assert Week(1970, 2).ord() == 1
+    assert Week(1969, 52).ord() == -1
+    for ord_ in range(-200, 200, 7):
+        assert Week.from_ord(ord_).ord() == ord_
+    assert Week.from_ord(Week(2020, 53).ord() + 1) == Week(2021, 1)
+
+
+def test_immutable():
+    week = Week(2022, 9)
+    with pytest.raises(AttributeError):
+        week.week = 5
+    with pytest.raises(AttributeError):
+        week.year = 2023
+    assert week == Week(2022, 9)
+    assert week.ord() == Week(2022, 9).ord()
+
+
+def test_ord_like_isocalendar():
+    for year in [1, 2, 399, 400, 1582, 1900, 2000, 2004, 2020, 2021, 9998, 9999]:
+        for week in [1, 2, 52]:
+            start_date = datetime.date.fromisocalendar(year, week, 1)
+            assert Week(year, week).start_date == start_date
+            ord_ = (start_date - Week.EPOCH_DATE).days // 7
+            assert Week(year, week).ord() == ord_
+            from_ord = Week.from_ord(ord_)
+            assert (from_ord.year, from_ord.week) == (year, week)
+
+    assert hash(Week(2022, 9)) == hash(Week.from_ord(Week(2022, 9).ord()))
+
+    with pytest.raises(ValueError):
+        Week.from_ord(Week(9999, 52).ord() + 1)
+    with pytest.raises(ValueError):
+        Week.from_ord(Week(1, 1).ord() - 1)
+
+
+def test_dates():
+    week = Week(2022, 1)
+    assert week.start_date == datetime.date(2022, 1, 3)
+    assert week.end_date == datetime.date(2022, 1, 10)
+    assert week.last_date == datetime.date(2022, 1, 9)
+    assert len(week) == 7
+    assert list(week) == [datetime.date(2022, 1, d) for d in range(3, 10)]
+    assert datetime.date(2022, 1, 9) in week
+    assert datetime.date(2022, 1, 10) not in week
+
+
+def test_last_week():
+    # cut short by the max date
+    week = Week(9999, 52)
+    assert len(week) == 5
+    assert list(week) == [datetime.date(9999, 12, d) for d in range(27, 32)]
+    assert week.last_date == datetime.date(9999, 12, 31)
+    assert datetime.date(9999, 12, 31) in week
+
+
+def test_arithmetic():
+    assert Week(2020, 53) + WeekDelta(1) == Week(2021, 1)
+    assert Week(2021, 1) - WeekDelta(1) == Week(2020, 53)
+    assert Week(2021, 2) - Week(2020, 52) == WeekDelta(3)
+    assert Week(2020, 52) < Week(2020, 53) < Week(2021, 1)
+
+
+def test_delta():
+    assert WeekDelta(2).weeks == 2
+    assert str(WeekDelta(2)) == 'P2W'
+    assert str(WeekDelta(-2)) == '-P2W'
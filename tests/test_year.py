@@ -0,0 +1,119 @@
+import datetime
+
+from freezegun import freeze_time
+import pytest
+
+from calendarium.month import Month
+from calendarium.quarter import Quarter
+from calendarium.year import Year
+from calendarium.year import YearDelta
+
+
+def test_init_validation():
+    Year(1)
+    Year(9999)
+
+    for year in (-1, 0, 10_000):
+        with pytest.raises(ValueError) as exc_info:
+            Year(year)
+        assert str(exc_info.value) == f"year {year} is out of range"
+
+
+def test_repr_str():
+    assert repr(Year(2022)) == 'Year(2022)'
+    assert str(Year(2022)) == '2022'
+    assert str(Year(800)) == '0800'
+
+
+def test_from_str():
+    assert Year.from_str('2022') == Year(2022)
+
+    with pytest.raises(ValueError) as exc_info:
+        Year.from_str('22')
+    assert str(exc_info.value) == "invalid year string '22'"
+
+
+def test_ord():
+    assert Year(1970).ord() == 0
+    assert Year(2022).ord() == 52
+    assert Year(1969).ord() == -1
+    assert Year.from_ord(52) == Year(2022)
+    assert Year.from_ord(-1) == Year(1969)
+
+
+def test_for_date():
+    assert Year.for_date(datetime.date(2022, 12, 31)) == Year(2022)
+    assert Year.for_month(Month(2022, 1)) == Year(2022)
+
+    with freeze_time("2039-01-01"):
+        assert Year.today() == Year(2039)
+
+
+def test_dates():
+    assert Year(2022).start_date == datetime.date(2022, 1, 1)
+    assert Year(2022).end_date == datetime.date(2023, 1, 1)
+    assert Year(2022).last_date == datetime.date(2022, 12, 31)
+    assert Year(9999).end_date == datetime.date(9999, 12, 31)
+
+
+def test_days():
+    assert Year(2022).days() == 365
+    assert len(Year(2024)) == 366
+    assert len(Year(1900)) == 365
+    assert len(Year(2000)) == 366
+    assert len(list(Year(2024))) == 366
+
+
+def test_contains():
+    assert datetime.date(2022, 1, 1) in Year(2022)
+    assert datetime.date(2022, 12, 31) in Year(2022)
+    assert datetime.date(2023, 1, 1) not in Year(2022)
+
+
+def test_comparison():
+    assert Year(2022) == Year(2022)
+    assert Year(2022) != Year(2023)
+    assert Year(2022) < Year(2023)
+    assert Year(2023) >= Year(2023)
+    assert hash(Year(2022)) == hash(Year(2022))
+    assert Year(2022) != 2022
+
+    with pytest.raises(TypeError):
+        _ = Year(2022) < 2023
+
+
+def test_conversions():
+    assert Year(2022).months() == [Month(2022, m) for m in range(1, 13)]
+    assert Year(2022).quarters() == [Quarter(2022, q) for q in range(1, 5)]
+
+
+def test_arithmetic():
+    assert Year(2022) + YearDelta(3) == Year(2025)
+    assert YearDelta(-3) + Year(2022) == Year(2019)
+    assert Year(2022) - YearDelta(3) == Year(2019)
+    assert Year(2022) - Year(2019) == YearDelta(3)
+
+    with pytest.raises(TypeError):
+        _ = Year(2022) + 1
+
+
+def test_delta():
+    assert YearDelta(3).years == 3
+    assert repr(YearDelta(3)) == 'YearDelta(3)'
+    assert str(YearDelta(3)) == 'P3Y'
+    assert str(YearDelta(-3)) == '-P3Y'
+    assert YearDelta(1) + YearDelta(2) == YearDelta(3)
+    assert YearDelta(1) - YearDelta(2) == YearDelta(-1)
+    assert YearDelta(2) * 3 == 3 * YearDelta(2) == YearDelta(6)
+    assert YearDelta(7) // 2 == YearDelta(3)
+    assert -YearDelta(2) == YearDelta(-2)
+    assert abs(YearDelta(-2)) == YearDelta(2)
+    assert not YearDelta(0)
+    assert YearDelta(1) < YearDelta(2)
+    assert {YearDelta(1): 'a'}[YearDelta(1)] == 'a'
+
+
+def test_month_weeks():
+    grids = Year(2022).month_weeks(6)
+    assert len(grids) == 12
+    assert grids[8] == Month(2022, 9).weeks(6)